@@ -0,0 +1,127 @@
+"""
+BITSET VISITED SET
+==================
+Graph search keeps a visited set. A Python set of ints costs ~60+ bytes per
+entry (hash table slot + int object), so visiting 10^8 nodes needs several
+GB. When the nodes are the integers 0 .. n-1, one bit per node is enough:
+10^8 nodes = 12.5 MB.
+
+BitSet has the same interface the searches use ('in', add(), len()), so it
+drops into case_06_graph_search_proper / variant_10 through their 'visited'
+parameter, or into dfs_traversal.preorder(visited=...).
+
+graph_search() below is case_06 for integer graphs: the stack is an
+array('q') of ints and only unvisited children are pushed, so together with
+the bitset a 10^8-node implicit graph stays within a few hundred MB.
+Run `python bitset.py [nodes]` for the benchmark.
+"""
+import sys
+import time
+import tracemalloc
+from array import array
+
+
+class BitSet:
+    """Set of the integers 0 .. size-1, one bit each."""
+    def __init__(self, size):
+        self.size = size
+        self.bits = bytearray((size + 7) >> 3)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, n):
+        return self.bits[n >> 3] >> (n & 7) & 1 == 1
+
+    def add(self, n):
+        mask = 1 << (n & 7)
+        if not self.bits[n >> 3] & mask:
+            self.bits[n >> 3] |= mask
+            self.count += 1
+
+    def discard(self, n):
+        mask = 1 << (n & 7)
+        if self.bits[n >> 3] & mask:
+            self.bits[n >> 3] &= ~mask
+            self.count -= 1
+
+    def clear(self):
+        self.bits = bytearray(len(self.bits))
+        self.count = 0
+
+
+class ImplicitGraph:
+    """
+    Integer graph generated on the fly: node i -> [(i*i + 1) mod n, (i + 1) mod n],
+    every node reachable from 0. No adjacency is stored, so memory is only
+    what the search itself uses.
+    """
+    def __init__(self, num_nodes):
+        self.num_nodes = num_nodes
+        self.initial = 0
+
+    def is_goal(self, node): return False
+    def expand(self, node):
+        return [(node * node + 1) % self.num_nodes, (node + 1) % self.num_nodes]
+
+
+def graph_search(problem, visited=None):
+    """
+    case_06_graph_search_proper for integer nodes: mark on pop, skip
+    visited children, int array stack. Returns the goal, or None after
+    visiting everything reachable ('visited' then holds all of it).
+    """
+    visited = BitSet(problem.num_nodes) if visited is None else visited
+    stack = array('q', [problem.initial])
+    while stack:
+        node = stack.pop()
+        if node in visited: continue
+        visited.add(node)
+        if problem.is_goal(node): return node
+        for child in reversed(problem.expand(node)):
+            if child not in visited:
+                stack.append(child)
+    return None
+
+
+def benchmark(num_nodes):
+    g = ImplicitGraph(num_nodes)
+    kinds = [("BitSet", lambda: BitSet(num_nodes))]
+    # A set of 10^8 ints does not fit in memory here
+    if num_nodes <= 10 ** 7:
+        kinds.insert(0, ("set", lambda: set()))
+    print(f"{'visited':<10}{'nodes':>12}{'reached':>12}{'seconds':>10}{'peak MB':>10}")
+    for label, make in kinds:
+        start = time.perf_counter()
+        visited = make()
+        graph_search(g, visited)
+        seconds = time.perf_counter() - start
+        tracemalloc.start()
+        graph_search(g, make())
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label:<10}{num_nodes:>12}{len(visited):>12}{seconds:>10.2f}{peak / 2 ** 20:>10.1f}")
+
+
+if __name__ == "__main__":
+    import resource # Unix only: not imported with the module, so it loads on Windows
+    import dfs_stack_order_variants as variants
+    import dls_variants_study_guide as guide
+
+    # Same visited nodes as a set on a small graph, through the study functions
+    g = ImplicitGraph(1000)
+    visited_set, visited_bits = set(), BitSet(1000)
+    guide.case_06_graph_search_proper(g, visited_set)
+    guide.case_06_graph_search_proper(g, visited_bits)
+    assert len(visited_set) == len(visited_bits) == len(guide.case_27_memory_efficient_visited(g))
+    assert all(n in visited_bits for n in visited_set)
+    visited_bits = BitSet(1000)
+    graph_search(g, visited_bits)
+    assert len(visited_bits) == len(visited_set)
+    print("variant_10 with a BitSet: ", end='')
+    variants.variant_10_visited_position_error(ImplicitGraph(8), BitSet(8))
+    print("\n")
+
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6)
+    print(f"max RSS of the whole run: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB")
@@ -0,0 +1,193 @@
+"""
+COMPACT SEARCH NODES
+====================
+dls_correction.py creates one Node object for every child of every expansion.
+Each of those objects carries its own attribute dict, so a frontier with a
+million nodes costs well over a hundred bytes per node before the states themselves.
+
+Two smaller representations of the same node (state, depth, parent):
+
+1.  SlotNode - a class with __slots__: no per-instance dict.
+    It has the same 'state' / 'depth_val' fields as dls_correction.Node,
+    so depth_limited_search_corrected() runs on it unchanged.
+
+2.  NodePool - no node objects at all. A node is an integer id into three
+    flat arrays (states, depths, parents), ~16 bytes per node.
+    depth_limited_search_pool() below also recycles the ids: see the comment
+    inside it.
+
+GeneratedProblem is an implicit tree with integer states (state s has the
+children s*b + 1 ... s*b + b), big enough to show the difference.
+Run `python compact_nodes.py` for the memory benchmark.
+"""
+import time
+import tracemalloc
+from array import array
+
+from dls_correction import Node, depth_limited_search_corrected
+
+NO_PARENT = -1
+
+
+class SlotNode:
+    __slots__ = ("state", "depth_val", "parent")
+
+    def __init__(self, state, depth_val=0, parent=None):
+        self.state = state
+        self.depth_val = depth_val
+        self.parent = parent
+
+    def __repr__(self):
+        return str(self.state)
+
+
+class NodePool:
+    """
+    Every node of a search in flat arrays; a node is its index (id).
+    States must fit the array typecode ('q' = 64-bit int); typecode=None
+    keeps them in a list, for states that are not numbers.
+    """
+    def __init__(self, typecode='q'):
+        self.states = array(typecode) if typecode else []
+        self.depths = array('i')
+        self.parents = array('i')
+
+    def __len__(self):
+        return len(self.states)
+
+    def add(self, state, depth=0, parent=NO_PARENT):
+        """Adds a node and returns its id."""
+        self.states.append(state)
+        self.depths.append(depth)
+        self.parents.append(parent)
+        return len(self.states) - 1
+
+    def truncate(self, size):
+        """Forgets every node with id >= size (their ids get reused)."""
+        del self.states[size:]
+        del self.depths[size:]
+        del self.parents[size:]
+
+    def path(self, node):
+        """States from the root to 'node'."""
+        path = []
+        while node != NO_PARENT:
+            path.append(self.states[node])
+            node = self.parents[node]
+        return path[::-1]
+
+
+class GeneratedProblem:
+    """
+    Complete tree with 'branching' children per node, 'height' levels below
+    the root (0). make_node(state, depth, parent) builds the node objects
+    for expand(); the pool search uses successors() on plain states.
+    """
+    def __init__(self, branching=2, height=20, goal=None, make_node=SlotNode):
+        self.branching = branching
+        self.height = height
+        self.goal = goal
+        self.make_node = make_node
+        self.initial = make_node(0, 0, None)
+        self.initial_state = 0
+        # First state of the lowest level: states below it have children
+        self.first_leaf = sum(branching ** level for level in range(height))
+
+    def is_goal(self, node):
+        return node.state == self.goal
+
+    def is_goal_state(self, state):
+        return state == self.goal
+
+    def successors(self, state):
+        if state >= self.first_leaf:
+            return range(0)
+        first = state * self.branching + 1
+        return range(first, first + self.branching)
+
+    def expand(self, node):
+        depth = node.depth_val + 1
+        return [self.make_node(s, depth, node) for s in self.successors(node.state)]
+
+
+def depth_limited_search_pool(problem, limit, pool=None):
+    """
+    depth_limited_search_corrected() on a NodePool: the frontier is an
+    array of node ids. Returns the goal's id in 'pool' (pool.path(id) gives
+    the path), 'cutoff' or 'failure'.
+    """
+    pool = NodePool() if pool is None else pool
+    frontier = array('i', [pool.add(problem.initial_state)])
+    result = 'failure'
+
+    while frontier:
+        node = frontier.pop()
+        # Ids on the stack only grow from bottom to top, and ids are handed
+        # out in order, so every node created after 'node' belongs to a
+        # subtree that is already finished: drop them and reuse their ids.
+        # What stays is the frontier plus its ancestors.
+        pool.truncate(node + 1)
+        state = pool.states[node]
+
+        if problem.is_goal_state(state):
+            return node
+
+        depth = pool.depths[node]
+        if depth > limit:
+            result = 'cutoff'
+        else:
+            # Reversed push: the left child ends up on top (see dls_correction.py)
+            for child in reversed(problem.successors(state)):
+                frontier.append(pool.add(child, depth + 1, node))
+
+    return result
+
+
+# ==========================================
+# MEMORY BENCHMARK
+# ==========================================
+
+def dict_node(state, depth, parent):
+    # dls_correction.Node as it is (no parent link)
+    return Node(state, depth)
+
+
+def peak_memory(search):
+    """Returns the peak traced bytes of search()."""
+    tracemalloc.start()
+    search()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def benchmark():
+    # Memory: one root with a million children, all on the frontier at once
+    # Time:   full search (no goal) of a complete binary tree, 2^20 - 1 nodes
+    wide = 10 ** 6
+    print(f"{'node':<12}{'peak MB (10^6 frontier)':>26}{'bytes/node':>12}{'seconds (2^20 nodes)':>24}")
+    searches = [
+        ("Node", depth_limited_search_corrected, dict_node),
+        ("SlotNode", depth_limited_search_corrected, SlotNode),
+        ("NodePool", depth_limited_search_pool, SlotNode),
+    ]
+    for label, search, make_node in searches:
+        p = GeneratedProblem(wide, 1, make_node=make_node)
+        peak = peak_memory(lambda: search(p, 1))
+        p = GeneratedProblem(2, 19, make_node=make_node)
+        start = time.perf_counter()
+        search(p, 19)
+        seconds = time.perf_counter() - start
+        print(f"{label:<12}{peak / 2 ** 20:>26.1f}{peak / wide:>12.0f}{seconds:>24.2f}")
+
+
+if __name__ == "__main__":
+    # Same answer from all three representations
+    p = GeneratedProblem(branching=3, height=6, goal=500)
+    pool = NodePool()
+    goal = depth_limited_search_pool(p, 6, pool)
+    print("Node:    ", depth_limited_search_corrected(GeneratedProblem(3, 6, 500, dict_node), 6).state)
+    print("SlotNode:", depth_limited_search_corrected(p, 6))
+    print("NodePool:", pool.states[goal], "path", pool.path(goal))
+    print()
+    benchmark()
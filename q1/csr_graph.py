@@ -0,0 +1,237 @@
+"""
+CSR GRAPH BACKEND
+=================
+The Problem classes in this folder keep the graph as a dict of Python lists
+of names ({'S': ['A', 'B'], ...}). That is fine for 6 nodes, but every
+name is a string object and every list a separate allocation, so a graph
+with millions of edges takes gigabytes.
+
+CSRGraph stores the same graph in "compressed sparse row" form:
+    names    - id -> name (every name gets an integer id, in first-seen order)
+    offsets  - array('i'), len = nodes + 1
+    targets  - array('i'), all neighbor ids back to back
+
+The neighbors of node i are targets[offsets[i]:offsets[i + 1]], in the
+same order as the original list, so Left-to-Right traversal is unchanged.
+That is 4 bytes per edge and 4 per node.
+
+    graph = CSRGraph.from_dict({'S': ['A', 'B'], 'A': ['C', 'D'], 'B': ['E', 'F']})
+    depth_limited_search(graph, graph.id('S'), graph.id('F'), 2)   # -> id of 'F'
+
+The searches below work on ids only (and are iterative, so deep graphs do
+not hit the recursion limit). CSRProblem wraps a CSRGraph in the usual
+initial / is_goal / expand interface for the study functions.
+Run `python csr_graph.py` for the benchmark against the dict version.
+"""
+import random
+import time
+import tracemalloc
+from array import array
+
+from dls_correction import Node, ToyProblem, depth_limited_search_corrected
+
+
+class CSRGraph:
+    def __init__(self, names, offsets, targets):
+        self.names = names
+        self.offsets = offsets
+        self.targets = targets
+        self.ids = {name: i for i, name in enumerate(names)}
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def num_edges(self):
+        return len(self.targets)
+
+    @classmethod
+    def from_dict(cls, graph):
+        """
+        Compiles a dict of neighbor lists. Keys get the first ids (in dict
+        order), names that only appear as neighbors come after them.
+        """
+        ids = {name: i for i, name in enumerate(graph)}
+        names = list(graph)
+        offsets = array('i', [0])
+        targets = array('i')
+        for name in graph:
+            for neighbor in graph[name]:
+                if neighbor not in ids:
+                    ids[neighbor] = len(names)
+                    names.append(neighbor)
+                targets.append(ids[neighbor])
+            offsets.append(len(targets))
+        # Nodes without a key have no edges
+        offsets.extend([len(targets)] * (len(names) - len(graph)))
+        return cls(names, offsets, targets)
+
+    @classmethod
+    def from_edges(cls, num_nodes, edges, names=None):
+        """
+        Builds the graph from (u, v) id pairs. Neighbors keep the order of
+        'edges'. Names default to the ids themselves.
+        """
+        edges = list(edges)
+        offsets = array('i', [0] * (num_nodes + 1))
+        for u, _ in edges:
+            offsets[u + 1] += 1
+        for i in range(num_nodes):
+            offsets[i + 1] += offsets[i]
+        targets = array('i', [0] * len(edges))
+        fill = array('i', offsets[:-1])
+        for u, v in edges:
+            targets[fill[u]] = v
+            fill[u] += 1
+        return cls(list(range(num_nodes)) if names is None else names, offsets, targets)
+
+    def id(self, name):
+        return self.ids[name]
+
+    def name(self, node):
+        return self.names[node]
+
+    def neighbors(self, node):
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def to_dict(self):
+        return {self.names[i]: [self.names[j] for j in self.neighbors(i)] for i in range(len(self))}
+
+    def to_numpy(self):
+        """(offsets, targets) as NumPy arrays sharing this graph's memory (needs NumPy)."""
+        import numpy as np
+        return np.frombuffer(self.offsets, dtype=np.intc), np.frombuffer(self.targets, dtype=np.intc)
+
+
+class CSRProblem:
+    """
+    Problem interface on a CSRGraph: states are ids, expand() returns the
+    neighbor ids. Works with the study functions that only use
+    problem.initial / is_goal / expand.
+    """
+    def __init__(self, graph, initial, goal=None):
+        self.graph = graph if isinstance(graph, CSRGraph) else CSRGraph.from_dict(graph)
+        self.initial = self.graph.id(initial)
+        self.goal = None if goal is None else self.graph.id(goal)
+
+    def is_goal(self, node): return node == self.goal
+    def expand(self, node): return self.graph.neighbors(node)
+
+
+# ==========================================
+# SEARCHES ON IDS
+# ==========================================
+
+def depth_limited_search(graph, start, goal, limit):
+    """
+    depth_limited_search_corrected() (dls_correction.py) on ids: goal test
+    on pop, 'cutoff' below the limit, left child first.
+    The frontier is two int arrays (node ids and their depths).
+    Returns the goal id, 'cutoff' or 'failure'.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    nodes = array('i', [start])
+    depths = array('i', [0])
+    result = 'failure'
+
+    while nodes:
+        node = nodes.pop()
+        depth = depths.pop()
+
+        if node == goal:
+            return node
+
+        if depth > limit:
+            result = 'cutoff'
+        else:
+            # Reversed push: the first neighbor ends up on top
+            for i in range(offsets[node + 1] - 1, offsets[node] - 1, -1):
+                nodes.append(targets[i])
+                depths.append(depth + 1)
+
+    return result
+
+
+def depth_first_search(graph, start, goal=None):
+    """
+    Graph-search DFS (case_06_graph_search_proper) on ids, left child first.
+    Visited is one byte per node. Returns the goal id, or 'failure' after
+    visiting everything reachable.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(len(graph))
+    stack = array('i', [start])
+
+    while stack:
+        node = stack.pop()
+        if visited[node]: continue
+        visited[node] = 1
+        if node == goal:
+            return node
+        for i in range(offsets[node + 1] - 1, offsets[node] - 1, -1):
+            if not visited[targets[i]]:
+                stack.append(targets[i])
+
+    return 'failure'
+
+
+# ==========================================
+# BENCHMARK
+# ==========================================
+
+class DictProblem(ToyProblem):
+    """ToyProblem on any dict graph: the dict backend for the benchmark."""
+    def __init__(self, graph, initial, goal=None):
+        self.graph = graph
+        self.initial = Node(initial)
+        self.goal = goal
+
+    def is_goal(self, node):
+        return node.state == self.goal
+
+
+def random_edges(num_nodes, degree, seed=0):
+    rng = random.Random(seed)
+    return [(u, rng.randrange(num_nodes)) for u in range(num_nodes) for _ in range(degree)]
+
+
+def benchmark(num_nodes=10 ** 6, degree=3, limit=11):
+    edges = random_edges(num_nodes, degree)
+
+    tracemalloc.start()
+    graph_dict = {}
+    for u, v in edges:
+        graph_dict.setdefault(f"n{u}", []).append(f"n{v}")
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    graph = CSRGraph.from_dict(graph_dict)
+    compile_seconds = time.perf_counter() - start
+    csr_bytes = graph.offsets.itemsize * len(graph.offsets) + graph.targets.itemsize * len(graph.targets)
+
+    print(f"{num_nodes} nodes, {graph.num_edges()} edges")
+    print(f"dict of lists: {dict_bytes / 2 ** 20:8.1f} MB")
+    print(f"CSR arrays:    {csr_bytes / 2 ** 20:8.1f} MB (+ names), compiled in {compile_seconds:.2f} s")
+
+    # Tree-search DLS from the first node, no goal: explores ~degree^limit nodes
+    start = time.perf_counter()
+    depth_limited_search_corrected(DictProblem(graph_dict, "n0"), limit)
+    dict_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    depth_limited_search(graph, graph.id("n0"), None, limit)
+    csr_seconds = time.perf_counter() - start
+    print(f"DLS limit {limit}: dict {dict_seconds:.2f} s, CSR {csr_seconds:.2f} s")
+
+    start = time.perf_counter()
+    depth_first_search(graph, 0)
+    print(f"Full graph-search DFS on CSR: {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    p = CSRProblem({'S': ['A', 'B'], 'A': ['C', 'D'], 'B': ['E', 'F']}, 'S', 'F')
+    g = p.graph
+    print("ids:", g.ids)
+    print("DLS limit 1 ->", g.name(depth_limited_search(g, p.initial, p.goal, 1)))
+    print("DLS limit 0 ->", depth_limited_search(g, p.initial, p.goal, 0))
+    print()
+    benchmark()
@@ -11,6 +11,7 @@ Expected Traversal for 'Right-to-Left' (Standard Stack):
     So we must push B, then push A. (Reverse order).
 
 """
+from collections import deque
 
 class Problem:
     def __init__(self):
@@ -91,10 +92,12 @@ def variant_5_queue_pop_start(problem):
     """
     BUG: Using pop(0) makes it a Queue (BFS).
     "Node position" error becomes "Algorithm Type" error.
+    On a list, pop(0) also shifts every other element (O(n) per pop), so
+    the queue here is a deque: popleft() is the same operation in O(1).
     """
-    stack = [problem.initial]
+    stack = deque([problem.initial])
     while stack:
-        node = stack.pop(0) # BFS!!
+        node = stack.popleft() # BFS!! (list version: stack.pop(0))
         print(node, end=' ')
         for child in problem.expand(node):
             stack.append(child)
@@ -107,13 +110,14 @@ def variant_6_insert_start(problem):
     BUG: Inserting at 0 but popping at end?
     Insert 0 [A, S] -> [B, A, S]? No, complex behavior.
     Usually results in BFS logic if popping from end, or extremely slow array shifts.
+    (list.insert(0, x) shifts the whole list; deque.appendleft(x) is O(1).)
     """
-    stack = [problem.initial]
+    stack = deque([problem.initial])
     while stack:
         node = stack.pop()
         print(node, end=' ')
         for child in problem.expand(node):
-            stack.insert(0, child) # Bad performance, effectively a queue logic relative to pop()
+            stack.appendleft(child) # Effectively a queue logic relative to pop() (list version: insert(0, child))
 
 # ------------------------------------------------------------------
 # VARIANT 7: Slice Assignment (Correct Logic, Weird Syntax)
@@ -160,13 +164,14 @@ def variant_9_recursive_reverse_bug(node, problem):
 # ------------------------------------------------------------------
 # VARIANT 10: Stack with "Visited" Check Bug (Marking too late)
 # ------------------------------------------------------------------
-def variant_10_visited_position_error(problem):
+def variant_10_visited_position_error(problem, visited=None):
     """
     BUG: Marking visited *after* expansion or allowing duplicates in stack.
     Result: Nodes added to stack multiple times, processed multiple times.
+    'visited' can be any set-like object (e.g. bitset.BitSet for integer nodes).
     """
     stack = [problem.initial]
-    visited = set()
+    if visited is None: visited = set()
     while stack:
         node = stack.pop()
         if node in visited: continue
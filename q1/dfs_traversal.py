@@ -0,0 +1,154 @@
+"""
+GENERATOR-BASED DFS TRAVERSAL
+=============================
+The variants in dfs_stack_order_variants.py print every node, and the ones
+in dls_variants_study_guide.py return only the goal. Here the traversal is
+a generator instead: it yields one Visit(node, depth, parent, cutoff) at a
+time, and nothing is expanded until the caller asks for the next one.
+So the caller can:
+    - stop early (break, next(), itertools.islice / takewhile)
+    - filter and transform on the fly (itertools, generator expressions)
+    - walk graphs whose visit order would not fit in a list
+
+    for visit in preorder(problem):
+        print(visit.node, end=' ')          # = variant_3_correct_reverse_loop
+
+    goal = find(depth_limited(problem, 3), problem.is_goal)   # = case_11 / DLS
+
+All traversals use an explicit stack (no recursion limit) and only need
+problem.initial and problem.expand(node). Pass visited=set() (or any object
+with 'in' and add()) to turn a tree search into a graph search.
+"""
+from collections import namedtuple
+
+from frontier import Stack
+
+# cutoff=True: the node is at the depth limit and was not expanded
+Visit = namedtuple("Visit", ["node", "depth", "parent", "cutoff"], defaults=[False])
+
+
+def preorder(problem, start=None, visited=None, right_to_left=False, frontier=None):
+    """
+    Yields a Visit for every node before its children, Left-to-Right
+    (right_to_left=True: the 'naive append' order of variant_1).
+    With 'visited', nodes are marked on pop like case_06_graph_search_proper.
+    'frontier' (frontier.py) defaults to a Stack; a Queue gives BFS order
+    and a PriorityQueue best-first order instead.
+    """
+    root = problem.initial if start is None else start
+    frontier = Stack() if frontier is None else frontier
+    frontier.push(Visit(root, 0, None))
+    while frontier:
+        visit = frontier.pop()
+        if visited is not None:
+            if visit.node in visited: continue
+            visited.add(visit.node)
+        yield visit
+
+        children = problem.expand(visit.node)
+        if right_to_left:
+            children = reversed(children)
+        # extend() takes the children in visiting order (a Stack pushes them reversed)
+        frontier.extend([Visit(child, visit.depth + 1, visit.node) for child in children
+                         if visited is None or child not in visited])
+
+
+def postorder(problem, start=None, visited=None):
+    """
+    Yields a Visit for every node after all its children (case_10),
+    Left-to-Right. Each stack entry keeps an iterator over the node's
+    children, so a node is expanded once, when it is first reached.
+    With 'visited', nodes are marked when reached (like case_10).
+    """
+    root = problem.initial if start is None else start
+    if visited is not None:
+        visited.add(root)
+    stack = [(Visit(root, 0, None), iter(problem.expand(root)))]
+    while stack:
+        visit, children = stack[-1]
+        for child in children:
+            if visited is None or child not in visited:
+                if visited is not None:
+                    visited.add(child)
+                stack.append((Visit(child, visit.depth + 1, visit.node), iter(problem.expand(child))))
+                break
+        else:
+            # No children left: the node is finished
+            stack.pop()
+            yield visit
+
+
+def depth_limited(problem, limit, start=None):
+    """
+    Pre-order tree search down to depth 'limit' (case_11_dls_recursive).
+    Nodes at the limit are yielded with cutoff=True and not expanded.
+    The generator returns 'cutoff' if that happened, else 'failure'
+    (the value of StopIteration, see find()).
+    """
+    root = problem.initial if start is None else start
+    stack = [Visit(root, 0, None)]
+    cutoff_occurred = False
+    while stack:
+        visit = stack.pop()
+        if visit.depth >= limit:
+            cutoff_occurred = True
+            yield visit._replace(cutoff=True)
+            continue
+        yield visit
+        for child in reversed(problem.expand(visit.node)):
+            stack.append(Visit(child, visit.depth + 1, visit.node))
+    return 'cutoff' if cutoff_occurred else 'failure'
+
+
+def find(visits, is_goal):
+    """
+    Returns the first Visit whose node passes is_goal(node), and stops the
+    traversal there. Otherwise returns what the traversal returned
+    ('cutoff' / 'failure' for depth_limited(), None for the others).
+    """
+    while True:
+        try:
+            visit = next(visits)
+        except StopIteration as stop:
+            return stop.value
+        if is_goal(visit.node):
+            visits.close()
+            return visit
+
+
+if __name__ == "__main__":
+    import itertools
+    from contextlib import redirect_stdout
+    from io import StringIO
+
+    import dfs_stack_order_variants as variants
+    import dls_variants_study_guide as guide
+
+    def printed(function, *args):
+        out = StringIO()
+        with redirect_stdout(out):
+            function(*args)
+        return out.getvalue().split()
+
+    # The print-based variants, re-expressed on top of the generators
+    p = variants.Problem()
+    nodes = lambda visits: [v.node for v in visits]
+    assert printed(variants.variant_1_naive_append, p) == nodes(preorder(p, right_to_left=True))
+    assert printed(variants.variant_3_correct_reverse_loop, p) == nodes(preorder(p))
+    assert printed(variants.variant_8_recursive_natural, p.initial, p) == nodes(preorder(p))
+    assert printed(variants.variant_10_visited_position_error, p) == \
+        nodes(preorder(p, visited=set(), right_to_left=True))
+    print("Pre-order: ", ' '.join(nodes(preorder(p))))
+    print("Post-order:", ' '.join(nodes(postorder(p))))
+
+    g = guide.Problem()
+    for limit in range(3):
+        result = find(depth_limited(g, limit), g.is_goal)
+        assert (result if isinstance(result, str) else result.node) == guide.case_11_dls_recursive(g.initial, g, limit)
+        print(f"DLS limit {limit}:", result)
+
+    # Lazy: only the first 5 nodes of an infinite binary tree are ever generated
+    class Infinite:
+        initial = 1
+        def expand(self, node): return [2 * node, 2 * node + 1]
+    print("First 5 of an infinite tree:", [v.node for v in itertools.islice(preorder(Infinite()), 5)])
@@ -12,6 +12,9 @@ Structure:
 5.  Edge Case Handling (Cycles, Disconnected)
 6.  Return Value Variants
 """
+from collections import deque
+
+from bitset import BitSet
 
 # START: Helper Classes
 class Node:
@@ -110,9 +113,10 @@ def case_05_goal_check_on_generation(problem):
 # SECTION 3: VISITED SET LOGIC (GRAPH VS TREE)
 # ==========================================
 
-def case_06_graph_search_proper(problem):
-    """CASE 6: Graph Search. Consistently marks visited to prevent cycles."""
-    visited = set()
+def case_06_graph_search_proper(problem, visited=None):
+    """CASE 6: Graph Search. Consistently marks visited to prevent cycles.
+    Any visited set works ('in' + add()), e.g. a BitSet for integer nodes."""
+    if visited is None: visited = set()
     stack = [problem.initial]
     while stack:
         node = stack.pop()
@@ -176,7 +180,7 @@ def case_11_dls_recursive(node, problem, limit):
     for child in problem.expand(node):
         result = case_11_dls_recursive(child, problem, limit-1)
         if result == 'cutoff': cutoff_occurred = True
-        elif result: return result
+        elif result != 'failure': return result # not 'elif result': 'failure' is truthy
     return 'cutoff' if cutoff_occurred else 'failure'
 
 def case_12_iddfs(problem, max_depth=100):
@@ -256,10 +260,11 @@ def case_17_cycle_detection_recursion(node, path_set):
 
 def case_18_typo_bfs_queue(problem):
     """CASE 18: The 'Accidental BFS' Trap.
-    Using pop(0) instead of pop() turns stack into queue."""
-    stack = [problem.initial]
+    Using pop(0) instead of pop() turns stack into queue.
+    (A list's pop(0) is also O(n); a real queue is a deque: popleft().)"""
+    stack = deque([problem.initial])
     while stack:
-        node = stack.pop(0) # BUG: This is BFS now!
+        node = stack.popleft() # BUG: This is BFS now! (list version: stack.pop(0))
         # ...
         
 def case_19_forgot_visited_check_on_pop(problem):
@@ -305,12 +310,15 @@ def case_24_dfs_max_depth_guard(problem):
 
 def case_25_yielding_generator_dfs(problem):
     """CASE 25: Generator/Iterator DFS.
-    yield node instead of return."""
+    yield node instead of return. Nothing is expanded until the caller asks
+    for the next node, so the caller can stop early (break, islice).
+    Depth/parent, post-order and DLS versions: dfs_traversal.py"""
     stack = [problem.initial]
     while stack:
         node = stack.pop()
         yield node
-        # ...
+        for child in reversed(problem.expand(node)): # Left-to-Right
+            stack.append(child)
 
 def case_26_dfs_finding_all_paths(problem):
     """CASE 26: Find ALL paths to goal, not just one.
@@ -318,8 +326,12 @@ def case_26_dfs_finding_all_paths(problem):
     pass
 
 def case_27_memory_efficient_visited(problem):
-    """CASE 27: BitSet Visited (if nodes are integers)."""
-    pass
+    """CASE 27: BitSet Visited (if nodes are integers).
+    Nodes 0..problem.num_nodes-1: one bit per node instead of a set entry
+    (~60+ bytes). Same search as case 6; returns the visited nodes."""
+    visited = BitSet(problem.num_nodes)
+    case_06_graph_search_proper(problem, visited)
+    return visited
 
 def case_28_frontier_size_limit(problem):
     """CASE 28: Beam Search variant (Sort of).
@@ -341,3 +353,4 @@ if __name__ == "__main__":
     # Demonstrate Case 1 vs 2
     print(f"Case 1 (Standard/Reverse Order): {case_01_standard_iterative_dfs(p)}")
     print(f"Case 2 (Corrected/Natural Order): {case_02_corrected_iterative_dfs(p)}")
+    print(f"Case 25 (Generator): {list(case_25_yielding_generator_dfs(p))}")
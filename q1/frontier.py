@@ -0,0 +1,178 @@
+"""
+PLUGGABLE FRONTIERS
+===================
+DFS, BFS and uniform-cost / best-first search are the same loop; only the
+frontier differs:
+    Stack          - LIFO list: DFS
+    Queue          - FIFO collections.deque: BFS
+    PriorityQueue  - heapq ordered by priority(item), FIFO among ties: UCS / best-first
+
+All three have push(item), pop(), len() and extend(items). extend() takes
+the items in the order they should come out, so the Stack reverses them
+(the Left-to-Right trick from dfs_stack_order_variants.py) and the caller
+never has to know which frontier it has:
+
+    preorder(problem, frontier=Queue())      # dfs_traversal.py, now BFS order
+
+Every operation is O(1) (heap: O(log n)). A list used as a queue is not:
+list.pop(0) (variant_5, case_18) and list.insert(0, x) (variant_6) move
+every other element, so a search over n nodes takes O(n^2).
+Run `python frontier.py [nodes]` for the timings (default 10^6).
+"""
+import heapq
+import itertools
+import sys
+import time
+from collections import deque
+
+
+class Stack:
+    def __init__(self, items=()):
+        self.items = list(items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def push(self, item):
+        self.items.append(item)
+
+    def pop(self):
+        return self.items.pop()
+
+    def extend(self, items):
+        self.items.extend(reversed(list(items)))
+
+
+class Queue:
+    def __init__(self, items=()):
+        self.items = deque(items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def push(self, item):
+        self.items.append(item)
+
+    def pop(self):
+        return self.items.popleft()
+
+    def extend(self, items):
+        self.items.extend(items)
+
+
+class PriorityQueue:
+    """Pops the item with the lowest priority(item) first."""
+    def __init__(self, priority, items=()):
+        self.priority = priority
+        self.heap = []
+        self.counter = itertools.count() # tie-break: first pushed, first popped
+        self.extend(items)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, item):
+        heapq.heappush(self.heap, (self.priority(item), next(self.counter), item))
+
+    def pop(self):
+        return heapq.heappop(self.heap)[2]
+
+    def extend(self, items):
+        for item in items:
+            self.push(item)
+
+
+# ==========================================
+# TIMINGS
+# ==========================================
+
+class BinaryTree:
+    """Complete binary tree with nodes 0 .. size-1 (children 2i+1, 2i+2)."""
+    def __init__(self, size):
+        self.size = size
+        self.initial = 0
+
+    def expand(self, node):
+        return [c for c in (2 * node + 1, 2 * node + 2) if c < self.size]
+
+
+def list_pop_start(problem):
+    # variant_5 / case_18 before the fix (without the printing)
+    queue = [problem.initial]
+    count = 0
+    while queue:
+        node = queue.pop(0)
+        count += 1
+        for child in problem.expand(node):
+            queue.append(child)
+    return count
+
+
+def list_insert_start(problem):
+    # variant_6 before the fix
+    stack = [problem.initial]
+    count = 0
+    while stack:
+        node = stack.pop()
+        count += 1
+        for child in problem.expand(node):
+            stack.insert(0, child)
+    return count
+
+
+def deque_pop_start(problem):
+    # variant_5 / case_18 now
+    queue = deque([problem.initial])
+    count = 0
+    while queue:
+        node = queue.popleft()
+        count += 1
+        for child in problem.expand(node):
+            queue.append(child)
+    return count
+
+
+def deque_insert_start(problem):
+    # variant_6 now
+    stack = deque([problem.initial])
+    count = 0
+    while stack:
+        node = stack.pop()
+        count += 1
+        for child in problem.expand(node):
+            stack.appendleft(child)
+    return count
+
+
+def benchmark(size):
+    from dfs_traversal import preorder
+
+    p = BinaryTree(size)
+    runs = [
+        ("list.pop(0)", lambda: list_pop_start(p)),
+        ("deque.popleft()", lambda: deque_pop_start(p)),
+        ("list.insert(0, x)", lambda: list_insert_start(p)),
+        ("deque.appendleft(x)", lambda: deque_insert_start(p)),
+        ("preorder, Stack", lambda: sum(1 for _ in preorder(p, frontier=Stack()))),
+        ("preorder, Queue", lambda: sum(1 for _ in preorder(p, frontier=Queue()))),
+        ("preorder, PriorityQueue", lambda: sum(1 for _ in preorder(p, frontier=PriorityQueue(lambda v: -v.node)))),
+    ]
+    print(f"{size} nodes (complete binary tree)")
+    for label, run in runs:
+        start = time.perf_counter()
+        assert run() == size
+        print(f"{label:<26}{time.perf_counter() - start:>8.2f} s")
+
+
+if __name__ == "__main__":
+    from dfs_traversal import preorder
+    import dfs_stack_order_variants as variants
+
+    p = variants.Problem()
+    print("Stack:        ", ' '.join(v.node for v in preorder(p, frontier=Stack())))
+    print("Queue:        ", ' '.join(v.node for v in preorder(p, frontier=Queue())))
+    print("Priority (Z-A):", ' '.join(v.node for v in preorder(p, frontier=PriorityQueue(lambda v: -ord(v.node)))))
+    print("variant_5 (fixed):", end=' '); variants.variant_5_queue_pop_start(p)
+    print("\nvariant_6 (fixed):", end=' '); variants.variant_6_insert_start(p)
+    print("\n")
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6)
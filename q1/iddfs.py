@@ -0,0 +1,171 @@
+"""
+ITERATIVE DEEPENING THAT RESUMES FROM THE CUTOFF
+================================================
+case_12_iddfs runs case_11_dls_recursive from the root again for every
+depth, so pass L expands every node above depth L again, and it recurses
+in Python (RecursionError on deep graphs).
+
+iterative_deepening_search() below gives the same results:
+    - every pass is an explicit-stack DLS (no recursion)
+    - a pass also records its cutoff boundary: the nodes at the depth limit,
+      in DFS order. The next pass starts from that list: it only expands
+      those nodes (one level) instead of the whole tree above them.
+      Their children, in order, are exactly the new nodes case_11 would
+      reach in the next pass, so the same goal is found first.
+    - the boundary is as big as a BFS layer (b^L nodes). With
+      memory_cap=N, a boundary that grows past N nodes is dropped and the
+      next pass re-expands from the root like case_12 (it keeps trying to
+      record the boundary again, within the cap).
+
+Pass 'expansions=[]' to get the number of expand() calls per depth.
+Run `python iddfs.py` for the comparison with case_12.
+"""
+import sys
+import time
+
+from dls_variants_study_guide import case_11_dls_recursive
+
+
+def depth_limited_search(problem, limit, boundary=None, memory_cap=None, counter=None):
+    """
+    case_11_dls_recursive(problem.initial, problem, limit) with an explicit
+    stack. Nodes at the limit are appended to 'boundary' (a list), unless
+    it would grow past memory_cap; then boundary is returned as None.
+    Returns (goal node / 'cutoff' / 'failure', boundary).
+    """
+    stack = [(problem.initial, 0)]
+    cutoff_occurred = False
+    while stack:
+        node, depth = stack.pop()
+        if problem.is_goal(node): return node, boundary
+        if depth == limit:
+            cutoff_occurred = True
+            if boundary is not None:
+                if memory_cap is not None and len(boundary) >= memory_cap:
+                    boundary = None
+                else:
+                    boundary.append(node)
+            continue
+        if counter is not None: counter[0] += 1
+        for child in reversed(problem.expand(node)): # Left-to-Right, like the recursion
+            stack.append((child, depth + 1))
+    return ('cutoff' if cutoff_occurred else 'failure'), boundary
+
+
+def resume(problem, boundary, memory_cap=None, counter=None):
+    """
+    One more level below 'boundary' (the nodes at the last limit, in DFS
+    order). Returns (goal node / 'cutoff' / 'failure', next boundary or None).
+    """
+    next_boundary = []
+    for node in boundary:
+        if counter is not None: counter[0] += 1
+        for child in problem.expand(node):
+            if problem.is_goal(child): return child, next_boundary
+            if next_boundary is not None:
+                if memory_cap is not None and len(next_boundary) >= memory_cap:
+                    next_boundary = None
+                else:
+                    next_boundary.append(child)
+    if next_boundary is None:
+        # Too big to keep: still report whether any child exists
+        return 'cutoff', None
+    return ('cutoff' if next_boundary else 'failure'), next_boundary
+
+
+def iterative_deepening_search(problem, max_depth=100, memory_cap=None, expansions=None):
+    """
+    Same result as case_12_iddfs: the first goal found at the smallest
+    depth, 'failure' if the tree ends first, or None after max_depth.
+    """
+    boundary = None
+    for depth in range(max_depth):
+        counter = [0]
+        if boundary is None:
+            result, boundary = depth_limited_search(problem, depth, [], memory_cap, counter)
+        else:
+            result, boundary = resume(problem, boundary, memory_cap, counter)
+        if expansions is not None:
+            expansions.append(counter[0])
+        if result != 'cutoff': return result
+
+
+# ==========================================
+# COMPARISON WITH case_12_iddfs
+# ==========================================
+
+class CountingProblem:
+    """Wraps a problem and counts the expand() calls."""
+    def __init__(self, problem):
+        self.problem = problem
+        self.initial = problem.initial
+        self.expansions = 0
+
+    def is_goal(self, node): return self.problem.is_goal(node)
+    def expand(self, node):
+        self.expansions += 1
+        return self.problem.expand(node)
+
+
+class UniformTree:
+    """Infinite tree with integer nodes: s -> [s*b + 1, ..., s*b + b]."""
+    def __init__(self, branching, goal):
+        self.branching = branching
+        self.goal = goal
+        self.initial = 0
+
+    def is_goal(self, node): return node == self.goal
+    def expand(self, node):
+        first = node * self.branching + 1
+        return list(range(first, first + self.branching))
+
+
+def case_12_expansions(problem, max_depth=100):
+    """case_12_iddfs, with the expand() calls counted per depth."""
+    counting = CountingProblem(problem)
+    expansions = []
+    for depth in range(max_depth):
+        before = counting.expansions
+        result = case_11_dls_recursive(counting.initial, counting, depth)
+        expansions.append(counting.expansions - before)
+        if result != 'cutoff': return result, expansions
+    return None, expansions
+
+
+def benchmark(branching=3, goal_depth=11):
+    # Goal: the last node at goal_depth, so every pass is searched in full
+    goal = sum(branching ** level for level in range(goal_depth + 1)) - 1
+    p = UniformTree(branching, goal)
+    runs = [
+        ("case_12", lambda e: e.extend(case_12_expansions(p)[1]) or goal),
+        ("resume", lambda e: iterative_deepening_search(p, expansions=e)),
+        ("resume, cap 1000", lambda e: iterative_deepening_search(p, memory_cap=1000, expansions=e)),
+    ]
+    print(f"Tree with branching {branching}, goal at depth {goal_depth}: expand() calls per depth")
+    print(f"{'depth':<18}" + ''.join(f"{d:>8}" for d in range(goal_depth + 1)) + f"{'total':>10}{'seconds':>9}")
+    for label, run in runs:
+        expansions = []
+        start = time.perf_counter()
+        assert run(expansions) == goal
+        seconds = time.perf_counter() - start
+        print(f"{label:<18}" + ''.join(f"{e:>8}" for e in expansions) + f"{sum(expansions):>10}{seconds:>9.2f}")
+
+
+if __name__ == "__main__":
+    import dls_variants_study_guide as guide
+
+    g = guide.Problem()
+    print("case_12:", guide.case_12_iddfs(g), " resume:", iterative_deepening_search(g))
+
+    # A chain deeper than the recursion limit
+    class Chain:
+        initial = 0
+        def is_goal(self, node): return node == 5000
+        def expand(self, node): return [node + 1]
+    try:
+        guide.case_12_iddfs(Chain(), max_depth=5001)
+    except RecursionError:
+        print("case_12 on a chain of 5000: RecursionError (limit", sys.getrecursionlimit(), ")")
+    print("resume on a chain of 5000:", iterative_deepening_search(Chain(), max_depth=5001))
+    print()
+    benchmark()
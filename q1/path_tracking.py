@@ -0,0 +1,90 @@
+"""
+PATH TRACKING WITHOUT COPYING PATHS
+===================================
+Two ways the study guide gets the path to the goal:
+    case_13_dfs_return_path_dictionary - parents dict {node: parent}: one hash
+        entry per reached node, nodes must be hashable
+    case_14_dfs_stack_of_paths - every stack entry is a whole path:
+        list(path) for every child, O(depth) time and memory per push
+
+dfs_parent_index_path() keeps the frontier as node ids in a NodePool
+(compact_nodes.py): each node stores the id of its parent in a flat array,
+and the path is rebuilt once, when the goal is found. A push is O(1), and
+finished subtrees are dropped from the pool, so it holds only the frontier
+and its ancestors. Same visit order and result as case_14.
+Run `python path_tracking.py` for the benchmark on deep graphs.
+"""
+import time
+import tracemalloc
+from array import array
+
+from compact_nodes import NodePool
+from dls_variants_study_guide import case_13_dfs_return_path_dictionary, case_14_dfs_stack_of_paths
+
+
+def dfs_parent_index_path(problem):
+    """
+    case_14_dfs_stack_of_paths with parent ids instead of path copies.
+    Returns the path [initial, ..., goal], or None.
+    """
+    pool = NodePool(typecode=None)
+    stack = array('i', [pool.add(problem.initial)])
+    while stack:
+        node = stack.pop()
+        # Nodes created after 'node' are in finished subtrees (see
+        # depth_limited_search_pool in compact_nodes.py)
+        pool.truncate(node + 1)
+        state = pool.states[node]
+        if problem.is_goal(state): return pool.path(node)
+        depth = pool.depths[node] + 1
+        for child in problem.expand(state):
+            stack.append(pool.add(child, depth, node))
+    return None
+
+
+class DeepProblem:
+    """
+    A chain 1 -> 2 -> ... -> depth (the goal) where every chain node i also
+    has a dead-end child depth + i. The dead ends are pushed first and stay
+    on the stack until the end, each with its own path in case_14.
+    (Starts at 1: case_13 stops rebuilding the path at a falsy node.)
+    """
+    def __init__(self, depth):
+        self.depth = depth
+        self.initial = 1
+
+    def is_goal(self, node): return node == self.depth
+    def expand(self, node):
+        if node >= self.depth: return []
+        return [self.depth + node, node + 1]
+
+
+def benchmark(depths=(1000, 3000, 6000)):
+    searches = [
+        ("case_13 (parents dict)", case_13_dfs_return_path_dictionary),
+        ("case_14 (stack of paths)", case_14_dfs_stack_of_paths),
+        ("parent ids", dfs_parent_index_path),
+    ]
+    print(f"{'depth':>6}  {'search':<26}{'seconds':>10}{'peak MB':>10}")
+    for depth in depths:
+        p = DeepProblem(depth)
+        for label, search in searches:
+            start = time.perf_counter()
+            path = search(p)
+            seconds = time.perf_counter() - start
+            assert path == list(range(1, depth + 1))
+            tracemalloc.start()
+            search(p)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{depth:>6}  {label:<26}{seconds:>10.3f}{peak / 2 ** 20:>10.2f}")
+
+
+if __name__ == "__main__":
+    import dls_variants_study_guide as guide
+
+    g = guide.Problem()
+    print("case_14:   ", guide.case_14_dfs_stack_of_paths(g))
+    print("parent ids:", dfs_parent_index_path(g))
+    print()
+    benchmark()
@@ -0,0 +1,206 @@
+import random
+from contextlib import redirect_stdout
+from io import StringIO
+
+import dfs_stack_order_variants as variants
+import dls_variants_study_guide as guide
+from bitset import BitSet, ImplicitGraph, graph_search
+from compact_nodes import GeneratedProblem, NodePool, depth_limited_search_pool
+from csr_graph import CSRGraph, CSRProblem, DictProblem, depth_first_search, depth_limited_search, random_edges
+from dfs_traversal import depth_limited, find, postorder, preorder
+from dls_correction import depth_limited_search_corrected
+from frontier import (BinaryTree, PriorityQueue, Queue, Stack, deque_insert_start, deque_pop_start,
+                      list_insert_start, list_pop_start)
+from iddfs import UniformTree, case_12_expansions, iterative_deepening_search
+from path_tracking import DeepProblem, dfs_parent_index_path
+
+
+class RandomTree:
+    """
+    Random tree on the nodes 0 .. size-1 (root 0): every node hangs below a
+    random earlier one. 'goals' random nodes are goals, so several goals can
+    compete for the first place.
+    """
+    def __init__(self, rng, size, goals=1):
+        self.initial = 0
+        self.children = {node: [] for node in range(size)}
+        for node in range(1, size):
+            self.children[rng.randrange(node)].append(node)
+        self.goals = set(rng.sample(range(size), min(goals, size)))
+
+    def is_goal(self, node): return node in self.goals
+    def expand(self, node): return self.children[node]
+
+
+def printed(function, *args):
+    # The nodes a print-based variant visits, in order
+    out = StringIO()
+    with redirect_stdout(out):
+        function(*args)
+    return out.getvalue().split()
+
+
+def test_iddfs():
+    print("Testing iterative deepening...")
+    # Same result as case_12 on random trees, with and without depth / memory caps
+    rng = random.Random(0)
+    for _ in range(500):
+        tree = RandomTree(rng, rng.randint(1, 60), goals=rng.randint(0, 3))
+        max_depth = rng.randint(1, 12)
+        memory_cap = rng.choice([None, 1, 3, 10])
+        assert iterative_deepening_search(tree, max_depth, memory_cap) == guide.case_12_iddfs(tree, max_depth)
+    print("PASS: Random Trees")
+
+    # Resuming from the boundary never expands more than case_12
+    tree = UniformTree(3, goal=200)
+    expansions = []
+    assert iterative_deepening_search(tree, expansions=expansions) == 200
+    result, case_12 = case_12_expansions(tree)
+    assert result == 200
+    assert len(expansions) == len(case_12) and sum(expansions) < sum(case_12)
+    # The goal is not reached within max_depth
+    assert iterative_deepening_search(tree, max_depth=3) is None
+    g = guide.Problem()
+    assert iterative_deepening_search(g) is guide.case_12_iddfs(g) is g.D
+    print("PASS: Iterative Deepening")
+
+
+def test_csr_graph():
+    print("Testing CSR graph...")
+    toy = {'Start': ['A', 'B'], 'A': ['C', 'D'], 'B': ['E', 'F']}
+    graph = CSRGraph.from_dict(toy)
+    assert graph.to_dict() == {**toy, 'C': [], 'D': [], 'E': [], 'F': []}
+    assert CSRProblem(graph, 'Start', 'F').expand(graph.id('B')) == graph.neighbors(graph.id('B'))
+
+    # Same answer as depth_limited_search_corrected on random graphs (with cycles)
+    rng = random.Random(1)
+    for seed in range(100):
+        num_nodes = rng.randint(1, 30)
+        graph = CSRGraph.from_edges(num_nodes, random_edges(num_nodes, rng.randint(1, 3), seed))
+        goal = rng.randrange(num_nodes)
+        for limit in range(5):
+            expected = depth_limited_search_corrected(DictProblem(graph.to_dict(), 0, goal), limit)
+            result = depth_limited_search(graph, 0, goal, limit)
+            assert result == (expected if isinstance(expected, str) else expected.state)
+            # Graph search reaches every goal a limited search finds
+            if not isinstance(expected, str):
+                assert depth_first_search(graph, 0, goal) == goal
+    print("PASS: CSR Graph")
+
+
+def test_compact_nodes():
+    print("Testing node pool...")
+    # Same answer as depth_limited_search_corrected, and the path leads to the goal
+    for goal in (0, 5, 17, 30, None):
+        problem = GeneratedProblem(branching=2, height=4, goal=goal)
+        for limit in range(5):
+            expected = depth_limited_search_corrected(problem, limit)
+            pool = NodePool()
+            result = depth_limited_search_pool(problem, limit, pool)
+            if isinstance(expected, str):
+                assert result == expected
+            else:
+                path = pool.path(result)
+                assert path[0] == 0 and path[-1] == expected.state == goal
+                assert all(child in problem.successors(parent) for parent, child in zip(path, path[1:]))
+    print("PASS: Node Pool")
+
+
+def test_path_tracking():
+    print("Testing path tracking...")
+    # Same path as case_14 (and case_13 on trees)
+    rng = random.Random(2)
+    for _ in range(200):
+        tree = RandomTree(rng, rng.randint(1, 40), goals=rng.randint(0, 2))
+        assert dfs_parent_index_path(tree) == guide.case_14_dfs_stack_of_paths(tree)
+    for depth in (1, 2, 50):
+        problem = DeepProblem(depth)
+        path = dfs_parent_index_path(problem)
+        assert path == guide.case_14_dfs_stack_of_paths(problem)
+        assert path == guide.case_13_dfs_return_path_dictionary(problem)
+        assert path == list(range(1, depth + 1))
+    print("PASS: Path Tracking")
+
+
+def test_bitset():
+    print("Testing BitSet...")
+    # Same answers as a set under random add / discard / clear
+    rng = random.Random(3)
+    bits, expected = BitSet(100), set()
+    for _ in range(2000):
+        n = rng.randrange(100)
+        operation = rng.random()
+        if operation < 0.5:
+            bits.add(n)
+            expected.add(n)
+        elif operation < 0.95:
+            bits.discard(n)
+            expected.discard(n)
+        else:
+            bits.clear()
+            expected.clear()
+        assert len(bits) == len(expected)
+        assert (n in bits) == (n in expected)
+    assert [n for n in range(100) if n in bits] == sorted(expected)
+
+    # A BitSet visits the same nodes as a set
+    graph = ImplicitGraph(1000)
+    visited_bits, visited_set = BitSet(1000), set()
+    assert graph_search(graph, visited_bits) is graph_search(graph, visited_set) is None
+    assert len(visited_bits) == len(visited_set)
+    assert all(n in visited_bits for n in visited_set)
+    # ... and in the variants that take any set-like 'visited'
+    tree = RandomTree(rng, 50)
+    assert printed(variants.variant_10_visited_position_error, tree, BitSet(50)) == \
+        printed(variants.variant_10_visited_position_error, tree, set())
+    print("PASS: BitSet")
+
+
+def test_traversal():
+    print("Testing traversal generators...")
+    nodes = lambda visits: [str(v.node) for v in visits]
+    trees = [variants.Problem()] + [RandomTree(random.Random(seed), 25) for seed in range(20)]
+    for p in trees:
+        # The print-based variants, on top of the generators and frontiers
+        assert printed(variants.variant_1_naive_append, p) == nodes(preorder(p, right_to_left=True))
+        assert printed(variants.variant_3_correct_reverse_loop, p) == nodes(preorder(p))
+        assert printed(variants.variant_3_correct_reverse_loop, p) == nodes(preorder(p, frontier=Stack()))
+        assert printed(variants.variant_7_slice_replacement, p) == nodes(preorder(p))
+        assert printed(variants.variant_8_recursive_natural, p.initial, p) == nodes(preorder(p))
+        assert printed(variants.variant_5_queue_pop_start, p) == nodes(preorder(p, frontier=Queue()))
+        assert printed(variants.variant_6_insert_start, p) == nodes(preorder(p, frontier=Queue()))
+        assert printed(variants.variant_10_visited_position_error, p) == \
+            nodes(preorder(p, visited=set(), right_to_left=True))
+
+    # Post-order on the guide's graph: the order case_10 prints in
+    g = guide.Problem()
+    out = printed(guide.case_10_recursive_dfs_postorder, g.initial, g, set())
+    assert out[2::3] == nodes(postorder(g, visited=set())) == ['C', 'A', 'D', 'B', 'S']
+
+    # DLS through find(): case_11 on random trees
+    rng = random.Random(4)
+    for _ in range(100):
+        tree = RandomTree(rng, rng.randint(1, 30), goals=rng.randint(0, 2))
+        for limit in range(6):
+            result = find(depth_limited(tree, limit), tree.is_goal)
+            expected = guide.case_11_dls_recursive(tree.initial, tree, limit)
+            assert (result if isinstance(result, str) else result.node) == expected
+
+    # The list and deque frontiers visit every node; so does preorder with each frontier
+    tree = BinaryTree(1000)
+    counts = [list_pop_start(tree), list_insert_start(tree), deque_pop_start(tree), deque_insert_start(tree)]
+    for frontier in (Stack(), Queue(), PriorityQueue(lambda v: -v.node)):
+        counts.append(sum(1 for _ in preorder(tree, frontier=frontier)))
+    assert counts == [1000] * 7
+    # Best-first by lowest node id on a complete binary tree is BFS order
+    assert [v.node for v in preorder(tree, frontier=PriorityQueue(lambda v: v.node))] == list(range(1000))
+    print("PASS: Traversal")
+
+
+if __name__ == "__main__":
+    test_iddfs()
+    test_csr_graph()
+    test_compact_nodes()
+    test_path_tracking()
+    test_bitset()
+    test_traversal()
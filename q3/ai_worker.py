@@ -0,0 +1,93 @@
+import multiprocessing
+import queue
+
+# =============================================================================
+# AI WORKER (search in a background process)
+# =============================================================================
+# get_best_move() can take seconds on big boards. Running it inside the
+# pygame loop freezes the window, and a thread would still share the GIL
+# with the drawing code, so the search runs in its own process instead:
+#
+#   worker.request(game)  -> starts a search for the AI's move (returns at once)
+#   worker.poll()         -> the move once it is ready, else None (call every frame)
+#   worker.cancel()       -> abandons the current search (reset / window closed)
+#   worker.close()        -> stops the process
+#
+# The process lives for the whole game, so the transposition table in
+# minimax_agent keeps its entries between moves. Every request has a job
+# number; results of cancelled or old jobs are dropped.
+
+
+def _serve(requests, results, cancelled):
+    # Runs in the worker process
+    from game_logic import TicTacToe
+    from minimax_agent import get_best_move
+    from search_budget import SearchBudget
+
+    while True:
+        job = requests.get()
+        if job is None:
+            return
+        job_id, (rows, cols, k), board, ai, human, time_limit = job
+        if cancelled.value >= job_id:
+            continue
+        game = TicTacToe(rows, cols, k)
+        game.load_board(board)
+        game.ai, game.human = ai, human
+        # Stops the search (between two clock checks) as soon as the job is cancelled
+        budget = SearchBudget(time_limit, should_stop=lambda: cancelled.value >= job_id)
+        results.put((job_id, get_best_move(game, budget=budget)))
+
+
+class AIWorker:
+    def __init__(self, time_limit=1.0):
+        self.time_limit = time_limit
+        # spawn: the worker does not inherit pygame's state from the window process
+        context = multiprocessing.get_context("spawn")
+        self.requests = context.Queue()
+        self.results = context.Queue()
+        self.cancelled = context.Value('i', 0) # jobs up to this number are cancelled
+        self.job_id = 0
+        self.pending = None # job number of the search we are waiting for
+        self.process = context.Process(target=_serve, args=(self.requests, self.results, self.cancelled),
+                                       daemon=True)
+        self.process.start()
+
+    def busy(self):
+        return self.pending is not None
+
+    def request(self, game):
+        """Starts searching for the AI's move in 'game'. Cancels any running search."""
+        self.cancel()
+        self.job_id += 1
+        self.pending = self.job_id
+        self.requests.put((self.job_id, (game.rows, game.cols, game.k), list(game.board),
+                           game.ai, game.human, self.time_limit))
+
+    def poll(self):
+        """Returns the requested move when it is ready, otherwise None. Never blocks."""
+        while self.pending is not None:
+            try:
+                job_id, move = self.results.get_nowait()
+            except queue.Empty:
+                if not self.process.is_alive():
+                    self.pending = None
+                    raise RuntimeError("AI worker process exited")
+                return None
+            if job_id == self.pending:
+                self.pending = None
+                return move
+        return None
+
+    def cancel(self):
+        if self.pending is not None:
+            with self.cancelled.get_lock():
+                self.cancelled.value = self.pending
+            self.pending = None
+
+    def close(self):
+        self.cancel()
+        self.requests.put(None)
+        self.process.join(timeout=1.0)
+        if self.process.is_alive():
+            self.process.terminate()
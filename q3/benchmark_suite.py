@@ -0,0 +1,226 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+import minimax_agent
+import minimax_agent_old
+from game_logic import TicTacToe
+from new_engine import tictactoe as ttt_new
+from search_stats import SearchStats
+from transposition import TranspositionTable
+
+# =============================================================================
+# BENCHMARK SUITE: the three minimax implementations
+# =============================================================================
+#   alphabeta - q3/minimax_agent.py (transposition table, symmetry, move ordering)
+#   old       - q3/minimax_agent_old.py (alpha-beta below the root only)
+#   new       - q3_new/tictactoe.py
+#
+# Every implementation picks a move for the same fixed positions: the empty
+# board, all 9 one-ply and 72 two-ply openings, and a few tactical positions.
+# Opening books are not used, and every search starts with an empty table,
+# so node counts are exactly reproducible. Times are the fastest of
+# --repeat runs.
+#
+#   python benchmark_suite.py --save               # store a baseline
+#   python benchmark_suite.py --compare            # flag regressions against it
+#
+# Any increase in nodes is a regression. Time only counts as one when it is
+# more than --tolerance slower (timings are noisy), and only makes sense on
+# the machine that saved the baseline. --compare exits with status 1 on a
+# regression.
+#
+# The committed benchmark_baseline.json holds node counts only
+# (--save --nodes-only), so it means the same on every machine and
+# test_agent.py checks the searches against it. Save it again whenever a
+# change is meant to alter the node counts.
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+
+# (name, board as a 9-character string, '.' = empty)
+TACTICAL = [
+    ("win in 1", "XX.OO...."),          # X wins on 2
+    ("block", "OO.X....X"),             # X must block on 2
+    ("opposite corners", "X...O...X"),  # O must answer on an edge
+    ("fork", "XO..X...O"),              # X forks with 3 or 6
+    ("late game", "XOXOXO..."),         # X wins on 6
+]
+
+
+def positions():
+    """Returns [(name, board)] for the whole position set (boards as lists of 'X' / 'O' / ' ')."""
+    result = [("empty", [' '] * 9)]
+    for first in range(9):
+        board = [' '] * 9
+        board[first] = 'X'
+        result.append((f"X{first}", board))
+    for first in range(9):
+        for second in range(9):
+            if second != first:
+                board = [' '] * 9
+                board[first] = 'X'
+                board[second] = 'O'
+                result.append((f"X{first} O{second}", board))
+    for name, text in TACTICAL:
+        result.append((name, [' ' if c == '.' else c for c in text]))
+    return result
+
+
+def to_move(board):
+    return 'X' if board.count('X') == board.count('O') else 'O'
+
+
+def make_game(board):
+    game = TicTacToe()
+    game.load_board(board)
+    game.ai = to_move(board)
+    game.human = 'O' if game.ai == 'X' else 'X'
+    return game
+
+
+# --- IMPLEMENTATIONS ---
+# Each one takes a board and returns (move as a square 0-8, nodes searched)
+
+def run_alphabeta(board):
+    game = make_game(board)
+    stats = SearchStats()
+    move = minimax_agent.alpha_beta_search(game, game.board, TranspositionTable(), stats,
+                                           minimax_agent.KillerOrdering())
+    return move, stats.nodes
+
+
+def run_old(board):
+    game = make_game(board)
+    stats = SearchStats()
+    move = minimax_agent_old.get_best_move(game, stats=stats)
+    return move, stats.nodes
+
+
+def run_new(board):
+    grid = [[None if board[3 * i + j] == ' ' else board[3 * i + j] for j in range(3)] for i in range(3)]
+    stats = SearchStats()
+    i, j = ttt_new.minimax(grid, stats=stats, use_book=False)
+    return 3 * i + j, stats.nodes
+
+
+IMPLEMENTATIONS = {
+    "alphabeta": run_alphabeta,
+    "old": run_old,
+    "new": run_new,
+}
+
+
+def run_suite(names=None, repeat=3):
+    """
+    Returns the results dict:
+    {implementation: {"nodes", "seconds", "nodes_per_second", "positions": {name: [nodes, seconds]}}}
+    """
+    results = {}
+    for name in names or IMPLEMENTATIONS:
+        run = IMPLEMENTATIONS[name]
+        per_position = {}
+        for position, board in positions():
+            best = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                _, nodes = run(board)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            per_position[position] = [nodes, best]
+        total_nodes = sum(nodes for nodes, _ in per_position.values())
+        total_seconds = sum(seconds for _, seconds in per_position.values())
+        results[name] = {
+            "nodes": total_nodes,
+            "seconds": total_seconds,
+            "nodes_per_second": total_nodes / total_seconds if total_seconds else 0.0,
+            "positions": per_position,
+        }
+    return results
+
+
+def compare(results, baseline, tolerance=0.25):
+    """
+    Returns a list of regression messages (empty when nothing got worse).
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        old = baseline[name]
+        for position, (nodes, seconds) in result["positions"].items():
+            if position in old["positions"] and nodes > old["positions"][position][0]:
+                regressions.append(f"{name} {position}: nodes {old['positions'][position][0]} -> {nodes}")
+        # A nodes-only baseline has no times to compare with
+        if old["seconds"] is not None and result["seconds"] > old["seconds"] * (1 + tolerance):
+            regressions.append(f"{name}: time {old['seconds'] * 1000:.1f} ms -> {result['seconds'] * 1000:.1f} ms")
+    return regressions
+
+
+def nodes_only(results):
+    """
+    Returns a copy of results without the times (seconds = None), for a
+    baseline that has to mean the same on every machine.
+    """
+    return {name: {"nodes": result["nodes"], "seconds": None, "nodes_per_second": None,
+                   "positions": {position: [nodes, None] for position, (nodes, _) in result["positions"].items()}}
+            for name, result in results.items()}
+
+
+def print_results(results, baseline=None):
+    print(f"{'implementation':<16}{'nodes':>10}{'ms':>10}{'nodes/s':>12}", end="")
+    print(f"{'base nodes':>12}{'base ms':>10}" if baseline else "")
+    for name, result in results.items():
+        print(f"{name:<16}{result['nodes']:>10}{result['seconds'] * 1000:>10.1f}{result['nodes_per_second']:>12.0f}", end="")
+        if baseline and name in baseline:
+            seconds = baseline[name]["seconds"]
+            print(f"{baseline[name]['nodes']:>12}" + (f"{seconds * 1000:>10.1f}" if seconds is not None else f"{'-':>10}"))
+        else:
+            print()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the three minimax implementations.")
+    parser.add_argument("implementations", nargs="*",
+                        help=f"any of {', '.join(IMPLEMENTATIONS)} (default: all)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", nargs="?", const=DEFAULT_BASELINE, help="save the results as a baseline")
+    parser.add_argument("--nodes-only", action="store_true",
+                        help="save node counts without times (for a baseline shared between machines)")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, help="compare with a saved baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+    for name in args.implementations:
+        if name not in IMPLEMENTATIONS:
+            parser.error(f"unknown implementation: {name}")
+
+    results = run_suite(args.implementations or None, args.repeat)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+    print_results(results, baseline)
+
+    if args.save:
+        saved = results
+        if args.nodes_only:
+            saved = nodes_only(results)
+        with open(args.save, "w") as f:
+            json.dump({"python": platform.python_version(), "positions": len(positions()),
+                       "results": saved}, f, indent=1)
+        print(f"Saved baseline to {args.save}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        for message in regressions:
+            print("REGRESSION:", message)
+        if regressions:
+            return 1
+        print("No regressions.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,129 @@
+import math
+import os
+import sys
+
+import book_format
+from book_format import NUM_BOARDS, NO_ENTRY, POWERS
+
+# =============================================================================
+# OPENING BOOK (Perfect-play table for the TicTacToe class)
+# =============================================================================
+# Every reachable position is solved once by the alpha-beta agent and the
+# answer is written to a small binary file. get_best_move() looks the current
+# board up in O(1) instead of searching.
+#
+# The file format (book_format.py) is shared with q3_new/opening_book.py, so
+# either build can be loaded here.
+#
+# Build it with:  python book.py [path]
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "opening_book.bin")
+
+CELL_CODES = {' ': 0, 'X': 1, 'O': 2}
+
+
+def board_index(board):
+    index = 0
+    for n, spot in enumerate(board):
+        index += CELL_CODES[spot] * POWERS[n]
+    return index
+
+
+def side_to_move(board):
+    # X always starts, so equal counts means X is to move
+    return 'X' if board.count('X') == board.count('O') else 'O'
+
+
+# --- BUILD STEP ---
+
+def solve():
+    """
+    Walks every position reachable from the empty board and solves it with
+    the alpha-beta agent. Returns a bytearray of NUM_BOARDS entries.
+    """
+    from game_logic import TicTacToe
+    from minimax_agent import max_value, min_value
+    from transposition import TranspositionTable
+
+    game = TicTacToe()
+    table = TranspositionTable(max_size=NUM_BOARDS)
+    entries = bytearray([NO_ENTRY]) * NUM_BOARDS
+
+    def visit(index):
+        if entries[index] != NO_ENTRY:
+            return
+        if game.check_win('X') or game.check_win('O') or not game.empty_squares():
+            return
+
+        letter = side_to_move(game.board)
+        # Full window at the root, so the returned value is exact
+        if letter == game.ai:
+            value, move = max_value(game, game.board, -math.inf, math.inf, table)
+        else:
+            value, move = min_value(game, game.board, -math.inf, math.inf, table)
+
+        # Scores are from the AI's point of view (mate scores, so the move is
+        # the fastest win / slowest loss); store X's view
+        x_value = (value > 0) - (value < 0)
+        if game.ai == 'O':
+            x_value = -x_value
+        entries[index] = book_format.encode_entry(x_value, move)
+
+        code = CELL_CODES[letter]
+        for square in game.available_moves():
+            game.make_move(square, letter)
+            visit(index + code * POWERS[square])
+            game.undo_move(square)
+
+    visit(0)
+    return entries
+
+
+def build(path=DEFAULT_PATH):
+    entries = solve()
+    book_format.write(entries, path)
+    return entries
+
+
+# --- LOADER ---
+
+class OpeningBook(book_format.BookFile):
+    def __init__(self, path=DEFAULT_PATH):
+        # Memory-mapped so worker processes share one copy of the table
+        super().__init__(path)
+
+    def lookup(self, board):
+        """
+        Returns (value for X, best move) for a board, or None.
+        """
+        return self.entry(board_index(board))
+
+    def probe(self, game):
+        """
+        Returns the book move for the AI, or None when the position is not in
+        the book or it is not actually the AI's turn on this board.
+        The book only covers the classic 3x3 game.
+        """
+        if (game.rows, game.cols, game.k) != (3, 3, 3):
+            return None
+        if side_to_move(game.board) != game.ai:
+            return None
+        found = self.lookup(game.board)
+        if found is None:
+            return None
+        return found[1]
+
+
+def load(path=DEFAULT_PATH):
+    """
+    Returns the OpeningBook at path, or None if it has not been built yet
+    (or was built with an older format version).
+    """
+    return book_format.load(OpeningBook, path)
+
+
+if __name__ == '__main__':
+    out = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH
+    entries = build(out)
+    solved = sum(1 for byte in entries if byte != NO_ENTRY)
+    print(f"Solved {solved} positions -> {out}")
@@ -0,0 +1,98 @@
+import mmap
+import os
+import sys
+
+# =============================================================================
+# OPENING BOOK FILE FORMAT
+# =============================================================================
+# Shared by q3/book.py and q3_new/opening_book.py, so a book built by either
+# one loads in the other:
+#   4 bytes   MAGIC b"TTT" + format version
+#   3^9 bytes one entry per board, indexed by sum(code(square n) * 3^n)
+#             with code 0 = empty, 1 = X, 2 = O
+#   entry     (value + 1) << 4 | best move n, value from X's point of view
+#             (1, 0, -1). NO_ENTRY for terminal / unreachable boards.
+#
+# Versions:
+#   1 - best move = the first move with the best value, so a won position
+#       may be played out the long way (or by a move that only wins later)
+#   2 - among moves with the best value: the fastest win, the slowest loss
+#
+# A book with an older version is not used (load() returns None), so it has
+# to be rebuilt instead of silently playing the old moves.
+
+FORMAT_VERSION = 2
+MAGIC_PREFIX = b"TTT"
+MAGIC = MAGIC_PREFIX + str(FORMAT_VERSION).encode()
+NUM_BOARDS = 3 ** 9
+NO_ENTRY = 0xFF
+
+# 3^n for every square
+POWERS = tuple(3 ** n for n in range(9))
+
+
+def encode_entry(value, move):
+    return (value + 1) << 4 | move
+
+
+def decode_entry(byte):
+    """
+    Returns (value, move n) for a table byte, or None for NO_ENTRY.
+    """
+    if byte == NO_ENTRY:
+        return None
+    return (byte >> 4) - 1, byte & 0x0F
+
+
+def write(entries, path):
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(entries)
+
+
+class BookFile:
+    """
+    Read-only view of a book file. The file is memory-mapped, so every
+    process that opens it shares the same pages instead of solving again.
+    Raises ValueError for anything but a book of the current version.
+    """
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.data) != len(MAGIC) + NUM_BOARDS or self.data[:len(MAGIC)] != MAGIC:
+            outdated = self.data[:len(MAGIC_PREFIX)] == MAGIC_PREFIX
+            self.data.close()
+            if outdated:
+                raise ValueError(f"Opening book from another format version, rebuild it: {path}")
+            raise ValueError(f"Not an opening book file: {path}")
+
+    def entry(self, index):
+        """
+        Returns (value for X, move n) for a table index, or None.
+        """
+        return decode_entry(self.data[len(MAGIC) + index])
+
+    def close(self):
+        self.data.close()
+
+
+def is_current(path):
+    """
+    False for a book file written with another format version.
+    """
+    with open(path, "rb") as f:
+        header = f.read(len(MAGIC))
+    return not (header.startswith(MAGIC_PREFIX) and header != MAGIC)
+
+
+def load(cls, path):
+    """
+    Returns cls(path), or None if the book has not been built yet or was
+    built with another format version (a warning tells how to rebuild it).
+    """
+    if not os.path.exists(path):
+        return None
+    if not is_current(path):
+        print(f"Ignoring outdated opening book {path}, rebuild it", file=sys.stderr)
+        return None
+    return cls(path)
@@ -1,15 +1,25 @@
 # CONSTANTS
 
-WIDTH = 600
-HEIGHT = 600
-LINE_WIDTH = 15
-WIN_LINE_WIDTH = 15
+# Board size and how many in a row win (3, 3, 3 = Tic Tac Toe; try 15, 15, 5 for Gomoku)
 BOARD_ROWS = 3
 BOARD_COLS = 3
+WIN_LENGTH = 3
+
+# Seconds the AI may think per move (it deepens its search until time is up)
+AI_TIME_LIMIT = 1.0
+# Milliseconds before the AI's move appears, so it does not feel instant
+AI_MIN_DELAY = 500
+# Frames per second for the pygame loop
+FPS = 60
+
+WIDTH = 600
 SQUARE_SIZE = WIDTH // BOARD_COLS
+HEIGHT = SQUARE_SIZE * BOARD_ROWS
+LINE_WIDTH = max(2, SQUARE_SIZE // 13)
+WIN_LINE_WIDTH = LINE_WIDTH
 CIRCLE_RADIUS = SQUARE_SIZE // 3
-CIRCLE_WIDTH = 15
-CROSS_WIDTH = 25
+CIRCLE_WIDTH = max(2, SQUARE_SIZE // 13)
+CROSS_WIDTH = max(3, SQUARE_SIZE // 8)
 SPACE = SQUARE_SIZE // 4
 
 # COLORS
@@ -1,49 +1,149 @@
+def make_lines(rows, cols, k):
+    """
+    Every run of k squares in a row on a rows x cols board: rows, then cols,
+    then diagonals (down-right), then anti-diagonals (down-left).
+    Squares are numbered row * cols + col.
+    """
+    lines = []
+    for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+        for r in range(rows):
+            for c in range(cols):
+                end_r = r + dr * (k - 1)
+                end_c = c + dc * (k - 1)
+                if 0 <= end_r < rows and 0 <= end_c < cols:
+                    lines.append(tuple((r + dr * i) * cols + (c + dc * i) for i in range(k)))
+    return lines
+
+
+_LINE_TABLES = {}
+
+def line_tables(rows, cols, k):
+    """
+    Returns (lines, line_ids_through) for a board size, built once and shared
+    by every game of that size. line_ids_through[square] = indexes into lines
+    of the lines through that square.
+    """
+    key = (rows, cols, k)
+    if key not in _LINE_TABLES:
+        lines = make_lines(rows, cols, k)
+        through = [[] for _ in range(rows * cols)]
+        for i, line in enumerate(lines):
+            for square in line:
+                through[square].append(i)
+        _LINE_TABLES[key] = (lines, through)
+    return _LINE_TABLES[key]
+
+
+# The 8 winning lines of the classic 3x3 game (rows, cols, diagonals)
+LINES, LINE_IDS_THROUGH = line_tables(3, 3, 3)
+
 class TicTacToe:
-    def __init__(self):
-        self.board = [' ' for _ in range(9)]
+    def __init__(self, rows=3, cols=3, k=3):
+        # m,n,k-game: rows x cols board, k in a row wins (3, 3, 3 = Tic Tac Toe, 15, 15, 5 = Gomoku)
+        if not (1 <= k <= max(rows, cols)):
+            raise ValueError(f"k={k} does not fit on a {rows}x{cols} board")
+        self.rows = rows
+        self.cols = cols
+        self.k = k
+        self.lines, self.line_ids_through = line_tables(rows, cols, k)
+        self.board = [' ' for _ in range(rows * cols)]
         self.human = 'X'
         self.ai = 'O'
         self.current_player = self.human
         self.game_over = False
         self.winning_line = None # tuple of (start_index, end_index) for drawing
+        self.load_board(self.board)
+
+    def load_board(self, board):
+        """
+        Replaces the board and rebuilds the line counters.
+        Use this instead of assigning to self.board directly.
+        """
+        if len(board) != self.rows * self.cols:
+            raise ValueError("Board does not match the game size")
+        self.board = list(board)
+        # line_counts[letter][i] = how many of lines[i]'s squares hold 'letter'
+        self.line_counts = {letter: [0] * len(self.lines) for letter in ('X', 'O')}
+        # completed_lines[letter] = ids of lines that 'letter' has filled
+        self.completed_lines = {letter: [] for letter in ('X', 'O')}
+        self.empty_count = len(self.board)
+        for square, spot in enumerate(self.board):
+            if spot != ' ':
+                self._add(square, spot)
+
+    def _add(self, square, letter):
+        counts = self.line_counts[letter]
+        for i in self.line_ids_through[square]:
+            counts[i] += 1
+            if counts[i] == self.k:
+                self.completed_lines[letter].append(i)
+        self.empty_count -= 1
 
     def available_moves(self):
         return [i for i, spot in enumerate(self.board) if spot == ' ']
 
+    def candidate_moves(self, radius=2):
+        """
+        Empty squares within 'radius' of a piece. On big boards the squares
+        far away from every piece are almost never worth searching.
+        Small boards fall back to available_moves(), and an empty big board
+        to the center square.
+        """
+        if len(self.board) <= 9:
+            return self.available_moves()
+        if self.empty_count == len(self.board):
+            return [(self.rows // 2) * self.cols + self.cols // 2]
+        near = set()
+        for square, spot in enumerate(self.board):
+            if spot == ' ':
+                continue
+            r, c = divmod(square, self.cols)
+            for nr in range(max(0, r - radius), min(self.rows, r + radius + 1)):
+                for nc in range(max(0, c - radius), min(self.cols, c + radius + 1)):
+                    near.add(nr * self.cols + nc)
+        return [i for i in sorted(near) if self.board[i] == ' ']
+
     def empty_squares(self):
-        return ' ' in self.board
+        return self.empty_count > 0
 
     def num_empty_squares(self):
-        return self.board.count(' ')
+        return self.empty_count
 
     def make_move(self, square, letter):
         if self.board[square] == ' ':
             self.board[square] = letter
+            self._add(square, letter)
             return True
         return False
 
-    # if using minimax_agent old comment this function
     def undo_move(self, square):
+        letter = self.board[square]
+        if letter == ' ':
+            return
         self.board[square] = ' '
+        counts = self.line_counts[letter]
+        for i in self.line_ids_through[square]:
+            if counts[i] == self.k:
+                self.completed_lines[letter].remove(i)
+            counts[i] -= 1
+        self.empty_count += 1
 
     def check_win(self, letter):
-        # Rows
-        for i in range(0, 9, 3):
-            if all([s == letter for s in self.board[i:i+3]]):
-                self.winning_line = (i, i+2)
-                return True
-        # Cols
-        for i in range(3):
-            if all([s == letter for s in [self.board[i+j*3] for j in range(3)]]): 
-                self.winning_line = (i, i+6)
+        # O(1): make_move / undo_move keep track of the completed lines
+        completed = self.completed_lines[letter]
+        if not completed:
+            return False
+        # Same priority as scanning rows, then cols, then diagonals
+        line = self.lines[min(completed)]
+        self.winning_line = (line[0], line[-1])
+        return True
+
+    def is_winning_move(self, square, letter):
+        # Would putting 'letter' on this (empty) square complete a line?
+        counts = self.line_counts[letter]
+        for i in self.line_ids_through[square]:
+            if counts[i] == self.k - 1:
                 return True
-        # Diagonals
-        if self.board[0] == letter and self.board[4] == letter and self.board[8] == letter:
-            self.winning_line = (0, 8)
-            return True
-        if self.board[2] == letter and self.board[4] == letter and self.board[6] == letter:
-            self.winning_line = (2, 6)
-            return True
         return False
 
     def check_draw(self):
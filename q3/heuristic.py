@@ -0,0 +1,30 @@
+# =============================================================================
+# HEURISTIC EVALUATION (for depth-limited search on big boards)
+# =============================================================================
+# On 4x4, 5x5 or 15x15 boards the search cannot reach the end of the game,
+# so positions at the depth limit are scored by looking at the win lines:
+#   - a line holding pieces of both players can never be won: worth nothing
+#   - a line holding only my pieces is worth more the fuller it is
+#     (WEIGHT ** count, so one line with 3 beats three lines with 1 each)
+#   - a line holding only the opponent's pieces counts against me
+# The line counters are kept up to date by TicTacToe.make_move / undo_move,
+# so this is one pass over the line table, with no board scanning.
+
+WEIGHT = 4
+
+
+def evaluate(game, letter):
+    """
+    Returns a score in (-1, 1) for 'letter': positive is good for 'letter'.
+    Callers scale it to stay below their win score.
+    """
+    mine = game.line_counts[letter]
+    theirs = game.line_counts['O' if letter == 'X' else 'X']
+    score = 0
+    for a, b in zip(mine, theirs):
+        if a and not b:
+            score += WEIGHT ** a
+        elif b and not a:
+            score -= WEIGHT ** b
+    # Every line counts less than a full line (WEIGHT ** k), so |score| < 1
+    return score / (len(game.lines) * WEIGHT ** game.k + 1)
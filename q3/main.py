@@ -1,47 +1,50 @@
 import pygame
 import sys
 import constants
+from ai_worker import AIWorker
 from game_logic import TicTacToe
-from minimax_agent import get_best_move
 
 # --- PYGAME DRAWING TRIGGERS ---
 
 def draw_lines(screen):
     # Horizontal
-    pygame.draw.line(screen, constants.LINE_COLOR, (0, constants.SQUARE_SIZE), (constants.WIDTH, constants.SQUARE_SIZE), constants.LINE_WIDTH)
-    pygame.draw.line(screen, constants.LINE_COLOR, (0, 2 * constants.SQUARE_SIZE), (constants.WIDTH, 2 * constants.SQUARE_SIZE), constants.LINE_WIDTH)
+    for row in range(1, constants.BOARD_ROWS):
+        pygame.draw.line(screen, constants.LINE_COLOR, (0, row * constants.SQUARE_SIZE), (constants.WIDTH, row * constants.SQUARE_SIZE), constants.LINE_WIDTH)
     # Vertical
-    pygame.draw.line(screen, constants.LINE_COLOR, (constants.SQUARE_SIZE, 0), (constants.SQUARE_SIZE, constants.HEIGHT), constants.LINE_WIDTH)
-    pygame.draw.line(screen, constants.LINE_COLOR, (2 * constants.SQUARE_SIZE, 0), (2 * constants.SQUARE_SIZE, constants.HEIGHT), constants.LINE_WIDTH)
+    for col in range(1, constants.BOARD_COLS):
+        pygame.draw.line(screen, constants.LINE_COLOR, (col * constants.SQUARE_SIZE, 0), (col * constants.SQUARE_SIZE, constants.HEIGHT), constants.LINE_WIDTH)
 
-def draw_figures(screen, game):
-    for i in range(9):
+def draw_piece(surface, letter, row, col):
+    x_pos = col * constants.SQUARE_SIZE + constants.SQUARE_SIZE // 2
+    y_pos = row * constants.SQUARE_SIZE + constants.SQUARE_SIZE // 2
+
+    if letter == 'O':
+        pygame.draw.circle(surface, constants.CIRCLE_COLOR, (x_pos, y_pos), constants.CIRCLE_RADIUS, constants.CIRCLE_WIDTH)
+    elif letter == 'X':
+        # Descending line
+        pygame.draw.line(surface, constants.CROSS_COLOR, 
+                         (col * constants.SQUARE_SIZE + constants.SPACE, row * constants.SQUARE_SIZE + constants.SPACE), 
+                         (col * constants.SQUARE_SIZE + constants.SQUARE_SIZE - constants.SPACE, row * constants.SQUARE_SIZE + constants.SQUARE_SIZE - constants.SPACE), constants.CROSS_WIDTH)
+        # Ascending line
+        pygame.draw.line(surface, constants.CROSS_COLOR, 
+                         (col * constants.SQUARE_SIZE + constants.SPACE, row * constants.SQUARE_SIZE + constants.SQUARE_SIZE - constants.SPACE), 
+                         (col * constants.SQUARE_SIZE + constants.SQUARE_SIZE - constants.SPACE, row * constants.SQUARE_SIZE + constants.SPACE), constants.CROSS_WIDTH)
+
+def draw_figures(screen, game, pieces):
+    for i in range(len(game.board)):
         val = game.board[i]
         if val == ' ': continue
         
         # Grid coords
-        row = i // 3
-        col = i % 3
-        x_pos = col * constants.SQUARE_SIZE + constants.SQUARE_SIZE // 2
-        y_pos = row * constants.SQUARE_SIZE + constants.SQUARE_SIZE // 2
-        
-        if val == 'O':
-            pygame.draw.circle(screen, constants.CIRCLE_COLOR, (x_pos, y_pos), constants.CIRCLE_RADIUS, constants.CIRCLE_WIDTH)
-        elif val == 'X':
-            # Descending line
-            pygame.draw.line(screen, constants.CROSS_COLOR, 
-                             (col * constants.SQUARE_SIZE + constants.SPACE, row * constants.SQUARE_SIZE + constants.SPACE), 
-                             (col * constants.SQUARE_SIZE + constants.SQUARE_SIZE - constants.SPACE, row * constants.SQUARE_SIZE + constants.SQUARE_SIZE - constants.SPACE), constants.CROSS_WIDTH)
-            # Ascending line
-            pygame.draw.line(screen, constants.CROSS_COLOR, 
-                             (col * constants.SQUARE_SIZE + constants.SPACE, row * constants.SQUARE_SIZE + constants.SQUARE_SIZE - constants.SPACE), 
-                             (col * constants.SQUARE_SIZE + constants.SQUARE_SIZE - constants.SPACE, row * constants.SQUARE_SIZE + constants.SPACE), constants.CROSS_WIDTH)
-
-def draw_winning_line(screen, start_idx, end_idx):
+        row = i // game.cols
+        col = i % game.cols
+        screen.blit(pieces[val], (col * constants.SQUARE_SIZE, row * constants.SQUARE_SIZE))
+
+def draw_winning_line(screen, game, start_idx, end_idx):
     if start_idx is None or end_idx is None: return
 
-    row1, col1 = start_idx // 3, start_idx % 3
-    row2, col2 = end_idx // 3, end_idx % 3
+    row1, col1 = start_idx // game.cols, start_idx % game.cols
+    row2, col2 = end_idx // game.cols, end_idx % game.cols
     
     x1 = col1 * constants.SQUARE_SIZE + constants.SQUARE_SIZE // 2
     y1 = row1 * constants.SQUARE_SIZE + constants.SQUARE_SIZE // 2
@@ -50,6 +53,39 @@ def draw_winning_line(screen, start_idx, end_idx):
     
     pygame.draw.line(screen, constants.CROSS_COLOR, (x1, y1), (x2, y2), constants.WIN_LINE_WIDTH)
 
+def thinking_dots():
+    # 0-3 dots, one more every 300 ms while the AI searches
+    return pygame.time.get_ticks() // 300 % 4
+
+def draw_thinking(screen, texts, dots):
+    # "AI thinking..." in the top left corner
+    screen.blit(texts[dots], (10, 10))
+
+# --- PRE-RENDERED SURFACES (built once, only blitted every frame) ---
+
+def make_background():
+    # The empty board with its grid lines
+    background = pygame.Surface((constants.WIDTH, constants.HEIGHT))
+    background.fill(constants.BG_COLOR)
+    draw_lines(background)
+    return background
+
+def make_pieces():
+    # One X and one O on a transparent square
+    pieces = {}
+    for letter in ('X', 'O'):
+        piece = pygame.Surface((constants.SQUARE_SIZE, constants.SQUARE_SIZE), pygame.SRCALPHA)
+        draw_piece(piece, letter, 0, 0)
+        pieces[letter] = piece
+    return pieces
+
+def make_thinking_texts(font):
+    # 'AI thinking' with 0, 1, 2 and 3 dots
+    return [font.render('AI thinking' + '.' * dots, True, constants.CROSS_COLOR) for dots in range(4)]
+
+def new_game():
+    return TicTacToe(constants.BOARD_ROWS, constants.BOARD_COLS, constants.WIN_LENGTH)
+
 # --- MAIN LOOP ---
 def main():
     try:
@@ -60,18 +96,38 @@ def main():
         return
 
     screen = pygame.display.set_mode((constants.WIDTH, constants.HEIGHT))
-    pygame.display.set_caption('TIC TAC TOE - AI EXAM Q3')
-    screen.fill(constants.BG_COLOR)
-    draw_lines(screen)
+    pygame.display.set_caption('TIC TAC TOE - AI EXAM Q3 (R = restart)')
+    font = pygame.font.SysFont(None, 36)
+    clock = pygame.time.Clock()
+    background = make_background()
+    pieces = make_pieces()
+    thinking_texts = make_thinking_texts(font)
+    # What is on the screen now: (board, game over, thinking dots).
+    # The screen is only redrawn when this changes; None forces a redraw.
+    last_frame = None
     
-    game = TicTacToe()
+    # The AI searches in a separate process, so the window keeps responding
+    worker = AIWorker(constants.AI_TIME_LIMIT)
+    game = new_game()
+    ai_started = None # ticks when the AI started thinking, None when it is not its turn
     
     running = True
     while running:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                worker.close()
                 sys.exit()
 
+            if event.type == pygame.VIDEOEXPOSE:
+                # The window was uncovered and has to be painted again
+                last_frame = None
+
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_r:
+                # Restart: throw away the search for the old game
+                worker.cancel()
+                game = new_game()
+                ai_started = None
+
             if event.type == pygame.MOUSEBUTTONDOWN and not game.game_over and game.current_player == game.human:
                 mouseX = event.pos[0] # x
                 mouseY = event.pos[1] # y
@@ -79,7 +135,7 @@ def main():
                 clicked_row = int(mouseY // constants.SQUARE_SIZE)
                 clicked_col = int(mouseX // constants.SQUARE_SIZE)
                 
-                index = clicked_row * 3 + clicked_col
+                index = clicked_row * game.cols + clicked_col
                 
                 if game.available_moves() and game.make_move(index, game.human):
                    if game.check_win(game.human):
@@ -89,29 +145,50 @@ def main():
                    else:
                         game.current_player = game.ai
                 
-        # AI Turn
+        # AI Turn: start the search once, then check every frame whether it is done
         if game.current_player == game.ai and not game.game_over:
-            pygame.display.update()
-            pygame.time.wait(500) # pause
+            if ai_started is None:
+                worker.request(game)
+                ai_started = pygame.time.get_ticks()
+                best_move = None
             
-            best_move = get_best_move(game)
-            if best_move is not None:
-                game.make_move(best_move, game.ai)
-                if game.check_win(game.ai):
-                    game.game_over = True
-                elif game.check_draw():
-                    game.game_over = True
+            if worker.busy():
+                try:
+                    best_move = worker.poll()
+                except RuntimeError as e:
+                    # The worker process died: search this move here (the window
+                    # waits up to AI_TIME_LIMIT once) and start a fresh worker
+                    print(f"{e}, restarting it")
+                    from minimax_agent import get_best_move
+                    best_move = get_best_move(game, time_limit=constants.AI_TIME_LIMIT)
+                    worker.close()
+                    worker = AIWorker(constants.AI_TIME_LIMIT)
+            # Keep the short pause before the AI answers, without blocking the loop
+            if not worker.busy() and pygame.time.get_ticks() - ai_started >= constants.AI_MIN_DELAY:
+                if best_move is not None:
+                    game.make_move(best_move, game.ai)
+                    if game.check_win(game.ai):
+                        game.game_over = True
+                    elif game.check_draw():
+                        game.game_over = True
                 game.current_player = game.human
+                ai_started = None
 
-        # Drawing
-        screen.fill(constants.BG_COLOR)
-        draw_lines(screen)
-        draw_figures(screen, game)
-        
-        if game.game_over and game.winning_line:
-            draw_winning_line(screen, game.winning_line[0], game.winning_line[1])
+        # Drawing: only when something visible changed since the last frame
+        dots = thinking_dots() if ai_started is not None else None
+        frame = (tuple(game.board), game.game_over, dots)
+        if frame != last_frame:
+            screen.blit(background, (0, 0))
+            draw_figures(screen, game, pieces)
             
-        pygame.display.update()
+            if game.game_over and game.winning_line:
+                draw_winning_line(screen, game, game.winning_line[0], game.winning_line[1])
+            if dots is not None:
+                draw_thinking(screen, thinking_texts, dots)
+                
+            pygame.display.update()
+            last_frame = frame
+        clock.tick(constants.FPS)
 
 if __name__ == '__main__':
     main()
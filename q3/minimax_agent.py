@@ -1,52 +1,271 @@
 import math
 
+import book
+import heuristic
+import symmetry
+from move_ordering import KillerOrdering, FirstMoveOrdering
+from search_budget import SearchBudget, SearchTimeout
+from transposition import TranspositionTable, EXACT, LOWER, UPPER
+
+# Shared between calls, so positions solved for one AI reply are reused by the next.
+transposition_table = TranspositionTable()
+
+# Perfect-play table, loaded once at startup (None until `python book.py` is run)
+opening_book = book.load()
+
+# Utility of a won game; heuristic scores stay strictly between -WIN_SCORE and WIN_SCORE
+WIN_SCORE = 10
+
+# How a won / lost game is scored (see terminal_utility):
+#   "flat"  - always +-WIN_SCORE, so all wins look the same and the first one
+#             found is played, even if it takes longer
+#   "depth" - +-(WIN_SCORE + empty squares left), like minimax_agent_old.py:
+#             a win with more empty squares (sooner) is worth more
+#   "mate"  - +-(MATE_SCORE - plies from the root): the fastest win and the
+#             slowest loss, and lets the search skip lines that cannot beat
+#             a win it already found (mate-distance pruning)
+SCORING_MODES = ("flat", "depth", "mate")
+MATE_SCORE = 1000
+
+def default_depth(game):
+    """
+    Search depth for get_best_move(): the full game on 3x3 (None = no limit),
+    fewer plies as the board grows.
+    """
+    squares = len(game.board)
+    if squares <= 9:
+        return None
+    if squares <= 16:
+        return 6
+    if squares <= 25:
+        return 4
+    return 3
+
 # =============================================================================
 # NEW IMPLEMENTATION (Strictly Matching Pseudocode Image)
 # =============================================================================
 
-def get_best_move(game):
+def get_best_move(game, table=transposition_table, stats=None, ordering=None, max_depth=None,
+                  time_limit=None, node_limit=None, budget=None, scoring="mate"):
     """
     Entry point for the AI agent.
+    Pass table=None to search without the transposition table, and a
+    SearchStats object (search_stats.py) to record how much work was done.
+    ordering is a move ordering from move_ordering.py (default: a fresh
+    KillerOrdering for every call, so replies are deterministic).
+    max_depth limits the search in plies (default: default_depth(game));
+    positions at the limit are scored with heuristic.evaluate().
+    With a time_limit (seconds) or node_limit, the search deepens one ply
+    at a time instead (see iterative_deepening), as deep as the budget
+    allows, and max_depth is only an upper bound. A ready-made SearchBudget
+    can be passed as budget=... instead (e.g. one that can be cancelled).
+    scoring is one of SCORING_MODES.
     """
+    if scoring not in SCORING_MODES:
+        raise ValueError(f"Unknown scoring mode: {scoring}")
+    
+    # O(1) answer from the opening book when it has been built
+    if opening_book is not None:
+        move = opening_book.probe(game)
+        if move is not None:
+            return move
+    
     # Uses the new ALPHA-BETA-SEARCH function
-    best_move = alpha_beta_search(game, game.board)
+    if ordering is None:
+        ordering = KillerOrdering()
+    if budget is None and (time_limit is not None or node_limit is not None):
+        budget = SearchBudget(time_limit, node_limit)
+    if budget is not None:
+        best_move, _, _ = iterative_deepening(game, table, stats, ordering, budget, max_depth, scoring)
+        return best_move
+    if max_depth is None:
+        max_depth = default_depth(game)
+    best_move = alpha_beta_search(game, game.board, table, stats, ordering, max_depth, scoring)
     return best_move
 
-def alpha_beta_search(game, state):
+def alpha_beta_search(game, state, table=None, stats=None, ordering=None, max_depth=None, scoring="mate"):
     """
     function ALPHA-BETA-SEARCH(game, state) returns an action
     """
     # player <- game.To-MOVE(state)
     # The game logic handles turns internally, but for the root call we are the 'player' (AI - 'O')
     
+    if stats is not None:
+        stats.start()
+    
     # value, move <- MAX-VALUE(game, state, -infinity, +infinity)
-    utility, move = max_value(game, state, -math.inf, math.inf)
+    utility, move = max_value(game, state, -math.inf, math.inf, table, stats, 0, ordering, max_depth, None, scoring)
+    
+    if stats is not None:
+        stats.finish()
     
     # return move
     return move
 
-def max_value(game, state, alpha, beta):
+def iterative_deepening(game, table=None, stats=None, ordering=None, budget=None, max_depth=None,
+                        scoring="mate"):
+    """
+    Searches depth 1, 2, 3, ... until the budget runs out, and returns
+    (move, value, depth) from the last depth that finished.
+    Same idea as IDDFS (q1, case_12_iddfs): the shallow iterations are
+    cheap, and each one puts the previous best move first at the root.
+    A search that runs out of budget half-way is thrown away.
+    """
+    ordering = FirstMoveOrdering(ordering)
+    state = list(game.board)
+    
+    # Fallback when not even depth 1 finishes: the first move in search order
+    moves = game.candidate_moves()
+    best_move = ordering.order(game, moves, game.ai, 0)[0] if moves else None
+    best_value, completed = None, 0
+    
+    if stats is not None:
+        stats.start()
+    
+    depth = 1
+    while depth <= game.num_empty_squares() and (max_depth is None or depth <= max_depth):
+        if budget is not None and budget.expired():
+            break
+        ordering.move = best_move
+        try:
+            value, move = max_value(game, game.board, -math.inf, math.inf, table, stats, 0, ordering, depth, budget,
+                                    scoring)
+        except SearchTimeout:
+            game.load_board(state) # undo the moves of the abandoned search
+            break
+        if move is not None:
+            best_move, best_value, completed = move, value, depth
+        # A forced win or loss does not change with more depth, but a faster
+        # one may still turn up: stop only when every shorter line has been
+        # searched. (The table can answer a shallow search with a longer win
+        # from an earlier full-depth search.)
+        if abs(value) >= WIN_SCORE:
+            distance = win_distance(game, value, scoring)
+            if distance is not None and distance <= depth:
+                break
+            if distance is None and table is None:
+                break # flat scores: no table, so the win was found at this depth
+        depth += 1
+    
+    if stats is not None:
+        stats.finish()
+    return best_move, best_value, completed
+
+def terminal_utility(game, scoring="mate", depth=0):
+    """
+    Returns the utility of a finished game for the AI, or None if the game is not over.
+    depth is the number of plies from the root (used by "mate" scoring).
+    """
+    if game.check_win(game.ai): return win_score(game, scoring, depth)       # AI ('O') Wins
+    if game.check_win(game.human): return -win_score(game, scoring, depth)   # Human ('X') Wins
+    if not game.empty_squares(): return 0       # Draw
+    return None
+
+def win_score(game, scoring, depth):
+    if scoring == "mate":
+        return MATE_SCORE - depth
+    if scoring == "depth":
+        return WIN_SCORE + game.num_empty_squares()
+    return WIN_SCORE
+
+def win_distance(game, value, scoring):
+    """
+    Plies from the root to the end of the game for a won / lost root value,
+    or None when the scoring does not record it ("flat").
+    """
+    if scoring == "mate":
+        return MATE_SCORE - abs(value)
+    if scoring == "depth":
+        return game.num_empty_squares() - (abs(value) - WIN_SCORE)
+    return None
+
+# "mate" scores count plies from the root, but a table entry must not depend
+# on where the position was reached from: store them counted from the
+# position itself, and convert back on lookup.
+
+def to_table(value, depth, scoring):
+    if scoring == "mate" and abs(value) >= WIN_SCORE:
+        return value + depth if value > 0 else value - depth
+    return value
+
+def from_table(value, depth, scoring):
+    if scoring == "mate" and abs(value) >= WIN_SCORE:
+        return value - depth if value > 0 else value + depth
+    return value
+
+def max_value(game, state, alpha, beta, table=None, stats=None, depth=0, ordering=None, max_depth=None,
+              budget=None, scoring="mate"):
     """
     function MAX-VALUE(game, state, alpha, beta) returns a (utility, move) pair
     """
+    if stats is not None:
+        stats.visit(depth)
+    if budget is not None:
+        budget.tick() # raises SearchTimeout when the budget is used up
+    
     # if game.IS-TERMINAL(state) then return game.UTILITY(state, player), null
-    if game.check_win(game.ai): return 10, None      # AI ('O') Wins
-    if game.check_win(game.human): return -10, None  # Human ('X') Wins
-    if not game.empty_squares(): return 0, None      # Draw
+    utility = terminal_utility(game, scoring, depth)
+    if utility is not None:
+        if stats is not None:
+            stats.leaf()
+        return utility, None
+    
+    # Depth limit reached: score the position with the heuristic instead
+    if max_depth is not None and depth >= max_depth:
+        if stats is not None:
+            stats.leaf()
+        return (WIN_SCORE - 1) * heuristic.evaluate(game, game.ai), None
+    
+    # Mate-distance pruning: the best the AI can still get is a win on its
+    # next move, the worst a loss on the move after that
+    if scoring == "mate":
+        best_possible = MATE_SCORE - (depth + 1)
+        if best_possible <= alpha:
+            return best_possible, None
+        worst_possible = -(MATE_SCORE - (depth + 2))
+        if worst_possible >= beta:
+            return worst_possible, None
+    
+    # Transposition table: reuse an earlier result for this position
+    if table is not None:
+        # Plies searched below this node (math.inf = to the end of the game)
+        draft = math.inf if max_depth is None else max_depth - depth
+        key, t = table.key(game, game.ai, scoring)
+        entry = table.lookup(key, t, draft)
+        if entry is not None:
+            value, flag, move = entry
+            value = from_table(value, depth, scoring)
+            if flag == EXACT:
+                return value, move
+            # Bounds only narrow the window below the root: the root's move is
+            # the answer, and in a narrowed window a move that merely reaches
+            # the bound looks as good as the best one
+            if depth > 0:
+                if flag == LOWER:
+                    alpha = max(alpha, value)
+                elif flag == UPPER:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value, move
+        alpha_orig = alpha
     
     # v <- -infinity
     v = -math.inf
     best_move = None
     
     # for each a in game.ACTIONS(state) do
-    actions = game.available_moves()
+    actions = game.candidate_moves()
+    if table is not None and table.symmetry:
+        actions = symmetry.unique_moves(game.board, actions, game.rows, game.cols)
+    if ordering is not None:
+        actions = ordering.order(game, actions, game.ai, depth)
     
     for action in actions:
         game.make_move(action, game.ai) # Apply Action 'a'
         
         # v2, a2 <- MIN-VALUE(game, game.RESULT(state, a), alpha, beta)
         # We pass 'state' but since we modified 'game' in place, it represents the new state.
-        v2, _ = min_value(game, state, alpha, beta)
+        v2, _ = min_value(game, state, alpha, beta, table, stats, depth + 1, ordering, max_depth, budget, scoring)
         
         game.undo_move(action) # Backtrack (Restore state)
         
@@ -61,32 +280,92 @@ def max_value(game, state, alpha, beta):
         
         # if v >= beta then return v, move
         if v >= beta:
+            if stats is not None:
+                stats.beta_cutoff(depth)
+            if ordering is not None:
+                ordering.cutoff(best_move, game.ai, depth, len(actions))
+            if table is not None:
+                table.store(key, to_table(v, depth, scoring), LOWER, best_move, t, draft)
             return v, best_move
             
+    if table is not None:
+        table.store(key, to_table(v, depth, scoring), UPPER if v <= alpha_orig else EXACT, best_move, t, draft)
+    
     # return v, move
     return v, best_move
 
-def min_value(game, state, alpha, beta):
+def min_value(game, state, alpha, beta, table=None, stats=None, depth=0, ordering=None, max_depth=None,
+              budget=None, scoring="mate"):
     """
     function MIN-VALUE(game, state, alpha, beta) returns a (utility, move) pair
     """
+    if stats is not None:
+        stats.visit(depth)
+    if budget is not None:
+        budget.tick() # raises SearchTimeout when the budget is used up
+    
     # if game.IS-TERMINAL(state) then return game.UTILITY(state, player), null
-    if game.check_win(game.ai): return 10, None
-    if game.check_win(game.human): return -10, None
-    if not game.empty_squares(): return 0, None
+    utility = terminal_utility(game, scoring, depth)
+    if utility is not None:
+        if stats is not None:
+            stats.leaf()
+        return utility, None
+    
+    # Depth limit reached: score the position with the heuristic instead
+    if max_depth is not None and depth >= max_depth:
+        if stats is not None:
+            stats.leaf()
+        return (WIN_SCORE - 1) * heuristic.evaluate(game, game.ai), None
+    
+    # Mate-distance pruning: the best the human can still get is a win on
+    # their next move, the worst a loss on the move after that
+    if scoring == "mate":
+        best_possible = -(MATE_SCORE - (depth + 1))
+        if best_possible >= beta:
+            return best_possible, None
+        worst_possible = MATE_SCORE - (depth + 2)
+        if worst_possible <= alpha:
+            return worst_possible, None
+    
+    # Transposition table: reuse an earlier result for this position
+    if table is not None:
+        # Plies searched below this node (math.inf = to the end of the game)
+        draft = math.inf if max_depth is None else max_depth - depth
+        key, t = table.key(game, game.human, scoring)
+        entry = table.lookup(key, t, draft)
+        if entry is not None:
+            value, flag, move = entry
+            value = from_table(value, depth, scoring)
+            if flag == EXACT:
+                return value, move
+            # Bounds only narrow the window below the root: the root's move is
+            # the answer, and in a narrowed window a move that merely reaches
+            # the bound looks as good as the best one
+            if depth > 0:
+                if flag == LOWER:
+                    alpha = max(alpha, value)
+                elif flag == UPPER:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value, move
+        beta_orig = beta
     
     # v <- +infinity
     v = math.inf
     best_move = None
     
     # for each a in game.ACTIONS(state) do
-    actions = game.available_moves()
+    actions = game.candidate_moves()
+    if table is not None and table.symmetry:
+        actions = symmetry.unique_moves(game.board, actions, game.rows, game.cols)
+    if ordering is not None:
+        actions = ordering.order(game, actions, game.human, depth)
     
     for action in actions:
         game.make_move(action, game.human) # Apply Action 'a' (Human turn)
         
         # v2, a2 <- MAX-VALUE(game, game.RESULT(state, a), alpha, beta)
-        v2, _ = max_value(game, state, alpha, beta)
+        v2, _ = max_value(game, state, alpha, beta, table, stats, depth + 1, ordering, max_depth, budget, scoring)
         
         game.undo_move(action)
         
@@ -101,8 +380,17 @@ def min_value(game, state, alpha, beta):
             
         # if v <= alpha then return v, move
         if v <= alpha:
+            if stats is not None:
+                stats.alpha_cutoff(depth)
+            if ordering is not None:
+                ordering.cutoff(best_move, game.human, depth, len(actions))
+            if table is not None:
+                table.store(key, to_table(v, depth, scoring), UPPER, best_move, t, draft)
             return v, best_move
             
+    if table is not None:
+        table.store(key, to_table(v, depth, scoring), LOWER if v >= beta_orig else EXACT, best_move, t, draft)
+    
     # return v, move
     return v, best_move
 
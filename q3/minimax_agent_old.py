@@ -1,6 +1,8 @@
 import math
 
-def minimax(game, depth, maximizing_player, alpha=-math.inf, beta=math.inf):
+import heuristic
+
+def minimax(game, depth, maximizing_player, alpha=-math.inf, beta=math.inf, max_depth=None, stats=None):
     """
     Minimax algorithm with Alpha-Beta Pruning.
     EXAM PSEUDOCODE MAPPING:
@@ -33,29 +35,46 @@ def minimax(game, depth, maximizing_player, alpha=-math.inf, beta=math.inf):
     
     - if maximizing_player is True: Acts as MAX-VALUE(game, state)
     - if maximizing_player is False: Acts as MIN-VALUE(game, state)
+    
+    depth counts the plies played so far; with max_depth set, positions at
+    that depth return the heuristic value of the node (heuristic.py), which
+    is always smaller than a win (at least 1 here).
+    
+    stats is an optional SearchStats (search_stats.py) counting the nodes.
     """
+    if stats is not None:
+        stats.visit(depth)
     
     # --- 1. TERMINATION (BASE) CONDITIONS ---
     # Equivalent to: if game.IS-TERMINAL(state) then return game.UTILITY(state, player)
     if game.check_win(game.ai):
-        return 1 * (game.num_empty_squares() + 1)
+        utility = 1 * (game.num_empty_squares() + 1)
     elif game.check_win(game.human):
-        return -1 * (game.num_empty_squares() + 1)
+        utility = -1 * (game.num_empty_squares() + 1)
     elif not game.empty_squares():
-        return 0
+        utility = 0
+    # Equivalent to: if depth = 0 then return the heuristic value of node
+    elif max_depth is not None and depth >= max_depth:
+        utility = heuristic.evaluate(game, game.ai)
+    else:
+        utility = None
+    if utility is not None:
+        if stats is not None:
+            stats.leaf()
+        return utility
 
     # --- 2. RECURSIVE STEP (MAX-VALUE) ---
     if maximizing_player:
         max_eval = -math.inf
-        for move in game.available_moves():
+        for move in game.candidate_moves():
             # Simulate (game.RESULT)
-            game.board[move] = game.ai
+            game.make_move(move, game.ai)
             
             # Recursive call (MIN-VALUE)
-            eval = minimax(game, depth + 1, False, alpha, beta)
+            eval = minimax(game, depth + 1, False, alpha, beta, max_depth, stats)
             
             # Backtrack
-            game.board[move] = ' ' 
+            game.undo_move(move)
             
             # Logic: v = max(v, v2)
             max_eval = max(max_eval, eval)
@@ -69,15 +88,15 @@ def minimax(game, depth, maximizing_player, alpha=-math.inf, beta=math.inf):
     # --- 3. RECURSIVE STEP (MIN-VALUE) ---
     else:
         min_eval = math.inf
-        for move in game.available_moves():
+        for move in game.candidate_moves():
             # Simulate (game.RESULT)
-            game.board[move] = game.human
+            game.make_move(move, game.human)
             
             # Recursive call (MAX-VALUE)
-            eval = minimax(game, depth + 1, True, alpha, beta)
+            eval = minimax(game, depth + 1, True, alpha, beta, max_depth, stats)
             
             # Backtrack
-            game.board[move] = ' ' 
+            game.undo_move(move)
             
             # Logic: v = min(v, v2)
             min_eval = min(min_eval, eval)
@@ -88,18 +107,25 @@ def minimax(game, depth, maximizing_player, alpha=-math.inf, beta=math.inf):
                 break 
         return min_eval
 
-def get_best_move(game):
+def get_best_move(game, max_depth=None, stats=None):
     """
     Determines the best move for the AI using Minimax.
+    Pass max_depth (in plies, counting the AI's move) on boards too big to
+    search to the end, and a SearchStats object to count the work done.
     """
     best_score = -math.inf
     best_move = None
     
-    for move in game.available_moves():
-        game.board[move] = game.ai
-        score = minimax(game, 0, False)
-        game.board[move] = ' ' # Undo move
+    if stats is not None:
+        stats.start()
+        stats.visit(0)
+    for move in game.candidate_moves():
+        game.make_move(move, game.ai)
+        score = minimax(game, 1, False, max_depth=max_depth, stats=stats)
+        game.undo_move(move) # Undo move
         if score > best_score:
             best_score = score
             best_move = move
+    if stats is not None:
+        stats.finish()
     return best_move
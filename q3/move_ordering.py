@@ -0,0 +1,152 @@
+# =============================================================================
+# MOVE ORDERING
+# =============================================================================
+# Alpha-beta prunes more when the best move is searched first. These
+# orderings are plugged into max_value / min_value with ordering=...
+#
+# Every ordering has the same two methods:
+#   order(game, moves, letter, depth) -> moves sorted best-first
+#   cutoff(move, letter, depth, num_moves) -> called when 'move' caused a cutoff
+#
+# Ties are always broken by the static rank, so the order never depends on
+# set or dict iteration order (and therefore not on PYTHONHASHSEED).
+#
+# The board is only read through two hooks, rank(game) and
+# is_winning(game, move, letter), so q3_new/ordering.py reuses these classes
+# on its own board representation by overriding just those two. game_logic
+# is only imported when a TicTacToe board needs its rank, so loading this
+# module from q3_new does not pull it in.
+
+# Center first, then corners, then edges
+STATIC_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+STATIC_RANK = {square: rank for rank, square in enumerate(STATIC_ORDER)}
+
+_STATIC_RANKS = {(3, 3, 3): STATIC_RANK}
+
+def static_rank(game):
+    """
+    Returns {square: rank} for the game's board size: squares on more win
+    lines first, then closer to the center, then by index.
+    On 3x3 this is STATIC_ORDER (center, corners, edges).
+    """
+    size = (game.rows, game.cols, game.k)
+    if size not in _STATIC_RANKS:
+        from game_logic import line_tables
+        rows, cols, k = size
+        through = line_tables(rows, cols, k)[1]
+        def key(square):
+            r, c = divmod(square, cols)
+            # Doubled so the center of an even board stays an integer
+            distance = (2 * r - rows + 1) ** 2 + (2 * c - cols + 1) ** 2
+            return (-len(through[square]), distance, square)
+        order = sorted(range(rows * cols), key=key)
+        _STATIC_RANKS[size] = {square: rank for rank, square in enumerate(order)}
+    return _STATIC_RANKS[size]
+
+
+def other(letter):
+    return 'O' if letter == 'X' else 'X'
+
+
+class StaticOrdering:
+    """Center, corners, edges."""
+    def rank(self, game):
+        """{move: rank} of the static order (lower first)."""
+        return static_rank(game)
+
+    def is_winning(self, game, move, letter):
+        return game.is_winning_move(move, letter)
+
+    def order(self, game, moves, letter, depth):
+        return sorted(moves, key=self.rank(game).__getitem__)
+
+    def cutoff(self, move, letter, depth, num_moves):
+        pass
+
+
+class TacticalOrdering(StaticOrdering):
+    """Immediate wins first, then blocks of the opponent's wins, then static order."""
+    def group(self, game, move, letter, depth):
+        if self.is_winning(game, move, letter):
+            return 0
+        if self.is_winning(game, move, other(letter)):
+            return 1
+        return 2
+
+    def order(self, game, moves, letter, depth):
+        rank = self.rank(game)
+        return sorted(moves, key=lambda move: (self.group(game, move, letter, depth), rank[move]))
+
+
+class KillerOrdering(TacticalOrdering):
+    """
+    Wins, blocks, then killer moves, then static order.
+    Killer moves are the last moves that caused a cutoff at the same depth:
+    sibling positions are usually refuted by the same move.
+    """
+    def __init__(self, num_killers=2):
+        self.num_killers = num_killers
+        self.killers = {} # depth -> [move, ...] (most recent first)
+
+    def group(self, game, move, letter, depth):
+        group = super().group(game, move, letter, depth)
+        if group < 2:
+            return group
+        killers = self.killers.get(depth, ())
+        if move in killers:
+            return 2 + killers.index(move)
+        return 2 + self.num_killers
+
+    def cutoff(self, move, letter, depth, num_moves):
+        killers = self.killers.setdefault(depth, [])
+        if move in killers:
+            killers.remove(move)
+        killers.insert(0, move)
+        del killers[self.num_killers:]
+
+
+class HistoryOrdering(KillerOrdering):
+    """
+    KillerOrdering, but the remaining moves are sorted by the history
+    heuristic: how much cutoff work each move has saved for this player
+    anywhere in the tree (cutoffs with more siblings count more).
+    On 3x3 the static order is already very good, so this mostly pays off
+    on bigger boards.
+    """
+    def __init__(self, num_killers=2):
+        super().__init__(num_killers)
+        self.history = {} # (letter, move) -> score
+
+    def order(self, game, moves, letter, depth):
+        rank = self.rank(game)
+        def key(move):
+            return (self.group(game, move, letter, depth),
+                    -self.history.get((letter, move), 0),
+                    rank[move])
+        return sorted(moves, key=key)
+
+    def cutoff(self, move, letter, depth, num_moves):
+        super().cutoff(move, letter, depth, num_moves)
+        self.history[(letter, move)] = self.history.get((letter, move), 0) + num_moves * num_moves
+
+
+class FirstMoveOrdering:
+    """
+    Wraps another ordering and searches 'move' first at the root.
+    Iterative deepening sets 'move' to the best move of the previous
+    iteration, which is usually still the best one a ply deeper.
+    """
+    def __init__(self, ordering, move=None):
+        self.ordering = ordering
+        self.move = move
+
+    def order(self, game, moves, letter, depth):
+        if self.ordering is not None:
+            moves = self.ordering.order(game, moves, letter, depth)
+        if depth == 0 and self.move in moves:
+            moves = [self.move] + [move for move in moves if move != self.move]
+        return moves
+
+    def cutoff(self, move, letter, depth, num_moves):
+        if self.ordering is not None:
+            self.ordering.cutoff(move, letter, depth, num_moves)
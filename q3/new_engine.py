@@ -0,0 +1,26 @@
+import importlib.util
+import os
+import sys
+
+# =============================================================================
+# q3_new's ENGINE, LOADED FROM q3
+# =============================================================================
+# selfplay.py and benchmark_suite.py play and time q3_new/tictactoe.py next to
+# the q3 agents. Both folders have a tictactoe.py (q3's holds notes only), so
+# q3_new's is loaded here by path under its own name, q3_new_tictactoe, and
+# "import tictactoe" keeps meaning whatever it meant before, in scripts and
+# under pytest alike.
+#
+#   from new_engine import tictactoe as ttt_new
+#
+# q3_new is appended to sys.path, not inserted, so its tictactoe.py can find
+# bitboard, opening_book and ordering without shadowing anything in q3.
+
+Q3_NEW = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "q3_new"))
+if Q3_NEW not in sys.path:
+    sys.path.append(Q3_NEW)
+
+_spec = importlib.util.spec_from_file_location("q3_new_tictactoe", os.path.join(Q3_NEW, "tictactoe.py"))
+tictactoe = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = tictactoe
+_spec.loader.exec_module(tictactoe)
@@ -0,0 +1,52 @@
+import time
+
+# =============================================================================
+# SEARCH BUDGET
+# =============================================================================
+# Limits how long one search may run, in seconds and/or nodes. Pass it to
+# max_value / min_value with budget=...; every node calls tick(), which
+# raises SearchTimeout once the budget is used up. The search is then
+# abandoned and iterative_deepening() (minimax_agent.py) falls back to the
+# move from the last depth it completed.
+#
+# should_stop is an optional callback() -> bool for stopping from outside,
+# e.g. when the player closes the window while the AI is thinking.
+#
+# The clock (and should_stop) is only checked every CHECK_EVERY nodes, so
+# tick() stays cheap.
+
+CHECK_EVERY = 256
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class SearchBudget:
+    def __init__(self, time_limit=None, node_limit=None, should_stop=None):
+        self.time_limit = time_limit   # seconds, or None
+        self.node_limit = node_limit   # nodes, or None
+        self.should_stop = should_stop # callback() -> True to stop, or None
+        self.start()
+
+    def start(self):
+        self.nodes = 0
+        self.deadline = None if self.time_limit is None else time.perf_counter() + self.time_limit
+
+    def tick(self):
+        self.nodes += 1
+        if self.node_limit is not None and self.nodes > self.node_limit:
+            raise SearchTimeout()
+        if self.nodes % CHECK_EVERY == 0:
+            if self.deadline is not None and time.perf_counter() >= self.deadline:
+                raise SearchTimeout()
+            if self.should_stop is not None and self.should_stop():
+                raise SearchTimeout()
+
+    def expired(self):
+        """True when the budget is already used up (checked between iterations)."""
+        if self.node_limit is not None and self.nodes >= self.node_limit:
+            return True
+        if self.should_stop is not None and self.should_stop():
+            return True
+        return self.deadline is not None and time.perf_counter() >= self.deadline
@@ -0,0 +1,69 @@
+import time
+from collections import defaultdict
+
+# =============================================================================
+# SEARCH STATISTICS
+# =============================================================================
+# Pass a SearchStats object to get_best_move() / alpha_beta_search() to see
+# how much work the search did. When stats is None (the default) the search
+# only pays for one 'is not None' check per node.
+#
+# Depth is counted from the root (root = 0). A "beta cutoff" happens in
+# MAX-VALUE (v >= beta) and an "alpha cutoff" in MIN-VALUE (v <= alpha).
+
+class SearchStats:
+    def __init__(self, on_search=None):
+        self.on_search = on_search # optional callback(stats) after every search
+        self.reset()
+
+    def reset(self):
+        self.nodes = 0
+        self.leaves = 0
+        self.max_depth = 0
+        self.beta_cutoffs = defaultdict(int)  # depth -> count
+        self.alpha_cutoffs = defaultdict(int) # depth -> count
+        self.calls = []                       # (nodes, seconds) for every search
+        self._start_nodes = 0
+        self._start_time = None
+
+    # --- Called by the search ---
+
+    def start(self):
+        self._start_nodes = self.nodes
+        self._start_time = time.perf_counter()
+
+    def finish(self):
+        elapsed = time.perf_counter() - self._start_time
+        self.calls.append((self.nodes - self._start_nodes, elapsed))
+        if self.on_search is not None:
+            self.on_search(self)
+
+    def visit(self, depth):
+        self.nodes += 1
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def leaf(self):
+        self.leaves += 1
+
+    def beta_cutoff(self, depth):
+        self.beta_cutoffs[depth] += 1
+
+    def alpha_cutoff(self, depth):
+        self.alpha_cutoffs[depth] += 1
+
+    # --- Reporting ---
+
+    def total_cutoffs(self):
+        return sum(self.beta_cutoffs.values()) + sum(self.alpha_cutoffs.values())
+
+    def total_time(self):
+        return sum(seconds for _, seconds in self.calls)
+
+    def __str__(self):
+        lines = [f"searches: {len(self.calls)}  nodes: {self.nodes}  leaves: {self.leaves}  "
+                 f"max depth: {self.max_depth}  time: {self.total_time() * 1000:.1f} ms"]
+        for depth in sorted(set(self.beta_cutoffs) | set(self.alpha_cutoffs)):
+            lines.append(f"  depth {depth}: beta cutoffs {self.beta_cutoffs[depth]}, "
+                         f"alpha cutoffs {self.alpha_cutoffs[depth]}")
+        return "\n".join(lines)
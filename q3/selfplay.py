@@ -0,0 +1,213 @@
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+import minimax_agent
+import minimax_agent_old
+from game_logic import TicTacToe
+from new_engine import tictactoe as ttt_new
+from transposition import TranspositionTable
+
+# =============================================================================
+# HEADLESS SELF-PLAY
+# =============================================================================
+# Plays agent-vs-agent games of classic 3x3 Tic Tac Toe without a window,
+# spread over a process pool. Every finished game is written as one JSON
+# line, and a summary (win / draw / loss rates, moves per second of thinking
+# for each agent) is printed at the end.
+#
+#   python selfplay.py alphabeta random -n 200 --workers 4 --out games.jsonl
+#
+# The two agents swap colors every game (X moves first). Games are seeded,
+# so a run can be repeated exactly.
+
+def other(letter):
+    return 'O' if letter == 'X' else 'X'
+
+
+# --- AGENTS ---
+# An agent is created for one side of one game, and move(game) returns the
+# square (0-8) it plays for its letter.
+
+class AlphaBetaAgent:
+    """q3/minimax_agent.py"""
+    def __init__(self, letter, rng):
+        self.letter = letter
+        # Own table: stored values are from this agent's point of view
+        self.table = TranspositionTable()
+
+    def move(self, game):
+        game.ai, game.human = self.letter, other(self.letter)
+        return minimax_agent.get_best_move(game, self.table)
+
+
+class OldMinimaxAgent:
+    """q3/minimax_agent_old.py"""
+    def __init__(self, letter, rng):
+        self.letter = letter
+
+    def move(self, game):
+        game.ai, game.human = self.letter, other(self.letter)
+        return minimax_agent_old.get_best_move(game)
+
+
+class RandomAgent:
+    def __init__(self, letter, rng):
+        self.rng = rng
+
+    def move(self, game):
+        return self.rng.choice(game.available_moves())
+
+
+class NewMinimaxAgent:
+    """q3_new/tictactoe.py (finds the side to move from the board itself)"""
+    def __init__(self, letter, rng):
+        pass
+
+    def move(self, game):
+        board = [[None if game.board[3 * i + j] == ' ' else game.board[3 * i + j] for j in range(3)]
+                 for i in range(3)]
+        i, j = ttt_new.minimax(board)
+        return 3 * i + j
+
+
+AGENTS = {
+    "alphabeta": AlphaBetaAgent,
+    "old": OldMinimaxAgent,
+    "random": RandomAgent,
+    "new": NewMinimaxAgent,
+}
+
+
+# --- PLAYING ---
+
+def play_game(task):
+    """
+    Plays one game. task = (game number, X agent name, O agent name, seed).
+    Returns the game record (a JSON-friendly dict).
+    """
+    number, x_name, o_name, seed = task
+    rng = random.Random(seed)
+    names = {'X': x_name, 'O': o_name}
+    agents = {letter: AGENTS[name](letter, rng) for letter, name in names.items()}
+    thinking = {'X': 0.0, 'O': 0.0}
+
+    game = TicTacToe()
+    moves = []
+    letter = 'X'
+    winner = None
+    while True:
+        start = time.perf_counter()
+        square = agents[letter].move(game)
+        thinking[letter] += time.perf_counter() - start
+        if square is None or not game.make_move(square, letter):
+            raise RuntimeError(f"{names[letter]} played an illegal move {square} on {game.board}")
+        moves.append(square)
+        if game.check_win(letter):
+            winner = letter
+            break
+        if game.check_draw():
+            break
+        letter = other(letter)
+
+    return {
+        "game": number,
+        "seed": seed,
+        "x": x_name,
+        "o": o_name,
+        "winner": winner,
+        "moves": moves,
+        "seconds": thinking,
+    }
+
+
+def tasks(agent1, agent2, games, seed):
+    # agent1 plays X in the even games, O in the odd ones
+    for number in range(games):
+        x_name, o_name = (agent1, agent2) if number % 2 == 0 else (agent2, agent1)
+        yield number, x_name, o_name, seed + number
+
+
+def run(agent1, agent2, games, workers=None, out=None, seed=0):
+    """
+    Plays 'games' games (in a pool of 'workers' processes), writes them as
+    JSON lines to 'out' (a file object, or None) as they finish, and returns
+    the summary dict.
+    """
+    summary = {
+        "games": 0,
+        "results": {agent1: {"win": 0, "draw": 0, "loss": 0},
+                    agent2: {"win": 0, "draw": 0, "loss": 0}},
+        "moves": {agent1: 0, agent2: 0},
+        "seconds": {agent1: 0.0, agent2: 0.0},
+    }
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers) as pool:
+        for record in pool.imap_unordered(play_game, tasks(agent1, agent2, games, seed)):
+            if out is not None:
+                out.write(json.dumps(record) + "\n")
+                out.flush()
+            add_to_summary(summary, record, agent1, agent2)
+    summary["wall_seconds"] = time.perf_counter() - start
+    return summary
+
+
+def add_to_summary(summary, record, agent1, agent2):
+    summary["games"] += 1
+    for letter in ('X', 'O'):
+        name = record[letter.lower()]
+        # Self-play (same agent on both sides) is counted from X's side only
+        if letter == 'O' and agent1 == agent2:
+            continue
+        if record["winner"] is None:
+            summary["results"][name]["draw"] += 1
+        elif record["winner"] == letter:
+            summary["results"][name]["win"] += 1
+        else:
+            summary["results"][name]["loss"] += 1
+    for letter in ('X', 'O'):
+        name = record[letter.lower()]
+        # X makes the first, third, ... move
+        summary["moves"][name] += len(record["moves"][0 if letter == 'X' else 1::2])
+        summary["seconds"][name] += record["seconds"][letter]
+
+
+def print_summary(summary, file=sys.stdout):
+    games = summary["games"]
+    print(f"{games} games in {summary['wall_seconds']:.1f} s", file=file)
+    print(f"{'agent':<12}{'win':>8}{'draw':>8}{'loss':>8}{'moves/s':>12}", file=file)
+    for name, results in summary["results"].items():
+        total = sum(results.values()) or 1
+        seconds = summary["seconds"][name]
+        rate = summary["moves"][name] / seconds if seconds else float("inf")
+        print(f"{name:<12}{results['win'] / total:>8.1%}{results['draw'] / total:>8.1%}"
+              f"{results['loss'] / total:>8.1%}{rate:>12.0f}", file=file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless agent-vs-agent Tic Tac Toe.")
+    parser.add_argument("agent1", choices=sorted(AGENTS))
+    parser.add_argument("agent2", choices=sorted(AGENTS))
+    parser.add_argument("-n", "--games", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: one per CPU)")
+    parser.add_argument("--out", help="JSON lines file for the game records (default: stdout)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    out = open(args.out, "w") if args.out else sys.stdout
+    try:
+        summary = run(args.agent1, args.agent2, args.games, args.workers, out, args.seed)
+    finally:
+        if args.out:
+            out.close()
+    # Keep stdout pure JSON lines when the records go there
+    print_summary(summary, sys.stdout if args.out else sys.stderr)
+    return summary
+
+
+if __name__ == '__main__':
+    main()
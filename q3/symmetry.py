@@ -0,0 +1,140 @@
+import math
+
+# =============================================================================
+# BOARD SYMMETRY (the 8 rotations / reflections of the square, group D4)
+# =============================================================================
+# Rotating or mirroring a board does not change its minimax value, so all 8
+# versions of a position can share one cache entry. We pick the smallest of
+# the 8 as the "canonical" board and remember which transform produced it,
+# so a move stored in canonical coordinates can be mapped back.
+#
+# Works for any rows x cols board (the win lines of an m,n,k game map onto
+# each other the same way). Rectangular boards only have 4 symmetries.
+
+def _perm(f, rows=3, cols=3):
+    # PERMS[t][n] = where square n ends up under transform t
+    return tuple(r * cols + c for r, c in (f(n // cols, n % cols) for n in range(rows * cols)))
+
+
+def _transforms(rows, cols):
+    # (index, f) pairs: all 8 on a square board, only the 4 that keep the
+    # shape (identity, rotate 180, mirrors) on a rectangular one
+    R, C = rows - 1, cols - 1
+    transforms = [
+        (0, lambda r, c: (r, c)),          # identity
+        (1, lambda r, c: (c, R - r)),      # rotate 90
+        (2, lambda r, c: (R - r, C - c)),  # rotate 180
+        (3, lambda r, c: (C - c, r)),      # rotate 270
+        (4, lambda r, c: (r, C - c)),      # mirror left-right
+        (5, lambda r, c: (R - r, c)),      # mirror top-bottom
+        (6, lambda r, c: (c, r)),          # main diagonal
+        (7, lambda r, c: (C - c, R - r)),  # anti diagonal
+    ]
+    if rows != cols:
+        transforms = [transforms[i] for i in (0, 2, 4, 5)]
+    return transforms
+
+
+_TABLES = {}
+
+def tables(rows=3, cols=3):
+    """
+    Returns (perms, inverse) for a board size, built once per size.
+    perms[t][n] = where square n ends up under transform t,
+    inverse[t][n] = which square ends up on n.
+    Transform numbers are the same on every board size; on rectangular
+    boards the missing ones (rotate 90 / 270, diagonals) are None.
+    """
+    if (rows, cols) not in _TABLES:
+        perms = [None] * 8
+        inverse = [None] * 8
+        for t, f in _transforms(rows, cols):
+            perms[t] = _perm(f, rows, cols)
+            inverse[t] = tuple(perms[t].index(n) for n in range(rows * cols))
+        _TABLES[(rows, cols)] = (tuple(perms), tuple(inverse))
+    return _TABLES[(rows, cols)]
+
+# The 3x3 tables
+PERMS, INVERSE = tables(3, 3)
+
+IDENTITY = 0
+
+
+def transform(board, t, rows=3, cols=3):
+    """
+    Returns the board (as a tuple) after applying transform t.
+    """
+    inverse = tables(rows, cols)[1][t]
+    return tuple(board[inverse[n]] for n in range(rows * cols))
+
+
+def canonical(board, rows=3, cols=3):
+    """
+    Returns (canonical_board, t): the smallest of the transformed boards
+    and the transform that produces it.
+    """
+    best = tuple(board)
+    best_t = IDENTITY
+    for t, inverse in enumerate(tables(rows, cols)[1]):
+        if t == IDENTITY or inverse is None:
+            continue
+        candidate = tuple(board[i] for i in inverse)
+        if candidate < best:
+            best = candidate
+            best_t = t
+    return best, best_t
+
+
+def to_canonical(move, t, rows=3, cols=3):
+    """Maps a square on the real board to the canonical board."""
+    return None if move is None else tables(rows, cols)[0][t][move]
+
+
+def from_canonical(move, t, rows=3, cols=3):
+    """Maps a square on the canonical board back to the real board."""
+    return None if move is None else tables(rows, cols)[1][t][move]
+
+
+def unique_moves(board, moves, rows=3, cols=3):
+    """
+    Drops moves that are mirror images of an earlier move on a symmetric
+    board. The empty board goes from 9 moves to 3 (corner, edge, center).
+    """
+    key = tuple(board)
+    perms, inverse = tables(rows, cols)
+    stabilizer = [perms[t] for t in range(1, 8)
+                  if perms[t] is not None and tuple(key[i] for i in inverse[t]) == key]
+    if not stabilizer:
+        return moves
+    # Keep the smallest square of every orbit
+    return [m for m in moves if all(p[m] >= m for p in stabilizer)]
+
+
+# --- BENCHMARK ---
+
+def benchmark():
+    from game_logic import TicTacToe
+    from minimax_agent import max_value, min_value
+    from search_stats import SearchStats
+    from transposition import TranspositionTable
+
+    print(f"{'position':<14}{'mode':<22}{'nodes':>8}{'entries':>9}{'ms':>9}")
+    openings = [("empty board", []), ("X corner", [0]), ("X center", [4]), ("X edge", [1])]
+    for name, moves in openings:
+        for mode, table in [("plain alpha-beta", None),
+                            ("table", TranspositionTable(symmetry=False)),
+                            ("table + symmetry", TranspositionTable(symmetry=True))]:
+            game = TicTacToe()
+            for square in moves:
+                game.make_move(square, 'X')
+            stats = SearchStats()
+            search = max_value if moves else min_value # X moves first on an empty board
+            stats.start()
+            search(game, game.board, -math.inf, math.inf, table, stats)
+            stats.finish()
+            entries = len(table) if table is not None else 0
+            print(f"{name:<14}{mode:<22}{stats.nodes:>8}{entries:>9}{stats.total_time() * 1000:>9.1f}")
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -22,3 +22,344 @@ if move == 5:
     print("TEST PASSED: AI found the winning move.")
 else:
     print("TEST FAILED: AI did not pick 5.")
+
+def test_transposition_table():
+    import math
+    import minimax_agent
+    from transposition import TranspositionTable
+
+    # Same values with and without the table, even when it is tiny and evicting
+    for size in (100000, 8):
+        table = TranspositionTable(max_size=size)
+        game = TicTacToe()
+        game.make_move(0, 'X')
+        for _ in range(2): # second pass is answered from the table
+            v_plain, _ = minimax_agent.max_value(game, game.board, -math.inf, math.inf)
+            v_table, move = minimax_agent.max_value(game, game.board, -math.inf, math.inf, table)
+            assert v_plain == v_table
+            assert move == 4, "O must take the center after an X corner opening"
+        assert len(table) <= size
+        assert table.hits > 0 and table.misses > 0
+
+    # Values are scored from the AI's side: a table shared between an AI
+    # playing O and one playing X must not hand one the other's values
+    table = TranspositionTable()
+    game = TicTacToe()
+    game.load_board(['X', 'O'] + [' '] * 7)
+    game.ai, game.human = 'O', 'X'
+    minimax_agent.min_value(game, game.board, -math.inf, math.inf, table)
+    game.ai, game.human = 'X', 'O'
+    v_fresh = minimax_agent.max_value(game, game.board, -math.inf, math.inf, TranspositionTable())
+    assert minimax_agent.max_value(game, game.board, -math.inf, math.inf, table) == v_fresh
+    assert v_fresh[0] > 0
+
+    # A bound from an earlier search must not narrow the root's window: X wins
+    # with 4 here, while 3 only "reaches" the stored bound (and loses to O's 4)
+    from transposition import UPPER
+    game = TicTacToe()
+    game.load_board([' ' if c == '.' else c for c in "XOO..XOX."])
+    table = TranspositionTable()
+    key, t = table.key(game, game.human, "mate")
+    table.store(key, -(minimax_agent.MATE_SCORE - 3), UPPER, 3, t)
+    assert minimax_agent.min_value(game, game.board, -math.inf, math.inf, table)[1] == 4
+    print("TEST PASSED: Transposition table keeps alpha-beta values.")
+
+def test_opening_book(tmp_path):
+    import book
+    import book_format
+
+    path = str(tmp_path / "book.bin")
+    book.build(path)
+    opening_book = book.load(path)
+
+    game = TicTacToe()
+    game.make_move(0, 'X')
+    assert opening_book.probe(game) == 4, "O must take the center after an X corner opening"
+    # Not O's turn by piece count, so the book stays out of it
+    game.make_move(4, 'O')
+    assert opening_book.probe(game) is None
+    # X wins in 3 with 4 (3 and 8 lose to O's 4)
+    assert opening_book.lookup([' ' if c == '.' else c for c in "XOO..XOX."]) == (1, 4)
+    opening_book.close()
+
+    # A book from before the fastest-win moves (format 1) is not used
+    old_path = str(tmp_path / "old.bin")
+    with open(old_path, "wb") as f:
+        f.write(b"TTT1" + bytes(book_format.NUM_BOARDS))
+    assert book.load(old_path) is None
+    try:
+        book.OpeningBook(old_path)
+        assert False
+    except ValueError:
+        pass
+    print("TEST PASSED: Opening book answers the AI's turn.")
+
+def test_symmetry():
+    import symmetry
+
+    # All 8 rotations / reflections share one canonical board
+    board = ['X', ' ', ' ', ' ', 'O', ' ', ' ', ' ', ' ']
+    key, _ = symmetry.canonical(board)
+    for t in range(8):
+        image = symmetry.transform(board, t)
+        assert symmetry.canonical(image)[0] == key
+        # A move mapped to the canonical board comes back to the same square
+        _, t2 = symmetry.canonical(image)
+        assert symmetry.from_canonical(symmetry.to_canonical(2, t2), t2) == 2
+
+    # Empty board: corner, edge, center
+    assert symmetry.unique_moves([' '] * 9, list(range(9))) == [0, 1, 4]
+    print("TEST PASSED: Symmetry reduction.")
+
+def test_search_stats():
+    import minimax_agent
+    from search_stats import SearchStats
+
+    stats = SearchStats()
+    game = TicTacToe()
+    game.make_move(0, 'X')
+    minimax_agent.alpha_beta_search(game, game.board, None, stats)
+    plain_nodes = stats.nodes
+    assert stats.calls[0][0] == plain_nodes
+    assert stats.max_depth == 8 and stats.leaves > 0 and stats.total_cutoffs() > 0
+
+    # The transposition table must visit fewer nodes for the same position
+    stats.reset()
+    minimax_agent.alpha_beta_search(game, game.board, minimax_agent.TranspositionTable(), stats)
+    assert stats.nodes < plain_nodes
+    print(f"TEST PASSED: Search stats ({plain_nodes} -> {stats.nodes} nodes with table).")
+
+def test_move_ordering():
+    import math
+    import minimax_agent
+    from move_ordering import TacticalOrdering, KillerOrdering
+    from search_stats import SearchStats
+
+    game = TicTacToe()
+    for square, letter in [(0, 'X'), (3, 'O'), (1, 'X'), (4, 'O')]:
+        game.make_move(square, letter)
+    # O wins on 5, and must block X on 2
+    assert TacticalOrdering().order(game, game.available_moves(), 'O', 0)[:2] == [5, 2]
+
+    nodes = {}
+    for name, ordering in [("index", None), ("killer", KillerOrdering())]:
+        game = TicTacToe()
+        game.make_move(0, 'X')
+        stats = SearchStats()
+        minimax_agent.max_value(game, game.board, -math.inf, math.inf, None, stats, 0, ordering)
+        nodes[name] = stats.nodes
+    assert nodes["killer"] < nodes["index"]
+    print(f"TEST PASSED: Move ordering ({nodes['index']} -> {nodes['killer']} nodes).")
+
+def test_incremental_win_detection():
+    import random
+    from game_logic import LINES
+
+    def scan_win(board, letter):
+        return any(all(board[s] == letter for s in line) for line in LINES)
+
+    rng = random.Random(0)
+    for _ in range(200):
+        game = TicTacToe()
+        history = []
+        letter = 'X'
+        while game.available_moves() and not (game.check_win('X') or game.check_win('O')):
+            square = rng.choice(game.available_moves())
+            game.make_move(square, letter)
+            history.append(square)
+            letter = 'O' if letter == 'X' else 'X'
+        # Counters agree with a full scan, and undo restores them
+        while history:
+            for who in ('X', 'O'):
+                assert game.check_win(who) == scan_win(game.board, who)
+            assert game.check_draw() == (' ' not in game.board)
+            game.undo_move(history.pop())
+        assert game.empty_count == 9 and not any(game.completed_lines.values())
+
+    # winning_line is still the (start, end) pair main.py draws
+    game = TicTacToe()
+    for square in (2, 4, 6):
+        game.make_move(square, 'X')
+    assert game.check_win('X') and game.winning_line == (2, 6)
+    print("TEST PASSED: Incremental win detection.")
+
+def test_mnk_boards():
+    import minimax_agent
+    import minimax_agent_old
+    from game_logic import make_lines
+    from transposition import TranspositionTable
+
+    # Line tables: 8 on 3x3, 10 on 4x4 (k=4), 572 five-in-a-rows on 15x15
+    assert len(make_lines(3, 3, 3)) == 8
+    assert len(make_lines(4, 4, 4)) == 10
+    assert len(make_lines(15, 15, 5)) == 572
+
+    # Gomoku: five on a diagonal wins, four does not
+    game = TicTacToe(15, 15, 5)
+    for i in range(4):
+        game.make_move(i * 15 + i + 20, 'X')
+    assert not game.check_win('X') and game.is_winning_move(4 * 15 + 4 + 20, 'X')
+    game.make_move(4 * 15 + 4 + 20, 'X')
+    assert game.check_win('X') and game.winning_line == (20, 4 * 16 + 20)
+
+    # 4x4, four in a row: the depth-limited agents block X, then take their own win
+    game = TicTacToe(4, 4, 4)
+    for square, letter in [(0, 'X'), (5, 'O'), (1, 'X'), (10, 'O'), (2, 'X')]:
+        game.make_move(square, letter)
+    assert minimax_agent.get_best_move(game, TranspositionTable()) == 3
+    assert minimax_agent_old.get_best_move(game, max_depth=2) == 3
+    game = TicTacToe(4, 4, 4)
+    for square, letter in [(0, 'X'), (5, 'O'), (1, 'X'), (6, 'O'), (12, 'X'), (7, 'O'), (15, 'X')]:
+        game.make_move(square, letter)
+    assert minimax_agent.get_best_move(game, TranspositionTable()) == 4
+    assert minimax_agent_old.get_best_move(game, max_depth=2) == 4
+    print("TEST PASSED: m,n,k boards.")
+
+def test_iterative_deepening():
+    import minimax_agent
+    from search_budget import SearchBudget
+    from transposition import TranspositionTable
+
+    # Without a budget it ends with a full search: same value as alpha-beta
+    game = TicTacToe()
+    game.make_move(0, 'X')
+    move, value, depth = minimax_agent.iterative_deepening(game, TranspositionTable())
+    assert (move, value, depth) == (4, 0, 8)
+
+    # A tiny node budget still returns a legal move and restores the board
+    game = TicTacToe(15, 15, 5)
+    game.make_move(112, 'X')
+    board = list(game.board)
+    move, _, _ = minimax_agent.iterative_deepening(game, None, None, None, SearchBudget(node_limit=50))
+    assert move in game.available_moves() and game.board == board
+    assert game.num_empty_squares() == 224
+
+    # With a time limit on 4x4, O still blocks X's three in a row
+    game = TicTacToe(4, 4, 4)
+    for square, letter in [(0, 'X'), (5, 'O'), (1, 'X'), (10, 'O'), (2, 'X')]:
+        game.make_move(square, letter)
+    assert minimax_agent.get_best_move(game, TranspositionTable(), time_limit=0.2) == 3
+
+    # A table that already knows a slower win (X on 7 wins in 5) must not stop
+    # the deepening before the win in 3 shows up
+    import math
+    for scoring in ("mate", "depth"):
+        game = TicTacToe()
+        game.load_board([' ' if c == '.' else c for c in "..XX.O..O"])
+        game.ai, game.human = 'X', 'O'
+        table = TranspositionTable()
+        game.make_move(7, 'X')
+        minimax_agent.min_value(game, game.board, -math.inf, math.inf, table, depth=1, scoring=scoring)
+        game.undo_move(7)
+        move, value, depth = minimax_agent.iterative_deepening(game, table, scoring=scoring)
+        assert minimax_agent.win_distance(game, value, scoring) == 3 and depth == 3
+        assert move in (0, 6)
+    print("TEST PASSED: Iterative deepening.")
+
+def test_ai_worker():
+    import time
+    from ai_worker import AIWorker
+
+    worker = AIWorker(time_limit=0.5)
+    try:
+        # A cancelled search never delivers its move
+        game = TicTacToe(15, 15, 5)
+        game.make_move(112, 'X')
+        worker.request(game)
+        worker.cancel()
+        assert not worker.busy() and worker.poll() is None
+
+        # poll() never blocks; the move arrives later
+        game = TicTacToe()
+        for square, letter in [(0, 'X'), (3, 'O'), (1, 'X'), (4, 'O')]:
+            game.make_move(square, letter)
+        worker.request(game)
+        deadline = time.time() + 30
+        move = None
+        while worker.busy() and time.time() < deadline:
+            move = worker.poll()
+            time.sleep(0.01)
+        assert move == 5, "O must win on 5"
+    finally:
+        worker.close()
+    assert not worker.process.is_alive()
+    print("TEST PASSED: AI worker process.")
+
+def test_selfplay():
+    import selfplay
+
+    # Perfect play never loses to random, and two perfect players draw
+    for number, x_name, o_name, seed in selfplay.tasks("alphabeta", "random", 6, 0):
+        record = selfplay.play_game((number, x_name, o_name, seed))
+        assert record["winner"] != ('O' if x_name == "alphabeta" else 'X')
+    for task in selfplay.tasks("new", "alphabeta", 2, 0):
+        assert selfplay.play_game(task)["winner"] is None
+
+    summary = selfplay.run("old", "random", 4, workers=2)
+    assert summary["games"] == 4 and summary["results"]["old"]["loss"] == 0
+    print("TEST PASSED: Self-play harness.")
+
+def test_benchmark_suite():
+    import json
+    import benchmark_suite
+
+    # All three implementations find the win and the block
+    boards = dict(benchmark_suite.positions())
+    assert len(boards) == 1 + 9 + 72 + len(benchmark_suite.TACTICAL)
+    for run in benchmark_suite.IMPLEMENTATIONS.values():
+        assert run(boards["win in 1"])[0] == 2
+        assert run(boards["block"])[0] == 2
+
+    # More nodes than the baseline is always a regression, time only past the tolerance
+    results = {"new": {"nodes": 12, "seconds": 1.1, "positions": {"empty": [12, 1.1]}}}
+    baseline = {"new": {"nodes": 10, "seconds": 1.0, "positions": {"empty": [10, 1.0]}}}
+    assert len(benchmark_suite.compare(results, baseline, tolerance=0.25)) == 1
+    results["new"]["seconds"] = 2.0
+    assert len(benchmark_suite.compare(results, baseline, tolerance=0.25)) == 2
+    # A nodes-only baseline never flags time
+    assert len(benchmark_suite.compare(results, benchmark_suite.nodes_only(baseline))) == 1
+
+    # No search visits more nodes than the committed baseline
+    with open(benchmark_suite.DEFAULT_BASELINE) as f:
+        committed = json.load(f)["results"]
+    assert benchmark_suite.compare(benchmark_suite.run_suite(repeat=1), committed) == []
+    print("TEST PASSED: Benchmark suite.")
+
+def test_depth_aware_scoring():
+    import math
+    import minimax_agent
+    from transposition import TranspositionTable
+
+    # O can win at once on 2; flat scoring sees every win as equal and plays 0
+    board = [' ' if c == '.' else c for c in "...X.OXXO"]
+    game = TicTacToe()
+    game.load_board(board)
+    game.ai, game.human = 'O', 'X'
+    assert minimax_agent.alpha_beta_search(game, game.board, TranspositionTable(), scoring="flat") != 2
+    for scoring in ("depth", "mate"):
+        assert minimax_agent.alpha_beta_search(game, game.board, TranspositionTable(), scoring=scoring) == 2
+        assert minimax_agent.alpha_beta_search(game, game.board, scoring=scoring) == 2
+
+    # Mate scores count plies to the win, with and without the table (bounds
+    # stored relative to the position), and agree in sign with flat scores
+    table = TranspositionTable()
+    for square in range(9):
+        game = TicTacToe()
+        game.make_move(square, 'X')
+        game.ai, game.human = 'O', 'X'
+        v_flat, _ = minimax_agent.max_value(game, game.board, -math.inf, math.inf, scoring="flat")
+        v_plain, _ = minimax_agent.max_value(game, game.board, -math.inf, math.inf)
+        v_table, _ = minimax_agent.max_value(game, game.board, -math.inf, math.inf, table)
+        assert v_plain == v_table
+        assert (v_flat > 0) == (v_plain > 0) and (v_flat < 0) == (v_plain < 0)
+
+    game = TicTacToe()
+    game.load_board([' ' if c == '.' else c for c in "XX.OO...."])
+    game.ai, game.human = 'O', 'X'
+    assert minimax_agent.min_value(game, game.board, -math.inf, math.inf)[0] == -(minimax_agent.MATE_SCORE - 1)
+    try:
+        minimax_agent.get_best_move(game, scoring="fastest")
+        assert False
+    except ValueError:
+        pass
+    print("TEST PASSED: Depth-aware scoring.")
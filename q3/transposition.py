@@ -0,0 +1,107 @@
+import math
+from collections import OrderedDict
+
+import symmetry
+
+# =============================================================================
+# TRANSPOSITION TABLE
+# =============================================================================
+# The same board can be reached through different move orders
+# (X:0, O:4, X:8 and X:8, O:4, X:0 give the same position), so alpha-beta
+# keeps re-searching positions it has already solved. The table remembers
+# the result of every searched position.
+#
+# Because alpha-beta only searches inside the (alpha, beta) window, a stored
+# value is not always the true minimax value:
+#   EXACT - alpha < value < beta: the true value
+#   LOWER - value >= beta (cutoff in MAX): true value is at least 'value'
+#   UPPER - value <= alpha (cutoff in MIN / fail low): true value is at most 'value'
+#
+# With symmetry=True, the 8 rotations/reflections of a board share one entry
+# (see symmetry.py). Moves are stored in canonical coordinates and mapped
+# back to the real board on lookup.
+#
+# Depth-limited searches (big m,n,k boards) also store the "draft": how many
+# plies were searched below the position (math.inf = searched to the end).
+# An entry only answers a lookup that needs the same draft or less.
+
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+EVICTION_POLICIES = ("lru", "fifo")
+
+
+class TranspositionTable:
+    def __init__(self, max_size=100000, policy="lru", symmetry=True):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy: {policy}")
+        self.max_size = max_size
+        self.policy = policy
+        self.symmetry = symmetry
+        self.entries = OrderedDict() # key -> (value, flag, move, draft)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def key(self, game, letter, tag=None):
+        """
+        Returns (key, transform) for the game's board with 'letter' to move.
+        The key includes the board size and win length, so one table can be
+        shared between games of different sizes, and the AI's letter, because
+        the stored values are scored from the AI's side (the same board is
+        worth +v to an AI playing X and -v to one playing O). 'tag' is anything
+        else the stored values depend on (e.g. the scoring mode of the search).
+        Pass the transform back into lookup() / store().
+        """
+        size = (game.rows, game.cols, game.k)
+        if self.symmetry:
+            canonical_board, t = symmetry.canonical(game.board, game.rows, game.cols)
+            return (canonical_board, size, letter, game.ai, tag), t
+        return (tuple(game.board), size, letter, game.ai, tag), symmetry.IDENTITY
+
+    def lookup(self, key, t=symmetry.IDENTITY, draft=math.inf):
+        """
+        Returns the stored (value, flag, move) for key, or None.
+        Entries searched less deeply than 'draft' count as a miss.
+        """
+        entry = self.entries.get(key)
+        if entry is None or entry[3] < draft:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self.policy == "lru":
+            self.entries.move_to_end(key)
+        value, flag, move, _ = entry
+        rows, cols = key[1][0], key[1][1]
+        return value, flag, symmetry.from_canonical(move, t, rows, cols)
+
+    def store(self, key, value, flag, move, t=symmetry.IDENTITY, draft=math.inf):
+        """
+        Stores a search result. When full, evicts the least recently used
+        entry ('lru') or the oldest stored entry ('fifo').
+        """
+        rows, cols = key[1][0], key[1][1]
+        move = symmetry.to_canonical(move, t, rows, cols)
+        if key in self.entries:
+            if self.policy == "lru":
+                self.entries.move_to_end(key)
+        elif len(self.entries) >= self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        self.entries[key] = (value, flag, move, draft)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
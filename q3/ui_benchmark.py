@@ -0,0 +1,63 @@
+import os
+import signal
+import subprocess
+import sys
+import time
+
+# =============================================================================
+# IDLE CPU BENCHMARK FOR THE PYGAME UIS
+# =============================================================================
+# Starts q3/main.py and q3_new/runner.py headless (SDL dummy video driver),
+# leaves them idle, and measures how much CPU they burn per second.
+# Startup cost (importing pygame, opening the window) is removed by timing
+# two run lengths and taking the difference:
+#
+#   cpu per idle second = (cpu(long run) - cpu(short run)) / (long - short)
+#
+# 1.00 means one core is pegged. Uses os.wait4, so Unix only.
+#
+#   python ui_benchmark.py [short_seconds long_seconds]
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+UIS = [
+    ("q3/main.py", os.path.join(HERE, "main.py")),
+    ("q3_new/runner.py", os.path.join(HERE, "..", "q3_new", "runner.py")),
+]
+
+
+def cpu_seconds(script, seconds):
+    """Runs a UI script headless for 'seconds' and returns the CPU time it used."""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    process = subprocess.Popen([sys.executable, os.path.basename(script)], cwd=os.path.dirname(script),
+                               env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(seconds)
+    # Ctrl+C lets main.py shut its AI worker down; kill it if that does not work
+    os.kill(process.pid, signal.SIGINT) # not send_signal(): that may reap the process first
+    deadline = time.time() + 5
+    while True:
+        pid, _, usage = os.wait4(process.pid, os.WNOHANG)
+        if pid:
+            break
+        if time.time() > deadline:
+            process.kill()
+            _, _, usage = os.wait4(process.pid, 0)
+            break
+        time.sleep(0.05)
+    process.returncode = 0 # already reaped by wait4
+    return usage.ru_utime + usage.ru_stime
+
+
+def benchmark(short=1.0, long=4.0):
+    print(f"{'ui':<20}{'cpu per idle second':>22}")
+    for name, script in UIS:
+        cpu_short = cpu_seconds(script, short)
+        cpu_long = cpu_seconds(script, long)
+        per_second = max(0.0, cpu_long - cpu_short) / (long - short)
+        print(f"{name:<20}{per_second:>21.3f}s")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3:
+        benchmark(float(sys.argv[1]), float(sys.argv[2]))
+    else:
+        benchmark()
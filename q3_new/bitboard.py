@@ -0,0 +1,345 @@
+"""
+Tic Tac Toe Player (Bitboard version)
+
+Same game as tictactoe.py, but the board is a pair of 9-bit integers
+(x_bits, o_bits) instead of a list of lists. Cell (i, j) is bit 3 * i + j.
+
+Because a board is just two ints, result() builds the next state with a
+single OR instead of copy.deepcopy(), and boards can be used as dict keys.
+Use from_board() / to_board() to convert to and from the list format used by
+runner.py and test_tictactoe.py.
+"""
+
+import math
+
+# Same values as tictactoe.py (kept here so tictactoe.py can import this module)
+X = "X"
+O = "O"
+EMPTY = None
+
+FULL = 0b111111111
+
+# Bit mask for every cell, indexed by 3 * i + j
+CELLS = tuple(1 << n for n in range(9))
+
+# The 8 winning lines: 3 rows, 3 columns, 2 diagonals
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,  # Rows
+    0b001001001, 0b010010010, 0b100100100,  # Columns
+    0b100010001, 0b001010100,               # Diagonals
+)
+
+
+# --- Symmetry (the 8 rotations / reflections of the board) ---
+
+def _perm(f):
+    # PERMS[t][n] = where cell n ends up under transform t
+    return tuple(r * 3 + c for r, c in (f(n // 3, n % 3) for n in range(9)))
+
+PERMS = (
+    _perm(lambda r, c: (r, c)),          # 0 identity
+    _perm(lambda r, c: (c, 2 - r)),      # 1 rotate 90
+    _perm(lambda r, c: (2 - r, 2 - c)),  # 2 rotate 180
+    _perm(lambda r, c: (2 - c, r)),      # 3 rotate 270
+    _perm(lambda r, c: (r, 2 - c)),      # 4 mirror left-right
+    _perm(lambda r, c: (2 - r, c)),      # 5 mirror top-bottom
+    _perm(lambda r, c: (c, r)),          # 6 main diagonal
+    _perm(lambda r, c: (2 - c, 2 - r)),  # 7 anti diagonal
+)
+
+# BIT_TRANSFORMS[t][bits] = the 9-bit set after transform t (all 512 patterns)
+BIT_TRANSFORMS = tuple(
+    tuple(sum(CELLS[p[n]] for n in range(9) if bits & CELLS[n]) for bits in range(512))
+    for p in PERMS
+)
+
+
+# INVERSE_PERMS[t][n] = which cell ends up on n under transform t
+INVERSE_PERMS = tuple(tuple(p.index(n) for n in range(9)) for p in PERMS)
+
+
+def initial_state():
+    """
+    Returns starting state of the board.
+    """
+    return (0, 0)
+
+
+def from_board(board):
+    """
+    Converts a list-of-lists board into a (x_bits, o_bits) bitboard.
+    """
+    x_bits = 0
+    o_bits = 0
+    for i in range(3):
+        for j in range(3):
+            if board[i][j] == X:
+                x_bits |= CELLS[3 * i + j]
+            elif board[i][j] == O:
+                o_bits |= CELLS[3 * i + j]
+    return (x_bits, o_bits)
+
+
+def to_board(bitboard):
+    """
+    Converts a (x_bits, o_bits) bitboard back into a list-of-lists board.
+    """
+    x_bits, o_bits = bitboard
+    board = [[EMPTY, EMPTY, EMPTY],
+             [EMPTY, EMPTY, EMPTY],
+             [EMPTY, EMPTY, EMPTY]]
+    for n in range(9):
+        if x_bits & CELLS[n]:
+            board[n // 3][n % 3] = X
+        elif o_bits & CELLS[n]:
+            board[n // 3][n % 3] = O
+    return board
+
+
+def player(bitboard):
+    """
+    Returns player who has the next turn on a board.
+    """
+    x_bits, o_bits = bitboard
+    # X goes first, so if counts are equal, it's X's turn.
+    if x_bits.bit_count() == o_bits.bit_count():
+        return X
+    return O
+
+
+def actions(bitboard):
+    """
+    Returns set of all possible actions (i, j) available on the board.
+    """
+    x_bits, o_bits = bitboard
+    empty = ~(x_bits | o_bits) & FULL
+    return {(n // 3, n % 3) for n in range(9) if empty & CELLS[n]}
+
+
+def result(bitboard, action):
+    """
+    Returns the board that results from making move (i, j) on the board.
+    """
+    i, j = action
+    if not (0 <= i < 3 and 0 <= j < 3):
+        raise Exception("Invalid Action")
+
+    x_bits, o_bits = bitboard
+    cell = CELLS[3 * i + j]
+    if (x_bits | o_bits) & cell:
+        raise Exception("Invalid Action")
+
+    if x_bits.bit_count() == o_bits.bit_count():
+        return (x_bits | cell, o_bits)
+    return (x_bits, o_bits | cell)
+
+
+def _has_line(bits):
+    for mask in WIN_MASKS:
+        if bits & mask == mask:
+            return True
+    return False
+
+
+def winner(bitboard):
+    """
+    Returns the winner of the game, if there is one.
+    """
+    x_bits, o_bits = bitboard
+    if _has_line(x_bits):
+        return X
+    if _has_line(o_bits):
+        return O
+    return None
+
+
+def terminal(bitboard):
+    """
+    Returns True if game is over, False otherwise.
+    """
+    x_bits, o_bits = bitboard
+    if (x_bits | o_bits) == FULL:
+        return True
+    return _has_line(x_bits) or _has_line(o_bits)
+
+
+def utility(bitboard):
+    """
+    Returns 1 if X has won the game, -1 if O has won, 0 otherwise.
+    """
+    x_bits, o_bits = bitboard
+    if _has_line(x_bits):
+        return 1
+    if _has_line(o_bits):
+        return -1
+    return 0
+
+
+def transform(bitboard, t):
+    """
+    Returns the bitboard after rotation / reflection t.
+    """
+    x_bits, o_bits = bitboard
+    table = BIT_TRANSFORMS[t]
+    return (table[x_bits], table[o_bits])
+
+
+def canonical(bitboard):
+    """
+    Returns (canonical_bitboard, t): the smallest of the 8 symmetric boards
+    and the transform that produces it. Cell n on the real board is cell
+    PERMS[t][n] on the canonical one.
+    """
+    x_bits, o_bits = bitboard
+    best = (x_bits, o_bits)
+    best_t = 0
+    for t in range(1, 8):
+        table = BIT_TRANSFORMS[t]
+        candidate = (table[x_bits], table[o_bits])
+        if candidate < best:
+            best = candidate
+            best_t = t
+    return best, best_t
+
+
+def unique_cells(bitboard):
+    """
+    Returns the empty cells n, skipping cells that are a mirror image of a
+    smaller cell on a symmetric board (9 -> 3 on the empty board).
+    """
+    x_bits, o_bits = bitboard
+    empty = ~(x_bits | o_bits) & FULL
+    stabilizer = [PERMS[t] for t in range(1, 8)
+                  if BIT_TRANSFORMS[t][x_bits] == x_bits and BIT_TRANSFORMS[t][o_bits] == o_bits]
+    return [n for n in range(9)
+            if empty & CELLS[n] and all(p[n] >= n for p in stabilizer)]
+
+
+def unique_actions(bitboard):
+    """
+    Returns the actions (i, j) of unique_cells(), in cell order.
+    """
+    return [(n // 3, n % 3) for n in unique_cells(bitboard)]
+
+
+def solve(bitboard, table=None):
+    """
+    Returns (value, n): the minimax value of the board (as utility()) and a
+    best cell n for the player to move (None when the game is over).
+    table is a dict that can be shared between calls, canonical board ->
+    (value, best cell on the canonical board), so a position and its mirror
+    images are only ever solved once.
+    """
+    if table is None:
+        table = {}
+    key, t = canonical(bitboard)
+    value, n = _solve(key, table)
+    return value, None if n is None else INVERSE_PERMS[t][n]
+
+
+def _solve(key, table):
+    entry = table.get(key)
+    if entry is not None:
+        return entry
+
+    x_bits, o_bits = key
+    if terminal(key):
+        entry = (utility(key), None)
+    else:
+        x_to_move = x_bits.bit_count() == o_bits.bit_count()
+        for n in unique_cells(key):
+            if x_to_move:
+                value, _ = solve((x_bits | CELLS[n], o_bits), table)
+                better = entry is None or value > entry[0]
+            else:
+                value, _ = solve((x_bits, o_bits | CELLS[n]), table)
+                better = entry is None or value < entry[0]
+            if better:
+                entry = (value, n)
+                # Nothing beats a win
+                if value == (1 if x_to_move else -1):
+                    break
+    table[key] = entry
+    return entry
+
+
+def minimax(bitboard):
+    """
+    Returns the optimal action (i, j) for the current player on the board.
+    """
+    if terminal(bitboard):
+        return None
+
+    x_bits, o_bits = bitboard
+    best_action = None
+
+    # Mirror-image moves have the same value, so only one of each is searched.
+    # alpha / beta are carried across the root moves, so later moves only
+    # have to show they are no better than the best one so far.
+    alpha, beta = -math.inf, math.inf
+    if player(bitboard) == X:
+        # X is Maximizing player
+        v = -math.inf
+        for n in unique_cells(bitboard):
+            val = _min_value(x_bits | CELLS[n], o_bits, alpha, beta)
+            if val > v:
+                v = val
+                best_action = (n // 3, n % 3)
+            alpha = max(alpha, v)
+    else:
+        # O is Minimizing player
+        v = math.inf
+        for n in unique_cells(bitboard):
+            val = _max_value(x_bits, o_bits | CELLS[n], alpha, beta)
+            if val < v:
+                v = val
+                best_action = (n // 3, n % 3)
+            beta = min(beta, v)
+
+    return best_action
+
+
+# The search helpers take the two bit sets directly so no tuple is built per node.
+
+def _max_value(x_bits, o_bits, alpha, beta):
+    """
+    Returns the max value for X (Maximizer), using Alpha-Beta Pruning.
+    """
+    # O just moved, so only O can have completed a line
+    if _has_line(o_bits):
+        return -1
+    occupied = x_bits | o_bits
+    if occupied == FULL:
+        return 0
+
+    v = -math.inf
+    for cell in CELLS:
+        if occupied & cell:
+            continue
+        v = max(v, _min_value(x_bits | cell, o_bits, alpha, beta))
+        alpha = max(alpha, v)
+        if v >= beta:
+            return v
+    return v
+
+
+def _min_value(x_bits, o_bits, alpha, beta):
+    """
+    Returns the min value for O (Minimizer), using Alpha-Beta Pruning.
+    """
+    # X just moved, so only X can have completed a line
+    if _has_line(x_bits):
+        return 1
+    occupied = x_bits | o_bits
+    if occupied == FULL:
+        return 0
+
+    v = math.inf
+    for cell in CELLS:
+        if occupied & cell:
+            continue
+        v = min(v, _max_value(x_bits, o_bits | cell, alpha, beta))
+        beta = min(beta, v)
+        if v <= alpha:
+            return v
+    return v
@@ -0,0 +1,176 @@
+"""
+Opening Book (perfect-play table)
+
+Tic Tac Toe only has 4,520 non-terminal positions, so instead of searching
+we can solve every one of them once and store the answer.
+
+The file format is shared with q3/book.py (q3/book_format.py): a version
+header and one byte per board, indexed by the base-3 code of the board
+sum(code(cell n) * 3^n) with code 0 = EMPTY, 1 = X, 2 = O and n = 3 * i + j.
+Each byte holds the game-theoretic value from X's point of view (1, 0, -1)
+and the best move: among moves of that value, the fastest win or the
+slowest loss (like retrograde.py).
+
+Build the file once with:
+    python opening_book.py [path]
+"""
+
+import os
+import sys
+
+from q3_shared import book_format
+
+NUM_BOARDS = book_format.NUM_BOARDS
+NO_ENTRY = book_format.NO_ENTRY
+POWERS = book_format.POWERS
+encode_entry = book_format.encode_entry
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_PATH = os.path.join(HERE, "opening_book.bin")
+
+# Same cell values as tictactoe.py (X = "X", O = "O", EMPTY = None)
+CELL_CODES = {None: 0, "X": 1, "O": 2}
+
+
+def board_index(board):
+    """
+    Returns the table index of a list-of-lists board.
+    """
+    index = 0
+    for i in range(3):
+        for j in range(3):
+            index += CELL_CODES[board[i][j]] * POWERS[3 * i + j]
+    return index
+
+
+def bitboard_index(bitboard):
+    """
+    Returns the table index of a (x_bits, o_bits) bitboard.
+    """
+    x_bits, o_bits = bitboard
+    index = 0
+    for n in range(9):
+        if x_bits >> n & 1:
+            index += POWERS[n]
+        elif o_bits >> n & 1:
+            index += 2 * POWERS[n]
+    return index
+
+
+# =============================================================================
+# BUILD STEP
+# =============================================================================
+
+def solve():
+    """
+    Solves every position reachable from the empty board.
+    Returns a bytearray of NUM_BOARDS entries.
+    """
+    import bitboard as bb
+    from retrograde import _preference
+
+    table = bytearray([NO_ENTRY]) * NUM_BOARDS
+    # Memo keyed on the canonical board, so the 8 symmetric versions of a
+    # position are solved once (765 entries instead of 5,478).
+    # Every entry is (value, plies until the game ends under the best moves).
+    values = {}
+
+    def value_of(bitboard):
+        key, _ = bb.canonical(bitboard)
+        if key in values:
+            return values[key]
+
+        x_bits, o_bits = key
+        if bb._has_line(x_bits):
+            values[key] = (1, 0)
+            return values[key]
+        if bb._has_line(o_bits):
+            values[key] = (-1, 0)
+            return values[key]
+        if (x_bits | o_bits) == bb.FULL:
+            values[key] = (0, 0)
+            return values[key]
+
+        # Minimax over the whole tree; among moves of the same value, the
+        # fastest win / slowest loss (retrograde.py breaks ties the same way)
+        x_to_move = x_bits.bit_count() == o_bits.bit_count()
+        sign = 1 if x_to_move else -1
+        best = None
+        for n in bb.unique_cells(key):
+            if x_to_move:
+                v, distance = value_of((x_bits | bb.CELLS[n], o_bits))
+            else:
+                v, distance = value_of((x_bits, o_bits | bb.CELLS[n]))
+            preference = _preference(v, distance + 1, sign)
+            if best is None or preference > best[0]:
+                best = (preference, v, distance + 1, n)
+
+        _, best_value, best_distance, best_move = best
+        values[key] = (best_value, best_distance)
+        # Write the answer for all 8 symmetric versions of this board
+        for t in range(8):
+            image = bb.transform(key, t)
+            table[bitboard_index(image)] = encode_entry(best_value, bb.PERMS[t][best_move])
+        return values[key]
+
+    value_of(bb.initial_state())
+    return table
+
+
+def write(table, path=DEFAULT_PATH):
+    book_format.write(table, path)
+
+
+def build(path=DEFAULT_PATH):
+    table = solve()
+    write(table, path)
+    return table
+
+
+# =============================================================================
+# LOADER
+# =============================================================================
+
+class OpeningBook(book_format.BookFile):
+    """
+    Read-only view of a book file. The file is memory-mapped, so every
+    process that opens it shares the same pages instead of solving again.
+    """
+    def __init__(self, path=DEFAULT_PATH):
+        super().__init__(path)
+
+    def probe(self, board):
+        """
+        Returns (value, (i, j)) for a list-of-lists board, or None.
+        """
+        found = self.entry(board_index(board))
+        if found is None:
+            return None
+        value, n = found
+        return value, (n // 3, n % 3)
+
+    def probe_bitboard(self, bitboard):
+        """
+        Returns (value, (i, j)) for a (x_bits, o_bits) bitboard, or None.
+        """
+        found = self.entry(bitboard_index(bitboard))
+        if found is None:
+            return None
+        value, n = found
+        return value, (n // 3, n % 3)
+
+
+def load(path=DEFAULT_PATH):
+    """
+    Returns the OpeningBook at path, or None if it has not been built yet
+    (or was built with an older format version).
+    """
+    return book_format.load(OpeningBook, path)
+
+
+if __name__ == "__main__":
+    out = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH
+    table = build(out)
+    solved = sum(1 for byte in table if byte != NO_ENTRY)
+    print(f"Solved {solved} positions -> {out}")
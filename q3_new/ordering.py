@@ -0,0 +1,77 @@
+"""
+Move Ordering
+
+Alpha-beta prunes more when the best move is searched first, but actions()
+returns an unordered set. These orderings are passed to tictactoe.minimax()
+with ordering=... and have two methods:
+
+    order(board, actions, player, depth) -> list of actions, best first
+    cutoff(action, player, depth, num_actions) -> called when action caused a cutoff
+
+Ties are always broken by STATIC_RANK, so the search order (and the move
+minimax() picks) does not depend on set iteration order or PYTHONHASHSEED.
+
+The orderings themselves are q3/move_ordering.py's. BoardOrdering only
+swaps in this board (list of lists, (i, j) actions) for the two places
+they look at it: the static rank and the immediate-win test.
+"""
+
+from q3_shared import move_ordering
+
+X = "X"
+O = "O"
+
+# Center first, then corners, then edges
+STATIC_ORDER = ((1, 1), (0, 0), (0, 2), (2, 0), (2, 2), (0, 1), (1, 0), (1, 2), (2, 1))
+STATIC_RANK = {action: rank for rank, action in enumerate(STATIC_ORDER)}
+
+# The 8 winning lines, and the lines through each cell
+LINES = [[(i, 0), (i, 1), (i, 2)] for i in range(3)] + \
+        [[(0, j), (1, j), (2, j)] for j in range(3)] + \
+        [[(0, 0), (1, 1), (2, 2)], [(0, 2), (1, 1), (2, 0)]]
+LINES_THROUGH = {cell: [line for line in LINES if cell in line] for cell in STATIC_ORDER}
+
+
+def is_winning_action(board, action, player):
+    """
+    Returns True if player moving to the (empty) cell would complete a line.
+    """
+    for line in LINES_THROUGH[action]:
+        if all(board[i][j] == player for (i, j) in line if (i, j) != action):
+            return True
+    return False
+
+
+class BoardOrdering:
+    """
+    Mixin for the q3 orderings: reads a list-of-lists board with (i, j)
+    actions instead of a TicTacToe game with square indexes.
+    """
+    def rank(self, board):
+        return STATIC_RANK
+
+    def is_winning(self, board, action, player):
+        return is_winning_action(board, action, player)
+
+
+class StaticOrdering(BoardOrdering, move_ordering.StaticOrdering):
+    """Center, corners, edges."""
+
+
+class TacticalOrdering(BoardOrdering, move_ordering.TacticalOrdering):
+    """Immediate wins first, then blocks, then static order."""
+
+
+class KillerOrdering(BoardOrdering, move_ordering.KillerOrdering):
+    """
+    Wins, blocks, then the killer moves for this depth (the last actions
+    that caused a cutoff at the same depth), then static order.
+    """
+
+
+class HistoryOrdering(BoardOrdering, move_ordering.HistoryOrdering):
+    """
+    KillerOrdering, with the remaining actions sorted by the history
+    heuristic: how much cutoff work each action has saved for this player
+    anywhere in the tree.
+    """
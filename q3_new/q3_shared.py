@@ -0,0 +1,27 @@
+"""
+Modules Shared with q3
+
+stats.py, ordering.py and opening_book.py reuse three q3 modules instead of
+keeping copies of them:
+
+    search_stats  - SearchStats, so both searches count nodes the same way
+    move_ordering - the ordering classes (ordering.py adapts them to this board)
+    book_format   - the opening book file format, so either folder's book loads
+
+This is the only place that puts the q3 folder on sys.path. It is appended,
+not inserted, so q3_new's own tictactoe.py still wins over q3's. None of the
+three modules imports anything else from q3 when it is loaded.
+
+    from q3_shared import book_format
+"""
+
+import os
+import sys
+
+Q3 = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "q3"))
+if Q3 not in sys.path:
+    sys.path.append(Q3)
+
+import book_format
+import move_ordering
+import search_stats
@@ -0,0 +1,132 @@
+"""
+Retrograde Solver
+
+Solves the whole game without recursion. Every legal position reachable
+from initial_state() is enumerated layer by layer (layer k = boards with k
+pieces, 5,478 positions in total). The values are then computed backwards:
+finished games get their utility(), and every earlier layer is solved from
+the layer after it, so each position is looked at exactly once.
+
+Every position gets (value, distance, move):
+    value     - utility() under perfect play (1 X wins, -1 O wins, 0 draw)
+    distance  - plies until the game ends when both sides play the moves below
+    move      - best cell n = 3 * i + j for the player to move (None when over)
+
+Ties between moves of the same value are broken like the depth-weighted
+score in q3/minimax_agent_old.py: the winner picks the fastest win, the
+loser the slowest loss. Remaining ties go to the lowest cell.
+
+    table = RetrogradeTable()
+    table.probe(board)            # q3_new board (list of lists)
+    table.probe_squares(squares)  # q3 board (list of 9 'X' / 'O' / ' ')
+"""
+
+import bitboard as bb
+
+
+def layers():
+    """
+    Returns [layer_0, ..., layer_9]: the reachable bitboards with k pieces,
+    found breadth first. Finished games are not expanded.
+    """
+    result = [[bb.initial_state()]]
+    for k in range(9):
+        seen = set()
+        next_layer = []
+        for x_bits, o_bits in result[k]:
+            if bb.terminal((x_bits, o_bits)):
+                continue
+            empty = ~(x_bits | o_bits) & bb.FULL
+            for cell in bb.CELLS:
+                if not empty & cell:
+                    continue
+                child = (x_bits | cell, o_bits) if k % 2 == 0 else (x_bits, o_bits | cell)
+                if child not in seen:
+                    seen.add(child)
+                    next_layer.append(child)
+        result.append(next_layer)
+    return result
+
+
+def _preference(value, distance, sign):
+    # Sort key for the player with 'sign' (X: 1, O: -1): bigger is better
+    value *= sign
+    if value > 0:
+        return (value, -distance)  # win: the sooner the better
+    if value < 0:
+        return (value, distance)   # loss: the later the better
+    return (0, 0)
+
+
+def solve():
+    """
+    Returns {bitboard: (value, distance, move n)} for every reachable position.
+    """
+    all_layers = layers()
+    table = {}
+    for k in range(9, -1, -1):
+        sign = 1 if k % 2 == 0 else -1  # X moves on even layers
+        for position in all_layers[k]:
+            if bb.terminal(position):
+                table[position] = (bb.utility(position), 0, None)
+                continue
+            x_bits, o_bits = position
+            empty = ~(x_bits | o_bits) & bb.FULL
+            best = None
+            for n, cell in enumerate(bb.CELLS):
+                if not empty & cell:
+                    continue
+                child = (x_bits | cell, o_bits) if sign == 1 else (x_bits, o_bits | cell)
+                value, distance, _ = table[child]
+                key = _preference(value, distance + 1, sign)
+                if best is None or key > best[0]:
+                    best = (key, value, distance + 1, n)
+            table[position] = best[1:]
+    return table
+
+
+class RetrogradeTable:
+    def __init__(self, table=None):
+        self.table = solve() if table is None else table
+
+    def __len__(self):
+        return len(self.table)
+
+    def lookup(self, bitboard):
+        """
+        Returns (value, distance, move n) for a bitboard, or None if it cannot
+        be reached in a real game.
+        """
+        return self.table.get(bitboard)
+
+    def probe(self, board):
+        """
+        Returns (value, distance, action (i, j) or None) for a q3_new board, or None.
+        """
+        entry = self.lookup(bb.from_board(board))
+        if entry is None:
+            return None
+        value, distance, n = entry
+        return value, distance, None if n is None else (n // 3, n % 3)
+
+    def probe_squares(self, squares):
+        """
+        Returns (value, distance, square or None) for a q3 board (list of 9
+        'X' / 'O' / ' '), or None.
+        """
+        x_bits = sum(bb.CELLS[n] for n in range(9) if squares[n] == 'X')
+        o_bits = sum(bb.CELLS[n] for n in range(9) if squares[n] == 'O')
+        return self.lookup((x_bits, o_bits))
+
+
+if __name__ == "__main__":
+    import time
+
+    start = time.perf_counter()
+    all_layers = layers()
+    table = RetrogradeTable()
+    elapsed = time.perf_counter() - start
+    print("positions per layer:", [len(layer) for layer in all_layers])
+    print(f"{len(table)} positions solved in {elapsed * 1000:.1f} ms")
+    value, distance, action = table.probe(bb.to_board(bb.initial_state()))
+    print(f"empty board: value {value}, game lasts {distance} plies, X plays {action}")
@@ -16,16 +16,43 @@ mediumFont = pygame.font.Font(OPEN_SANS, 28)
 largeFont = pygame.font.Font(OPEN_SANS, 40)
 moveFont = pygame.font.Font(OPEN_SANS, 60)
 
+# Frame cap: the loop sleeps for the rest of each frame instead of spinning
+FPS = 30
+clock = pygame.time.Clock()
+
+# Rendered text is cached: rendering a font is much slower than blitting
+text_cache = {}
+
+
+def render(font, text, color):
+    key = (id(font), text, color)
+    if key not in text_cache:
+        text_cache[key] = font.render(text, True, color)
+    return text_cache[key]
+
+
 # Colors
 user = None
 board = ttt.initial_state()
 ai_turn = False
 
+# What is on the screen now; the screen is only redrawn when this changes
+last_frame = None
+
 while True:
 
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             sys.exit()
+        if event.type == pygame.VIDEOEXPOSE:
+            last_frame = None
+
+    # Nothing changed (and no click to handle): wait for the next frame
+    click, _, _ = pygame.mouse.get_pressed()
+    frame = (user, tuple(map(tuple, board)), ai_turn)
+    if frame == last_frame and click != 1:
+        clock.tick(FPS)
+        continue
 
     screen.fill((0, 0, 0))
 
@@ -33,21 +60,21 @@ while True:
     if user is None:
 
         # Draw title
-        title = largeFont.render("Play Tic-Tac-Toe", True, (255, 255, 255))
+        title = render(largeFont, "Play Tic-Tac-Toe", (255, 255, 255))
         titleRect = title.get_rect()
         titleRect.center = ((width / 2), 50)
         screen.blit(title, titleRect)
 
         # Draw buttons
         playXButton = pygame.Rect((width / 8), (height / 2), width / 4, 50)
-        playX = mediumFont.render("Play as X", True, (0, 0, 0))
+        playX = render(mediumFont, "Play as X", (0, 0, 0))
         playXRect = playX.get_rect()
         playXRect.center = playXButton.center
         pygame.draw.rect(screen, (255, 255, 255), playXButton)
         screen.blit(playX, playXRect)
 
         playOButton = pygame.Rect(5 * (width / 8), (height / 2), width / 4, 50)
-        playO = mediumFont.render("Play as O", True, (0, 0, 0))
+        playO = render(mediumFont, "Play as O", (0, 0, 0))
         playORect = playO.get_rect()
         playORect.center = playOButton.center
         pygame.draw.rect(screen, (255, 255, 255), playOButton)
@@ -88,7 +115,7 @@ while True:
         else:
             title = f"Computer thinking..."
         
-        title = largeFont.render(title, True, (255, 255, 255))
+        title = render(largeFont, title, (255, 255, 255))
         titleRect = title.get_rect()
         titleRect.center = ((width / 2), 30)
         screen.blit(title, titleRect)
@@ -129,7 +156,7 @@ while True:
                 pygame.draw.rect(screen, (255, 255, 255), rect, 3)
 
                 if board[i][j] != ttt.EMPTY:
-                    move = moveFont.render(board[i][j], True, (255, 255, 255))
+                    move = render(moveFont, board[i][j], (255, 255, 255))
                     moveRect = move.get_rect()
                     moveRect.center = rect.center
                     screen.blit(move, moveRect)
@@ -137,7 +164,7 @@ while True:
         # Reset buttom
         if game_over:
             playAgainButton = pygame.Rect(width / 3, height - 65, width / 3, 50)
-            playAgain = mediumFont.render("Play Again", True, (0, 0, 0))
+            playAgain = render(mediumFont, "Play Again", (0, 0, 0))
             playAgainRect = playAgain.get_rect()
             playAgainRect.center = playAgainButton.center
             pygame.draw.rect(screen, (255, 255, 255), playAgainButton)
@@ -153,3 +180,5 @@ while True:
                     ai_turn = False
 
     pygame.display.flip()
+    last_frame = frame
+    clock.tick(FPS)
@@ -0,0 +1,17 @@
+"""
+Search Statistics
+
+Pass a SearchStats object to tictactoe.minimax(board, stats=...) to see how
+much work the search did. With stats=None (the default) each node only pays
+for one 'is not None' check.
+
+Depth is counted from the root (root = 0). A "beta cutoff" happens in
+max_value (v >= beta) and an "alpha cutoff" in min_value (v <= alpha).
+
+The class is q3/search_stats.py's: both searches count the same things, so
+their numbers can be compared directly (see q3/benchmark_suite.py).
+"""
+
+from q3_shared import search_stats
+
+SearchStats = search_stats.SearchStats
@@ -1,4 +1,4 @@
-from tictactoe import initial_state, player, actions, result, winner, terminal, utility, minimax, X, O, EMPTY
+from tictactoe import initial_state, player, actions, result, winner, terminal, utility, minimax, minimax_many, X, O, EMPTY
 
 def test_game():
     print("Testing implementation...")
@@ -59,5 +59,253 @@ def test_game():
 
     print("\nALL CONSTRAINED TESTS PASSED.")
 
+def test_bitboard():
+    import bitboard as bb
+
+    print("Testing bitboard engine...")
+
+    # 1. Converters round trip
+    board = [[X, O, EMPTY], [EMPTY, X, EMPTY], [O, EMPTY, EMPTY]]
+    assert bb.to_board(bb.from_board(board)) == board
+    assert bb.from_board(initial_state()) == bb.initial_state()
+    print("PASS: Converters")
+
+    # 2. Same answers as the list-of-lists engine
+    assert bb.player(bb.from_board(board)) == player(board)
+    assert bb.actions(bb.from_board(board)) == actions(board)
+    assert bb.to_board(bb.result(bb.from_board(board), (2, 2))) == result(board, (2, 2))
+    print("PASS: Matches tictactoe.py")
+
+    # 3. Win detection and minimax
+    board = [[X, X, EMPTY],
+             [O, O, EMPTY],
+             [EMPTY, EMPTY, EMPTY]]
+    state = bb.from_board(board)
+    assert bb.minimax(state) == (0, 2), "X should pick (0, 2) to win"
+    state = bb.result(state, (0, 2))
+    assert bb.winner(state) == X
+    assert bb.terminal(state)
+    assert bb.utility(state) == 1
+    print("PASS: Bitboard Minimax Found Win")
+
+    # 4. Occupied cells are rejected
+    raised = False
+    try:
+        bb.result(state, (0, 0))
+    except Exception:
+        raised = True
+    assert raised, "Occupied cell should raise"
+    print("PASS: Invalid Action")
+
+def test_symmetry():
+    import bitboard as bb
+
+    print("Testing symmetry reduction...")
+    state = bb.from_board([[X, EMPTY, EMPTY], [EMPTY, O, EMPTY], [EMPTY, EMPTY, EMPTY]])
+    key, _ = bb.canonical(state)
+    assert all(bb.canonical(bb.transform(state, t))[0] == key for t in range(8))
+    assert bb.unique_actions(bb.initial_state()) == [(0, 0), (0, 1), (1, 1)]
+    # X corner + O center: only the main-diagonal mirror is left
+    assert len(bb.unique_actions(state)) == 4
+    print("PASS: Symmetry")
+
+def test_search_stats():
+    from stats import SearchStats
+
+    print("Testing search statistics...")
+    seen = []
+    stats = SearchStats(on_search=lambda s: seen.append(s.calls[-1]))
+    board = [[X, X, EMPTY],
+             [O, O, EMPTY],
+             [EMPTY, EMPTY, EMPTY]]
+    assert minimax(board, stats, use_book=False) == (0, 2)
+    assert len(stats.calls) == 1 and seen == stats.calls
+    assert stats.calls[0][0] == stats.nodes
+    assert 0 < stats.leaves < stats.nodes
+    assert stats.max_depth <= 5  # only 5 empty cells left
+    assert stats.total_cutoffs() > 0
+    print("PASS: Search Stats")
+
+def test_root_modes():
+    from stats import SearchStats
+    from tictactoe import ROOT_MODES, min_value
+    import math
+
+    print("Testing root search modes...")
+    # Empty board, and X corner / O edge (X to move, X can force a win)
+    positions = [initial_state(),
+                 [[X, O, EMPTY], [EMPTY, EMPTY, EMPTY], [EMPTY, EMPTY, EMPTY]]]
+    for board in positions:
+        best_value = min_value(result(board, minimax(board, root="independent", use_book=False)),
+                               -math.inf, math.inf)
+        nodes = {}
+        for mode in ROOT_MODES:
+            stats = SearchStats()
+            move = minimax(board, stats, root=mode, use_book=False)
+            # Every mode must still pick a move with the optimal value
+            assert min_value(result(board, move), -math.inf, math.inf) == best_value, mode
+            nodes[mode] = stats.nodes
+        print(f"Nodes: {nodes}")
+        # Against the old root ("independent": all moves, fresh windows) every
+        # mode searches fewer nodes
+        for mode in ("alphabeta", "pvs", "aspiration"):
+            assert nodes[mode] < nodes["independent"], mode
+    print("PASS: Root Modes")
+
+def test_move_ordering():
+    from stats import SearchStats
+    from ordering import StaticOrdering, TacticalOrdering, KillerOrdering
+
+    print("Testing move ordering...")
+    board = [[X, X, EMPTY],
+             [O, O, EMPTY],
+             [EMPTY, EMPTY, EMPTY]]
+    # Win first, then block, then center / corners / edges
+    assert TacticalOrdering().order(board, actions(board), X, 0) == [(0, 2), (1, 2), (2, 0), (2, 2), (2, 1)]
+    assert StaticOrdering().order(initial_state(), actions(initial_state()), X, 0)[0] == (1, 1)
+
+    class CellOrder(StaticOrdering):
+        def order(self, board, actions, player, depth):
+            return sorted(actions)
+
+    # Ordered search visits fewer nodes than plain cell order
+    nodes = {}
+    for name, ordering in [("cell order", CellOrder()), ("killer", KillerOrdering())]:
+        stats = SearchStats()
+        minimax(initial_state(), stats, use_book=False, ordering=ordering)
+        nodes[name] = stats.nodes
+    print(f"Nodes: {nodes}")
+    assert nodes["killer"] < nodes["cell order"]
+    print("PASS: Move Ordering")
+
+def test_opening_book(tmp_path):
+    import os
+    import opening_book
+
+    print("Testing opening book...")
+    path = os.path.join(str(tmp_path), "book.bin")
+    table = opening_book.build(path)
+    assert sum(1 for byte in table if byte != opening_book.NO_ENTRY) == 4520
+
+    book = opening_book.load(path)
+    # Perfect play from the empty board is a draw
+    assert book.probe(initial_state())[0] == 0
+    board = [[X, X, EMPTY],
+             [O, O, EMPTY],
+             [EMPTY, EMPTY, EMPTY]]
+    assert book.probe(board) == (1, (0, 2))
+    # Terminal boards have no entry
+    assert book.probe(result(board, (0, 2))) is None
+    # X wins at once on 8; 2 also wins, but later. The book takes the fastest win
+    board = [[X, O, EMPTY],
+             [EMPTY, X, O],
+             [EMPTY, EMPTY, EMPTY]]
+    assert book.probe(board) == (1, (2, 2))
+    book.close()
+    print("PASS: Opening Book")
+
+def test_minimax_many():
+    print("Testing minimax_many...")
+    win = [[X, X, EMPTY],
+           [O, O, EMPTY],
+           [EMPTY, EMPTY, EMPTY]]
+    over = result(win, (0, 2))
+    boards = [initial_state(), win, over, win]
+    table = {}
+    moves, values = minimax_many(boards, table)
+    assert values == [0, 1, 1, 1]
+    assert moves[1] == moves[3] == (0, 2) and moves[2] is None
+    # Every action is optimal: same value as a full search of the result
+    assert minimax_many([result(initial_state(), moves[0])])[1] == [0]
+    solved = len(table)
+    minimax_many(boards, table)
+    assert len(table) == solved, "second batch is answered from the shared table"
+    print("PASS: minimax_many")
+
+def test_minimax_many_arrays():
+    import pytest
+    np = pytest.importorskip("numpy")
+
+    print("Testing minimax_many with arrays...")
+    win = [[X, X, EMPTY],
+           [O, O, EMPTY],
+           [EMPTY, EMPTY, EMPTY]]
+    boards = [initial_state(), win, result(win, (0, 2)), win]
+    moves, values = minimax_many(boards)
+    encoded = np.array([[{EMPTY: 0, X: 1, O: 2}[cell] for row in board for cell in row] for board in boards],
+                       dtype=np.int8)
+    assert minimax_many(encoded) == (moves, values)
+    assert minimax_many(encoded.reshape(-1, 3, 3)) == (moves, values)
+    # Both paths use the same winner rule, also on the impossible boards
+    # where both players have a line
+    import vectorized
+    cells = vectorized.all_encodings()
+    decode = {0: EMPTY, 1: X, 2: O}
+    boards = [[[decode[row[3 * i + j]] for j in range(3)] for i in range(3)] for row in cells.tolist()]
+    assert minimax_many(cells) == minimax_many(boards)
+    print("PASS: minimax_many (arrays)")
+
+def test_vectorized():
+    import pytest
+    pytest.importorskip("numpy")
+    import bitboard
+    import vectorized
+
+    print("Testing vectorized winner / terminal / utility...")
+    # Same answers as the scalar functions for all 3^9 cell assignments
+    cells = vectorized.all_encodings()
+    winners = vectorized.winners(cells)
+    terminals = vectorized.terminals(cells)
+    utilities = vectorized.utilities(cells)
+    decode = {0: EMPTY, 1: X, 2: O}
+    for k, row in enumerate(cells.tolist()):
+        board = [[decode[row[3 * i + j]] for j in range(3)] for i in range(3)]
+        assert decode[int(winners[k])] == winner(board)
+        assert bool(terminals[k]) == terminal(board)
+        assert int(utilities[k]) == bitboard.utility(bitboard.from_board(board))
+    # (N, 3, 3) input gives the same result
+    assert (vectorized.winners(cells.reshape(-1, 3, 3)) == winners).all()
+    print("PASS: Vectorized")
+
+def test_retrograde():
+    import bitboard
+    from retrograde import RetrogradeTable
+
+    print("Testing retrograde solver...")
+    table = RetrogradeTable()
+    assert len(table) == 5478
+    assert table.probe(initial_state()) == (0, 9, (0, 0))
+    # Same values as the recursive solver
+    solved = {}
+    for position, (value, _, _) in table.table.items():
+        assert bitboard.solve(position, solved)[0] == value
+
+    # X wins now on (0, 2), or later via the fork on (1, 1): the fastest win is chosen
+    board = [[X, X, EMPTY],
+             [O, EMPTY, O],
+             [EMPTY, EMPTY, EMPTY]]
+    assert table.probe(board) == (1, 1, (0, 2))
+    # The same position from a q3 board
+    assert table.probe_squares(['X', 'X', ' ', 'O', ' ', 'O', ' ', ' ', ' ']) == (1, 1, 2)
+    print("PASS: Retrograde")
+
 if __name__ == "__main__":
+    import tempfile
+
     test_game()
+    test_bitboard()
+    test_symmetry()
+    test_search_stats()
+    test_root_modes()
+    test_move_ordering()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_opening_book(tmp)
+    test_minimax_many()
+    # Tests that need numpy are skipped through pytest
+    import pytest
+    for test in (test_minimax_many_arrays, test_vectorized):
+        try:
+            test()
+        except pytest.skip.Exception as skip:
+            print(f"SKIP: {test.__name__} ({skip})")
+    test_retrograde()
@@ -3,12 +3,18 @@ Tic Tac Toe Player
 """
 
 import math
-import copy
+
+import bitboard
+import opening_book
+from ordering import KillerOrdering
 
 X = "X"
 O = "O"
 EMPTY = None
 
+# Perfect-play table, loaded once at startup (None until `python opening_book.py` is run)
+BOOK = opening_book.load()
+
 def initial_state():
     """
     Returns starting state of the board.
@@ -54,15 +60,13 @@ def result(board, action):
     """
     Returns the board that results from making move (i, j) on the board.
     """
-    if action not in actions(board):
+    i, j = action
+    if not (0 <= i < 3 and 0 <= j < 3) or board[i][j] != EMPTY:
         raise Exception("Invalid Action")
     
-    # Create deep copy
-    new_board = copy.deepcopy(board)
-    current_player = player(board)
-    
-    i, j = action
-    new_board[i][j] = current_player
+    # Copy the rows (cells are immutable strings, so no deepcopy needed)
+    new_board = [list(row) for row in board]
+    new_board[i][j] = player(board)
     
     return new_board
 
@@ -119,80 +123,293 @@ def utility(board):
         return 0
 
 
-def minimax(board):
+# How minimax() searches the root moves:
+#   "independent" - the old behavior: all of actions(board) in sorted order
+#                   (no symmetry reduction, no ordering), each with a fresh
+#                   (-inf, +inf) window, so the root learns nothing from
+#                   earlier siblings
+#   "alphabeta"   - alpha / beta are carried across the root moves
+#   "pvs"         - principal variation search: first move with the full
+#                   window, the rest with a null window, re-searching only
+#                   the moves that turn out to be better
+#   "aspiration"  - searches with a narrow window around the expected value
+#                   (a draw), widening it only if the value falls outside
+ROOT_MODES = ("independent", "alphabeta", "pvs", "aspiration")
+
+
+def minimax(board, stats=None, root="alphabeta", use_book=True, ordering=None):
     """
     Returns the optimal action for the current player on the board.
+    Pass a stats.SearchStats object to record how much work the search did.
+    ordering is a move ordering from ordering.py (default: a fresh
+    KillerOrdering for every call, so the chosen move is deterministic).
     """
+    if root not in ROOT_MODES:
+        raise ValueError(f"Unknown root mode: {root}")
+
     if terminal(board):
         return None
     
-    current_player = player(board)
+    # O(1) answer from the opening book when it has been built
+    if use_book and BOOK is not None:
+        found = BOOK.probe(board)
+        if found is not None:
+            return found[1]
+    
+    if stats is not None:
+        stats.start()
+        stats.visit(0)
+    
+    if ordering is None:
+        ordering = KillerOrdering()
+    
+    if root == "independent":
+        # The old root: every action in sorted order
+        root_actions = sorted(actions(board))
+    else:
+        # Only one of each group of mirror-image moves needs searching
+        # (9 root moves -> 3 on the empty board)
+        root_actions = bitboard.unique_actions(bitboard.from_board(board))
+        root_actions = ordering.order(board, root_actions, player(board), 0)
+    
+    if root == "independent":
+        best_action = _root_independent(board, root_actions, stats, ordering)
+    elif root == "pvs":
+        best_action = _root_pvs(board, root_actions, stats, ordering)
+    elif root == "aspiration":
+        best_action = _root_aspiration(board, root_actions, stats, ordering)
+    else:
+        _, best_action = _root_search(board, root_actions, -math.inf, math.inf, stats, ordering)
     
-    if current_player == X:
+    if stats is not None:
+        stats.finish()
+    return best_action
+
+
+def minimax_many(boards, table=None):
+    """
+    Returns (actions, values) for a batch of boards: the optimal action
+    (None when the game is over) and the minimax value (as utility()) of
+    every board, in input order.
+    boards is a list of boards, or a NumPy array of encoded boards with
+    shape (N, 9) or (N, 3, 3) and cells 0 = EMPTY, 1 = X, 2 = O.
+    Duplicate boards are solved once, and the whole batch shares one solved
+    table (pass the same dict as table=... to share it between batches too).
+    When several actions are equally good the one returned may differ from
+    minimax(), but it is always optimal.
+    """
+    if table is None:
+        table = {}
+    if hasattr(boards, "ndim"):
+        return _minimax_encoded(boards, table)
+
+    answers = {}  # bitboard -> (action, value)
+    actions_out = []
+    values_out = []
+    for board in boards:
+        key = bitboard.from_board(board)
+        if key not in answers:
+            value, n = bitboard.solve(key, table)
+            answers[key] = (None if n is None else (n // 3, n % 3), value)
+        action, value = answers[key]
+        actions_out.append(action)
+        values_out.append(value)
+    return actions_out, values_out
+
+
+def _minimax_encoded(cells, table):
+    """
+    minimax_many() for a NumPy array of encoded boards: encoding, duplicate
+    removal and the value / terminal checks (vectorized.py) run on the whole
+    array, so only unique unfinished boards reach the Python solver.
+    """
+    import numpy as np
+    import vectorized
+
+    cells = vectorized.as_cells(cells)
+    weights = 1 << np.arange(9)
+    codes = ((cells == vectorized.X_CODE) @ weights) << 9 | ((cells == vectorized.O_CODE) @ weights)
+    codes, first, inverse = np.unique(codes, return_index=True, return_inverse=True)
+    unique = cells[first]
+    # utilities(), not winners(): the same rule as bitboard.utility() on the
+    # list path when both players have a line
+    values = vectorized.utilities(unique)
+    over = vectorized.terminals(unique)
+
+    answers = []
+    for code, value, is_over in zip(codes.tolist(), values.tolist(), over.tolist()):
+        if is_over:
+            answers.append((None, value))
+        else:
+            value, n = bitboard.solve((code >> 9, code & bitboard.FULL), table)
+            answers.append(((n // 3, n % 3), value))
+    inverse = inverse.reshape(-1).tolist()
+    return [answers[i][0] for i in inverse], [answers[i][1] for i in inverse]
+
+
+def _root_search(board, root_actions, alpha, beta, stats, ordering):
+    """
+    Searches the root moves inside (alpha, beta), carrying the bound learned
+    from earlier moves to later ones. Returns (value, best action).
+    """
+    best_action = None
+    if player(board) == X:
         # X is Maximizing player
         v = -math.inf
-        # "choose the action with highest max value"
-        # We need to find the action associated with the max value, not just the value.
-        best_action = None
-        for action in actions(board):
-            # v = max(v, min_value(result(board, action))) -- this is just value
-            # We need to track the action
-            val = min_value(result(board, action), -math.inf, math.inf)
+        for action in root_actions:
+            val = min_value(result(board, action), alpha, beta, stats, 1, ordering)
             if val > v:
                 v = val
                 best_action = action
-        return best_action
-
+            alpha = max(alpha, v)
+            if v >= beta:
+                break
     else:
         # O is Minimizing player
         v = math.inf
-        best_action = None
-        for action in actions(board):
-            val = max_value(result(board, action), -math.inf, math.inf)
+        for action in root_actions:
+            val = max_value(result(board, action), alpha, beta, stats, 1, ordering)
+            if val < v:
+                v = val
+                best_action = action
+            beta = min(beta, v)
+            if v <= alpha:
+                break
+    return v, best_action
+
+
+def _root_independent(board, root_actions, stats, ordering):
+    # Full window for every root move: no pruning at the root at all
+    best_action = None
+    if player(board) == X:
+        v = -math.inf
+        for action in root_actions:
+            val = min_value(result(board, action), -math.inf, math.inf, stats, 1, ordering)
+            if val > v:
+                v = val
+                best_action = action
+    else:
+        v = math.inf
+        for action in root_actions:
+            val = max_value(result(board, action), -math.inf, math.inf, stats, 1, ordering)
             if val < v:
                 v = val
                 best_action = action
-        return best_action
+    return best_action
+
+
+def _root_pvs(board, root_actions, stats, ordering):
+    # Utilities are integers, so (bound, bound + 1) is a null window: it
+    # only answers "is this move better than the best so far?"
+    best_action = None
+    if player(board) == X:
+        v = -math.inf
+        for action in root_actions:
+            child = result(board, action)
+            if best_action is None:
+                val = min_value(child, -math.inf, math.inf, stats, 1, ordering)
+            else:
+                val = min_value(child, v, v + 1, stats, 1, ordering)
+                if val > v:
+                    # Better than the best so far: re-search for the exact value
+                    val = min_value(child, v, math.inf, stats, 1, ordering)
+            if best_action is None or val > v:
+                v = val
+                best_action = action
+    else:
+        v = math.inf
+        for action in root_actions:
+            child = result(board, action)
+            if best_action is None:
+                val = max_value(child, -math.inf, math.inf, stats, 1, ordering)
+            else:
+                val = max_value(child, v - 1, v, stats, 1, ordering)
+                if val < v:
+                    val = max_value(child, -math.inf, v, stats, 1, ordering)
+            if best_action is None or val < v:
+                v = val
+                best_action = action
+    return best_action
+
+
+def _root_aspiration(board, root_actions, stats, ordering, guess=0, delta=1):
+    # Perfect play is a draw, so start with a window around 0
+    alpha, beta = guess - delta, guess + delta
+    v, best_action = _root_search(board, root_actions, alpha, beta, stats, ordering)
+    if v <= alpha:
+        # Fail low: the true value is at most v, search below the window
+        v, best_action = _root_search(board, root_actions, -math.inf, v + 1, stats, ordering)
+    elif v >= beta:
+        # Fail high: the true value is at least v, search above the window
+        v, best_action = _root_search(board, root_actions, v - 1, math.inf, stats, ordering)
+    return best_action
+
 
+def _ordered_actions(board, current_player, depth, ordering):
+    # actions() is a set; sort it so the search order never depends on hashing
+    if ordering is None:
+        return sorted(actions(board))
+    return ordering.order(board, actions(board), current_player, depth)
 
-def max_value(board, alpha, beta):
+
+def max_value(board, alpha, beta, stats=None, depth=0, ordering=None):
     """
     Returns the max value for X (Maximizer), using Alpha-Beta Pruning.
     """
+    if stats is not None:
+        stats.visit(depth)
+    
     if terminal(board):
+        if stats is not None:
+            stats.leaf()
         return utility(board)
     
     v = -math.inf
-    for action in actions(board):
+    moves = _ordered_actions(board, X, depth, ordering)
+    for action in moves:
         # Recursive call to min_value
-        v = max(v, min_value(result(board, action), alpha, beta))
+        v = max(v, min_value(result(board, action), alpha, beta, stats, depth + 1, ordering))
         
         # Alpha update
         alpha = max(alpha, v)
         
         # Beta Cutoff
         if v >= beta:
+            if stats is not None:
+                stats.beta_cutoff(depth)
+            if ordering is not None:
+                ordering.cutoff(action, X, depth, len(moves))
             return v
             
     return v
 
 
-def min_value(board, alpha, beta):
+def min_value(board, alpha, beta, stats=None, depth=0, ordering=None):
     """
     Returns the min value for O (Minimizer), using Alpha-Beta Pruning.
     """
+    if stats is not None:
+        stats.visit(depth)
+    
     if terminal(board):
+        if stats is not None:
+            stats.leaf()
         return utility(board)
     
     v = math.inf
-    for action in actions(board):
-        v = min(v, max_value(result(board, action), alpha, beta))
+    moves = _ordered_actions(board, O, depth, ordering)
+    for action in moves:
+        v = min(v, max_value(result(board, action), alpha, beta, stats, depth + 1, ordering))
         
         # Beta update
         beta = min(beta, v)
         
         # Alpha Cutoff
         if v <= alpha:
+            if stats is not None:
+                stats.alpha_cutoff(depth)
+            if ordering is not None:
+                ordering.cutoff(action, O, depth, len(moves))
             return v
             
     return v